@@ -91,7 +91,8 @@ class TabNetDataProcess:
 
             net_dir = workspace.directory + self.config.pattern
 
-            net_db = vector_loader.load_nets(net_dir)
+            # stream nets, only net features are needed
+            net_db = vector_loader.iter_nets(net_dir, fields={"feature"})
 
             # Collect all data from single directory
             net_list = []
@@ -6,10 +6,48 @@
 @Desc : abstract base class for analyzers
 """
 
+import inspect
+import multiprocessing
+import warnings
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Any, Optional
 
+from ..data import DataVectors
+from ..data.io import MANIFEST_DIRS
 from ..workspace import Workspace
+from .cache import AnalyzerCache, workspace_fingerprint
+
+# worker number of DataVectors in the extraction process, None uses DataVectors default
+_vectors_workers = None
+
+
+def _init_extract_worker(vectors_workers: int):
+    global _vectors_workers
+    _vectors_workers = vectors_workers
+
+
+def _extract_workspace(extract: Callable, workspace: Workspace, args: tuple):
+    """extraction task of BaseAnalyzer.map_workspaces, the workspace is pickled to the
+    worker process with its paths table and configs, in-memory changes are kept."""
+    return extract(workspace, *args)
+
+
+def create_data_vectors(workspace: Workspace) -> DataVectors:
+    """
+    Create the DataVectors used by extraction functions.
+
+    Inside the extraction processes of BaseAnalyzer.map_workspaces, the cpu cores are
+    shared by the designs, so the vectors files are parsed by fewer workers, or
+    serially if there are more designs than cores.
+    """
+    if _vectors_workers is None:
+        return DataVectors(workspace)
+
+    if _vectors_workers <= 1:
+        return DataVectors(workspace, parallel_mode="serial")
+
+    return DataVectors(workspace, max_workers=_vectors_workers)
 
 
 class BaseAnalyzer(ABC):
@@ -21,14 +59,165 @@ class BaseAnalyzer(ABC):
     different analysis processes.
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: Optional[int] = None, use_cache: bool = True):
         """
         Initialize the base analyzer.
 
         Subclasses should call super().__init__() and initialize their own
         data structures for storing analysis results and tracking missing files.
+
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel,
+                default is cpu count, 1 extracts workspaces serially
+            use_cache: Cache extraction results of each workspace in its analysis
+                directory, reused while the inputs of the extraction are unchanged
         """
         self.dir_to_display_name = {}
+        self.max_workers = max_workers
+        self.use_cache = use_cache
+
+    def cache_params(self) -> Dict[str, Any]:
+        """
+        Analyzer parameters of the cache key, i.e. the constructor arguments of the
+        analyzer class stored as attributes of the same name, except max_workers and
+        use_cache which do not change the results.
+        """
+        params = {}
+        for name in inspect.signature(type(self).__init__).parameters:
+            if name not in ("self", "max_workers", "use_cache") and hasattr(self, name):
+                params[name] = getattr(self, name)
+        return params
+
+    def deprecate_pattern(self, pattern: Optional[str]) -> None:
+        """
+        Warn that the pattern argument of load is ignored, extraction reads the
+        vectors directories of the workspace paths table.
+        """
+        if pattern is not None:
+            warnings.warn(
+                "{}.load: pattern is deprecated and ignored, the vectors directories "
+                "of the workspace paths table are read".format(type(self).__name__),
+                DeprecationWarning,
+                stacklevel=3,
+            )
+
+    def clear_cache(self, workspaces: List[Workspace]) -> None:
+        """Remove cached extraction results of this analyzer class in workspaces."""
+        for workspace in workspaces:
+            AnalyzerCache(workspace).clear(type(self).__name__)
+
+    def map_workspaces(
+        self, workspaces: List[Workspace], extract: Callable, *args
+    ) -> List[Any]:
+        """
+        Run extract(workspace, *args) for each workspace in a process pool.
+
+        Each workspace is extracted by one task, extract should return a compact chunk,
+        e.g. a DataFrame or arrays of the design, which is sent back to the main
+        process. extract must be picklable, e.g. a module level function, and should
+        create DataVectors by create_data_vectors.
+
+        Args:
+            workspaces: List of workspace to extract
+            extract: Extraction function of a single workspace
+            args: Extra arguments of extract
+
+        If use_cache is set, chunks are cached in the analysis directory of each
+        workspace, keyed by analyzer class, cache_params, extract and args, only
+        workspaces whose inputs changed since the cached extraction are extracted.
+        The inputs of extract are declared by the cache_inputs decorator, default are
+        the vectors nets, patchs and wire_paths directories.
+
+        Returns:
+            List of chunks in the order of workspaces, whatever the order the tasks
+            finish in, None for workspaces whose extraction failed
+        """
+        if not self.use_cache:
+            return self._extract_workspaces(workspaces, extract, *args)
+
+        analyzer = type(self).__name__
+        key = "{}.{}|{!r}|{!r}".format(
+            extract.__module__,
+            extract.__qualname__,
+            args,
+            sorted(self.cache_params().items()),
+        )
+
+        inputs = getattr(extract, "cache_inputs", tuple(MANIFEST_DIRS))
+
+        results = [None] * len(workspaces)
+        fingerprints = [None] * len(workspaces)
+        missed = []
+        for index, workspace in enumerate(workspaces):
+            fingerprints[index] = workspace_fingerprint(workspace, inputs, args)
+            hit, result = AnalyzerCache(workspace).load(
+                analyzer, key, fingerprints[index]
+            )
+            if hit:
+                results[index] = result
+            else:
+                missed.append(index)
+
+        extracted = self._extract_workspaces(
+            [workspaces[index] for index in missed], extract, *args
+        )
+        for index, result in zip(missed, extracted):
+            results[index] = result
+            # do not cache failed extraction
+            if result is None:
+                continue
+            # inputs changed during extraction invalidate the entry on the next load
+            AnalyzerCache(workspaces[index]).save(
+                analyzer, key, fingerprints[index], result
+            )
+
+        return results
+
+    def _extract_workspaces(
+        self, workspaces: List[Workspace], extract: Callable, *args
+    ) -> List[Any]:
+        max_workers = self.max_workers or multiprocessing.cpu_count()
+        max_workers = min(max_workers, len(workspaces))
+
+        if max_workers <= 1:
+            return [
+                self._extract_result(
+                    workspace, extract, lambda: extract(workspace, *args)
+                )
+                for workspace in workspaces
+            ]
+
+        vectors_workers = max(1, multiprocessing.cpu_count() // max_workers)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_extract_worker,
+            initargs=(vectors_workers,),
+        ) as executor:
+            futures = [
+                executor.submit(_extract_workspace, extract, workspace, args)
+                for workspace in workspaces
+            ]
+            # a failed workspace does not drop the results of the others
+            return [
+                self._extract_result(workspace, extract, future.result)
+                for workspace, future in zip(workspaces, futures)
+            ]
+
+    def _extract_result(
+        self, workspace: Workspace, extract: Callable, result: Callable
+    ) -> Any:
+        """return result(), None and log the error if the extraction failed."""
+        try:
+            return result()
+        except Exception as e:
+            workspace.logger.error(
+                "%s: %s failed for workspace %s : %s",
+                type(self).__name__,
+                extract.__qualname__,
+                workspace.directory,
+                e,
+            )
+            return None
 
     @abstractmethod
     def load(
@@ -47,7 +236,8 @@ class BaseAnalyzer(ABC):
         Args:
             workspace_dirs: List of base directories to process
             dir_to_display_name: Optional mapping from directory name to display name
-            pattern: File pattern to search for
+            pattern: File pattern to search for, deprecated for analyzers whose
+                extraction reads the vectors directories of the workspace paths table
 
         Returns:
             Dictionary mapping design names to loaded data, or None if no specific
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : cache.py
+@Author : yhqiu
+@Desc : on-disk cache of analyzer extraction results, keyed by input fingerprint
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+from typing import Callable
+
+from ..data.io import VectorsManifest, MANIFEST_DIRS, scan_json_files
+from ..workspace import Workspace
+
+# bump the version when extraction results change, old caches are ignored
+CACHE_VERSION = 1
+
+
+def cache_inputs(*inputs):
+    """
+    Declare the workspace inputs read by an extraction function, its cached results
+    are valid while these inputs are unchanged.
+
+    An input is a key of workspace.paths_table.ieda_vectors, e.g. "nets" or "tech",
+    or a function (workspace, *args) returning a path or a list of paths, args are
+    the extraction arguments.
+    """
+
+    def decorator(extract: Callable):
+        extract.cache_inputs = inputs
+        return extract
+
+    return decorator
+
+
+def workspace_fingerprint(
+    workspace: Workspace, inputs: tuple = tuple(MANIFEST_DIRS), args: tuple = ()
+) -> str:
+    """
+    Fingerprint of the inputs of an extraction, i.e. relative path, size and mtime of
+    the input files, json files of input directories.
+
+    The file lists of the vectors nets, patchs and wire_paths directories are taken
+    from the vectors manifest if it is valid, otherwise the directories are scanned.
+    """
+    vectors_paths = workspace.paths_table.ieda_vectors
+    manifest = VectorsManifest(
+        workspace.get_vectors_path(),
+        manifest_path=vectors_paths["manifest"],
+        logger=workspace.logger,
+    )
+    if not manifest.read():
+        manifest = None
+
+    paths = []
+    for name in inputs:
+        if callable(name):
+            input_paths = name(workspace, *args)
+            paths.extend([input_paths] if isinstance(input_paths, str) else input_paths)
+        else:
+            paths.append(vectors_paths[name])
+
+    digest = hashlib.sha1()
+    for path in paths:
+        dir_name = None if manifest is None else manifest.find_dir(path)
+        if dir_name is not None and manifest.is_valid(dir_name, check_files=True):
+            # is_valid has checked size and mtime of the recorded files
+            stats = [item[:3] for item in manifest.dirs[dir_name]["files"]]
+        else:
+            filepaths = scan_json_files(path) if os.path.isdir(path) else [path]
+            stats = []
+            for filepath in filepaths:
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                stats.append([filepath, stat.st_size, stat.st_mtime_ns])
+
+        digest.update(
+            "{}\n".format(os.path.relpath(path, workspace.directory)).encode("utf-8")
+        )
+        for filepath, size, mtime in stats:
+            digest.update(
+                "{}|{}|{}\n".format(
+                    os.path.relpath(filepath, workspace.directory), size, mtime
+                ).encode("utf-8")
+            )
+    return digest.hexdigest()
+
+
+class AnalyzerCache:
+    """store extraction results of a workspace as pickle files in the analysis directory.
+
+    entries are keyed by analyzer class, analyzer parameters, extraction function and
+    its arguments, an entry is valid while the fingerprint of the workspace outputs
+    is unchanged.
+    """
+
+    def __init__(self, workspace: Workspace):
+        self.workspace = workspace
+        self.cache_dir = "{}/cache".format(workspace.paths_table.analysis_dir)
+
+    def cache_path(self, analyzer: str, key: str):
+        digest = hashlib.sha1(
+            "{}|{}|{}".format(CACHE_VERSION, analyzer, key).encode("utf-8")
+        ).hexdigest()
+        return "{}/{}/{}.pkl".format(self.cache_dir, analyzer, digest)
+
+    def load(self, analyzer: str, key: str, fingerprint: str):
+        """return (True, result) if cache hit, else (False, None)."""
+        cache_path = self.cache_path(analyzer, key)
+        if not os.path.isfile(cache_path):
+            return False, None
+
+        try:
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+
+            if entry["fingerprint"] != fingerprint:
+                return False, None
+
+            return True, entry["result"]
+        except Exception as e:
+            self.workspace.logger.warning("invalid analyzer cache %s : %s", cache_path, e)
+            return False, None
+
+    def save(self, analyzer: str, key: str, fingerprint: str, result):
+        cache_path = self.cache_path(analyzer, key)
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # write to a temporary file first, other processes may save the same entry
+            tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {"fingerprint": fingerprint, "result": result},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception as e:
+            self.workspace.logger.warning(
+                "save analyzer cache %s failed : %s", cache_path, e
+            )
+            return False
+
+    def clear(self, analyzer: str = None):
+        """clear entries of an analyzer class, or all entries of the workspace."""
+        cache_dir = self.cache_dir if analyzer is None else "{}/{}".format(
+            self.cache_dir, analyzer
+        )
+        if os.path.isdir(cache_dir):
+            shutil.rmtree(cache_dir)
+            self.workspace.logger.info("clear analyzer cache %s", cache_dir)
@@ -7,10 +7,8 @@
 """
 
 import glob
-import multiprocessing
 import os
 import re
-from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from typing import Dict, List, Optional, Tuple
 
@@ -20,10 +18,12 @@ import pandas as pd
 import seaborn as sns
 
 from ..data import DataFeature
-from ..data import DataVectors
+from ..data.database.vectors import INT_NONE
+from ..data.io import MANIFEST_DIRS, VectorsColumnar, VectorsManifest
 from ..flows import DbFlow
 from ..workspace import Workspace
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, create_data_vectors
+from .cache import cache_inputs
 from .utility import save_fig
 
 
@@ -699,11 +699,27 @@ class PinDistributionAnalyzer(BaseAnalyzer):
             return -1
 
 
+def _result_statis_inputs(workspace: Workspace, pattern: str) -> list:
+    """vectors directories read by _extract_result_statis."""
+    return [
+        os.path.join(workspace.directory + pattern, dir_name)
+        for dir_name in MANIFEST_DIRS
+    ]
+
+
+@cache_inputs(_result_statis_inputs)
+def _extract_result_statis(workspace: Workspace, pattern: str) -> dict:
+    """extract file statistics of the vectors directory of a workspace."""
+    return ResultStatisAnalyzer()._process_design(
+        workspace, workspace.directory + pattern
+    )
+
+
 class ResultStatisAnalyzer(BaseAnalyzer):
     """Analyzer for result statistics including file counts, sizes, and wire numbers."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, max_workers: Optional[int] = None, use_cache: bool = True):
+        super().__init__(max_workers, use_cache)
         self.stats_data = {}
         self.total_stats = {
             "nets_count": 0,
@@ -735,25 +751,12 @@ class ResultStatisAnalyzer(BaseAnalyzer):
 
         self.workspaces = workspaces
 
-        # Build complete design path list with corresponding workspaces
-        workspace_path_params = []
+        # Establish mapping from path to design name
         design_name_mapping = {}
-
         for workspace in workspaces:
-            # Build complete path
-            full_path = workspace.directory + pattern
-            workspace_path_params.append((workspace, full_path))
-
-            # Extract design name from workspace
-            design_name = workspace.design
+            design_name_mapping[workspace.directory + pattern] = workspace.design
 
-            # Establish mapping from path to design name
-            design_name_mapping[full_path] = design_name
-
-        with ProcessPoolExecutor(
-            max_workers=min(len(workspace_path_params), multiprocessing.cpu_count())
-        ) as executor:
-            results = list(executor.map(self._process_workspace_path_pair, workspace_path_params))
+        results = self.map_workspaces(workspaces, _extract_result_statis, pattern)
 
         # Process results
         for result in results:
@@ -1084,33 +1087,39 @@ class ResultStatisAnalyzer(BaseAnalyzer):
 
         # Initialize results dictionary
         results = {}
-        
+
+        # file lists and element counts are read from the vectors manifest if it is
+        # valid, otherwise the directories are scanned
+        manifest = VectorsManifest(design_path, logger=workspace.logger)
+        if not manifest.read():
+            manifest = None
+
         # Process paths
-        paths_count, paths_size = self._fast_dir_scan(paths_dir)
+        paths_count, paths_size, _ = self._dir_stats(manifest, "wire_paths", paths_dir)
         results["paths"] = (paths_count, paths_size)
         
         # Process nets
-        _, nets_size = self._fast_dir_scan(nets_dir)
-        
-        data_vectors = DataVectors(workspace)
-        nets = data_vectors.load_nets()
-        nets_count = len(nets) if nets else 0
-        
+        _, nets_size, nets_count = self._dir_stats(manifest, "nets", nets_dir)
+
+        data_vectors = create_data_vectors(workspace)
+        wire_num_sum, wire_nets_count = self._wire_num_sum(data_vectors, nets_dir)
+        if nets_count is None:
+            nets_count = wire_nets_count
+
         results["nets"] = (nets_count, nets_size)
 
         # Process patches 
-        _, patches_size = self._fast_dir_scan(patches_dir)
-        
-        data_vectors = DataVectors(workspace)
-        patches = data_vectors.load_patchs()
-        patches_count = len(patches) if patches else 0
+        _, patches_size, patches_count = self._dir_stats(
+            manifest, "patchs", patches_dir
+        )
+
+        if patches_count is None:
+            patches = data_vectors.load_patchs(fields=set())
+            patches_count = len(patches) if patches else 0
         
         results["patches"] = (patches_count, patches_size)
 
-        # Calculate wire_num sum 
-        results["wire_num_sum"] = 0
-        for net in nets:
-            results["wire_num_sum"] += net.wire_num if hasattr(net, "wire_num") else 0
+        results["wire_num_sum"] = wire_num_sum
 
 
         return {
@@ -1122,6 +1131,39 @@ class ResultStatisAnalyzer(BaseAnalyzer):
         }
 
 
+    def _wire_num_sum(self, data_vectors, nets_dir):
+        """return (wire_num sum, nets count) of the nets directory. the wire_num column
+        of the workspace columnar nets is read if they are up to date for nets_dir, they
+        are never converted here, otherwise the net scalars are streamed from the nets
+        files."""
+        columnar = VectorsColumnar(
+            data_vectors.vectors_paths["nets_columnar"],
+            logger=data_vectors.workspace.logger,
+        )
+        if columnar.is_valid(data_vectors.list_json_files(nets_dir)):
+            wire_num = columnar.read(columns={"nets": ["wire_num"]}).nets["wire_num"]
+            # missing wire_num is INT_NONE
+            return int(wire_num[wire_num != INT_NONE].sum()), len(wire_num)
+
+        wire_num_sum = 0
+        nets_count = 0
+        for vec_net in data_vectors.iter_nets(nets_dir, fields=set()):
+            nets_count += 1
+            wire_num_sum += vec_net.wire_num or 0
+        return wire_num_sum, nets_count
+
+    def _dir_stats(self, manifest, dir_name, directory):
+        """return (file count, total size, element count) of a vectors directory, the
+        element count is None if the manifest is missing, stale or has no counts."""
+        # the manifest may be copied with the workspace, check it records this directory
+        if manifest is not None and manifest.find_dir(directory) == dir_name:
+            stats = manifest.stats(dir_name)
+            if stats is not None:
+                return stats
+
+        file_count, total_size = self._fast_dir_scan(directory)
+        return file_count, total_size, None
+
     def _fast_dir_scan(self, directory):
         """Quickly count files and calculate total size in directory."""
         if not os.path.exists(directory):
@@ -1157,7 +1199,3 @@ class ResultStatisAnalyzer(BaseAnalyzer):
             i += 1
 
         return f"{size_bytes:.2f} {size_units[i]}"
-    
-    def _process_workspace_path_pair(self, args):
-        workspace, path = args
-        return self._process_design(workspace, path)
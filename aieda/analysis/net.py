@@ -14,21 +14,241 @@ import numpy as np
 import pandas as pd
 import seaborn as sns
 
-from ..data import DataVectors
+from ..data.io import VectorsColumnar
 from ..workspace import Workspace
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, create_data_vectors
+from .cache import cache_inputs
+from .statistics import BATCH_SIZE, QuantileSketch, StreamingMoments, summarize
 from .utility import save_fig
 
 
+# net columns used by the analyzers
+NET_COLUMNS = ["llx", "lly", "urx", "ury", "wire_len", "R", "C", "power", "delay", "slew"]
+
+# wire columns of the layer wirelength
+WIRE_COLUMNS = ["x1", "y1", "x2", "y2", "layer1", "layer2"]
+
+# net metrics of the correlation analysis
+NET_METRICS = ["hpwl", "rwl", "R", "C", "power", "delay", "slew"]
+
+# net metrics of the wirelength distribution report
+DISTRIBUTION_METRICS = ["hpwl", "rwl", "delay", "power"]
+
+
+# =====================================
+# extraction functions
+# =====================================
+@cache_inputs("nets", "tech")
+def _extract_net_data(workspace: Workspace) -> dict:
+    """extract net DataFrame and layer wirelength of a workspace.
+
+    wirelength per layer is reduced from the flat wire arrays of nets, only wires with
+    both nodes on the same layer are counted. the columnar nets are read if they are up
+    to date, the analyzer never converts them, otherwise the nets are loaded as objects.
+    """
+    vector_loader = create_data_vectors(workspace)
+
+    nets_dir = workspace.get_nets_path()
+    columnar = VectorsColumnar(
+        vector_loader.vectors_paths["nets_columnar"], logger=workspace.logger
+    )
+    if columnar.is_valid(vector_loader.list_json_files(nets_dir)):
+        columnar = columnar.read(columns={"nets": NET_COLUMNS, "wires": WIRE_COLUMNS})
+        nets = columnar.nets
+        wires = columnar.wires
+    else:
+        nets, wires = _net_arrays(vector_loader, nets_dir)
+
+    df = pd.DataFrame(
+        {
+            "hpwl": (nets["urx"] - nets["llx"]) + (nets["ury"] - nets["lly"]),
+            "rwl": nets["wire_len"],
+            "R": nets["R"],
+            "C": nets["C"],
+            "power": nets["power"],
+            "delay": nets["delay"],
+            "slew": nets["slew"],
+        }
+    )
+
+    layer_num = _layer_num(vector_loader, wires)
+    same_layer = (wires["layer1"] == wires["layer2"]) & (wires["layer1"] >= 0)
+    wire_lengths = np.abs(wires["x2"] - wires["x1"]) + np.abs(wires["y2"] - wires["y1"])
+    total_layer_lengths = np.bincount(
+        wires["layer1"][same_layer],
+        weights=wire_lengths[same_layer],
+        minlength=layer_num,
+    ).astype(float)
+
+    total_length = np.sum(total_layer_lengths)
+    layer_proportions = (
+        total_layer_lengths / total_length
+        if total_length > 0
+        else np.zeros(layer_num)
+    )
+
+    return {
+        "df": df,
+        "design_name": workspace.design,
+        "layer_lengths": total_layer_lengths,
+        "layer_proportions": layer_proportions,
+    }
+
+
+@cache_inputs("nets", "tech")
+def _extract_net_moments(workspace: Workspace) -> dict:
+    """stream nets of a workspace into mergeable moments of NET_METRICS and layer
+    wirelength, only one batch of nets is kept in memory."""
+    moments = StreamingMoments(NET_METRICS)
+    result = _stream_nets(workspace, moments.update)
+    result["moments"] = moments
+    return result
+
+
+@cache_inputs("nets", "tech")
+def _extract_net_sketches(workspace: Workspace) -> dict:
+    """stream nets of a workspace into mergeable quantile sketches of
+    DISTRIBUTION_METRICS and layer wirelength."""
+    sketches = {metric: QuantileSketch() for metric in DISTRIBUTION_METRICS}
+
+    def update(rows):
+        for metric, sketch in sketches.items():
+            sketch.update(rows[:, NET_METRICS.index(metric)])
+
+    result = _stream_nets(workspace, update)
+    result["sketches"] = sketches
+    return result
+
+
+def _stream_nets(workspace: Workspace, update) -> dict:
+    """feed batches of NET_METRICS rows of a workspace to update, and sum wirelength
+    per layer of wires with both nodes on the same layer."""
+    vector_loader = create_data_vectors(workspace)
+
+    layer_lengths = np.zeros(vector_loader.load_layers().layer_num or 0)
+
+    def flush(rows, layers, lengths):
+        nonlocal layer_lengths
+        update(np.array(rows, dtype=float))
+        if layers:
+            batch_lengths = np.bincount(layers, weights=lengths)
+            if len(batch_lengths) > len(layer_lengths):
+                layer_lengths = np.pad(
+                    layer_lengths, (0, len(batch_lengths) - len(layer_lengths))
+                )
+            layer_lengths[: len(batch_lengths)] += batch_lengths
+
+    rows, layers, lengths = [], [], []
+    for vec_net in vector_loader.iter_nets(fields={"feature", "wires"}):
+        feature = vec_net.feature
+        rows.append(
+            (
+                (feature.urx - feature.llx) + (feature.ury - feature.lly),
+                feature.wire_len,
+                feature.R,
+                feature.C,
+                feature.power,
+                feature.delay,
+                feature.slew,
+            )
+        )
+
+        # Only consider wires on the same layer
+        for wire in vec_net.wires:
+            node1 = wire.wire.node1
+            node2 = wire.wire.node2
+            if node1.layer == node2.layer and node1.layer >= 0:
+                layers.append(node1.layer)
+                lengths.append(abs(node2.x - node1.x) + abs(node2.y - node1.y))
+
+        if len(rows) >= BATCH_SIZE:
+            flush(rows, layers, lengths)
+            rows, layers, lengths = [], [], []
+
+    if rows:
+        flush(rows, layers, lengths)
+
+    total_length = np.sum(layer_lengths)
+    layer_proportions = (
+        layer_lengths / total_length if total_length > 0 else np.zeros(len(layer_lengths))
+    )
+
+    return {
+        "design_name": workspace.design,
+        "layer_lengths": layer_lengths,
+        "layer_proportions": layer_proportions,
+    }
+
+
+def _net_arrays(vector_loader, nets_dir: str):
+    """NET_COLUMNS and WIRE_COLUMNS arrays of net objects, missing values are nan for
+    net columns and -1 for wire layers."""
+    net_rows = []
+    wire_rows = []
+    for vec_net in vector_loader.load_nets(nets_dir, fields={"feature", "wires"}):
+        feature = vec_net.feature
+        net_rows.append([getattr(feature, name) for name in NET_COLUMNS])
+        for wire in vec_net.wires:
+            node1 = wire.wire.node1
+            node2 = wire.wire.node2
+            wire_rows.append(
+                [node1.x, node1.y, node2.x, node2.y, node1.layer, node2.layer]
+            )
+
+    net_array = np.array(net_rows, dtype=float).reshape(-1, len(NET_COLUMNS))
+    wire_array = np.array(
+        [[-1 if value is None else value for value in row] for row in wire_rows],
+        dtype=np.int64,
+    ).reshape(-1, len(WIRE_COLUMNS))
+
+    nets = {name: net_array[:, index] for index, name in enumerate(NET_COLUMNS)}
+    wires = {name: wire_array[:, index] for index, name in enumerate(WIRE_COLUMNS)}
+    return nets, wires
+
+
+def _layer_num(vector_loader, wires: dict) -> int:
+    """layer number of the design tech, enlarged to cover layers used by wires."""
+    layer_num = vector_loader.load_layers().layer_num or 0
+    for column in ["layer1", "layer2"]:
+        if len(wires[column]):
+            layer_num = max(layer_num, int(wires[column].max()) + 1)
+    return layer_num
+
+
+def _stack_layers(layer_arrays: List[np.ndarray]) -> np.ndarray:
+    """stack per-layer arrays of designs, designs with fewer layers are padded with 0."""
+    layer_num = max((len(values) for values in layer_arrays), default=0)
+    stacked = np.zeros((len(layer_arrays), layer_num))
+    for index, values in enumerate(layer_arrays):
+        stacked[index, : len(values)] = values
+    return stacked
+
+
 # =====================================
 # analyzer classes
 # =====================================
 class WireDistributionAnalyzer(BaseAnalyzer):
     """Analyzer for wirelength distribution."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, nets are streamed into mergeable quantile
+                sketches instead of being kept in DataFrames
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
         self.net_data = []
+        self.metrics_stats = {}
+        self.design_stats = {}
 
     def load(
         self,
@@ -42,106 +262,19 @@ class WireDistributionAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspace containing net data
             dir_to_display_name: Optional mapping from directory names to display names
-            pattern: File pattern to search for
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
 
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            net_db = vector_loader.load_nets(workspace.get_nets_path())
-
-            net_list = []
-            for vec_net in net_db:
-                # Calculate HPWL
-                llx = vec_net.feature.llx
-                lly = vec_net.feature.lly
-                urx = vec_net.feature.urx
-                ury = vec_net.feature.ury
-                hpwl = (urx - llx) + (ury - lly)
-
-                # Get actual routed wirelength
-                rwl = vec_net.feature.wire_len
-
-                # Get other features
-                r_value = vec_net.feature.R
-                c_value = vec_net.feature.C
-                power = vec_net.feature.power
-                delay = vec_net.feature.delay
-                slew = vec_net.feature.slew
-
-                # Calculate wirelength per layer
-                layer_lengths = [0] * 20  # Assume maximum 20 layers
-                total_wire_length = 0
-
-                for wire in vec_net.wires:
-                    x1 = wire.wire.node1.x
-                    y1 = wire.wire.node1.y
-                    x2 = wire.wire.node2.x
-                    y2 = wire.wire.node2.y
-                    l1 = wire.wire.node1.layer
-                    l2 = wire.wire.node2.layer
-
-                    # Only consider wires on the same layer
-                    if l1 == l2 and l1 < 20:
-                        wire_length = abs(x2 - x1) + abs(y2 - y1)
-                        layer_lengths[l1] += wire_length
-                        total_wire_length += wire_length
-
-                # Calculate layer wire length ratios
-                layer_ratios = [0] * 20
-                if total_wire_length > 0:
-                    layer_ratios = [
-                        length / total_wire_length for length in layer_lengths
-                    ]
-
-                net_list.append(
-                    {
-                        "hpwl": hpwl,
-                        "rwl": rwl,
-                        "R": r_value,
-                        "C": c_value,
-                        "power": power,
-                        "delay": delay,
-                        "slew": slew,
-                        "layer_lengths": layer_lengths,
-                        "layer_ratios": layer_ratios,
-                    }
-                )
-
-            # create DataFrame for the design
-            df = pd.DataFrame(
-                {
-                    "hpwl": [net["hpwl"] for net in net_list],
-                    "rwl": [net["rwl"] for net in net_list],
-                    "R": [net["R"] for net in net_list],
-                    "C": [net["C"] for net in net_list],
-                    "power": [net["power"] for net in net_list],
-                    "delay": [net["delay"] for net in net_list],
-                    "slew": [net["slew"] for net in net_list],
-                }
-            )
-
-            total_layer_lengths = np.zeros(20)
-            for net in net_list:
-                total_layer_lengths += np.array(net["layer_lengths"])
-
-            total_length = np.sum(total_layer_lengths)
-            layer_proportions = (
-                total_layer_lengths / total_length if total_length > 0 else np.zeros(20)
-            )
-
-            self.net_data.append(
-                {
-                    "df": df,
-                    "design_name": design_name,
-                    "layer_lengths": total_layer_lengths,
-                    "layer_proportions": layer_proportions,
-                }
-            )
+        extract = _extract_net_sketches if self.streaming else _extract_net_data
+        self.net_data.extend(
+            net_data
+            for net_data in self.map_workspaces(workspaces, extract)
+            if net_data is not None
+        )
 
         if not self.net_data:
             raise ValueError("No valid results found from any directory.")
@@ -158,6 +291,30 @@ class WireDistributionAnalyzer(BaseAnalyzer):
         if not self.net_data:
             raise ValueError("No data loaded. Please call load() first.")
 
+        for metric in DISTRIBUTION_METRICS:
+            if self.streaming:
+                # merge sketches of all designs, no raw nets are kept
+                self.metrics_stats[metric] = QuantileSketch.merge_all(
+                    [data["sketches"][metric] for data in self.net_data]
+                ).summary()
+            else:
+                self.metrics_stats[metric] = summarize(
+                    np.concatenate([data["df"][metric].values for data in self.net_data])
+                )
+
+        for data in self.net_data:
+            if self.streaming:
+                design_stats = {
+                    metric: data["sketches"][metric].summary()
+                    for metric in DISTRIBUTION_METRICS
+                }
+            else:
+                design_stats = {
+                    metric: summarize(data["df"][metric].values)
+                    for metric in DISTRIBUTION_METRICS
+                }
+            self.design_stats[data["design_name"]] = design_stats
+
     def report(self) -> str:
         """Generate a text report summarizing wire distribution analysis."""
         if not self.net_data:
@@ -166,55 +323,42 @@ class WireDistributionAnalyzer(BaseAnalyzer):
         report_lines = []
         report_lines.append("**Wire Distribution Analysis Report**")
         
+        if not self.metrics_stats:
+            self.analyze()
+
         # Overall statistics
         total_designs = len(self.net_data)
-        total_nets = sum(len(data["df"]) for data in self.net_data)
+        total_nets = self.metrics_stats["hpwl"]["count"]
         
         report_lines.append(f"- Analyzed {total_designs} design(s) with {total_nets:,} total nets")
         report_lines.append("")
         
-        # Aggregate statistics across all designs
-        all_hpwl = []
-        all_rwl = []
-        all_delay = []
-        all_power = []
-        
-        for data in self.net_data:
-            df = data["df"]
-            all_hpwl.extend(df["hpwl"].tolist())
-            all_rwl.extend(df["rwl"].tolist())
-            all_delay.extend(df["delay"].tolist())
-            all_power.extend(df["power"].tolist())
-        
         # Wire length statistics
         report_lines.append("**Wire Length Statistics**")
-        if all_hpwl:
-            hpwl_array = np.array(all_hpwl)
-            report_lines.append(f"- HPWL - Mean: {hpwl_array.mean():.1f}, Min: {hpwl_array.min():.1f}, Max: {hpwl_array.max():.1f}")
-        
-        if all_rwl:
-            rwl_array = np.array(all_rwl)
-            report_lines.append(f"- RWL - Mean: {rwl_array.mean():.1f}, Min: {rwl_array.min():.1f}, Max: {rwl_array.max():.1f}")
+        for metric, label in [("hpwl", "HPWL"), ("rwl", "RWL")]:
+            stats = self.metrics_stats[metric]
+            if stats["count"]:
+                report_lines.append(f"- {label} - Mean: {stats['mean']:.1f}, Median: {stats['median']:.1f}, Min: {stats['min']:.1f}, Max: {stats['max']:.1f}")
         
         report_lines.append("")
         
         # Performance metrics
         report_lines.append("**Performance Metrics**")
-        if all_delay:
-            delay_array = np.array(all_delay)
-            report_lines.append(f"- Delay - Mean: {delay_array.mean():.3f}, Min: {delay_array.min():.3f}, Max: {delay_array.max():.3f}")
+        stats = self.metrics_stats["delay"]
+        if stats["count"]:
+            report_lines.append(f"- Delay - Mean: {stats['mean']:.3f}, Median: {stats['median']:.3f}, Min: {stats['min']:.3f}, Max: {stats['max']:.3f}")
         
-        if all_power:
-            power_array = np.array(all_power)
-            report_lines.append(f"- Power - Mean: {power_array.mean():.3e}, Min: {power_array.min():.3e}, Max: {power_array.max():.3e}")
+        stats = self.metrics_stats["power"]
+        if stats["count"]:
+            report_lines.append(f"- Power - Mean: {stats['mean']:.3e}, Median: {stats['median']:.3e}, Min: {stats['min']:.3e}, Max: {stats['max']:.3e}")
         
         report_lines.append("")
         
         # Layer distribution summary
         report_lines.append("**Layer Distribution Summary**")
-        total_layer_usage = np.zeros(20)
-        for data in self.net_data:
-            total_layer_usage += data["layer_proportions"]
+        total_layer_usage = _stack_layers(
+            [data["layer_proportions"] for data in self.net_data]
+        ).sum(axis=0)
         
         # Normalize and show top layers
         if np.sum(total_layer_usage) > 0:
@@ -229,13 +373,11 @@ class WireDistributionAnalyzer(BaseAnalyzer):
         
         # Per-design summary
         report_lines.append("**Per-Design Summary**")
-        for data in self.net_data:
-            design_name = data["design_name"]
+        for design_name, stats in self.design_stats.items():
             display_name = self.dir_to_display_name.get(design_name, design_name)
-            df = data["df"]
-            net_count = len(df)
-            avg_hpwl = df["hpwl"].mean() if not df["hpwl"].empty else 0
-            avg_rwl = df["rwl"].mean() if not df["rwl"].empty else 0
+            net_count = stats["hpwl"]["count"]
+            avg_hpwl = stats["hpwl"]["mean"] if net_count else 0
+            avg_rwl = stats["rwl"]["mean"] if stats["rwl"]["count"] else 0
             
             report_lines.append(f"- {display_name}: {net_count:,} nets, Avg HPWL: {avg_hpwl:.1f}, Avg RWL: {avg_rwl:.1f}")
         
@@ -266,7 +408,7 @@ class WireDistributionAnalyzer(BaseAnalyzer):
             display_name = self.dir_to_display_name.get(base_name, base_name)
             design_names.append(display_name)
 
-        layer_data = np.array([r["layer_proportions"] for r in self.net_data])
+        layer_data = _stack_layers([r["layer_proportions"] for r in self.net_data])
 
         # Show only even layers (actual chip layers)
         layers_to_show = [0, 2, 4, 6, 8, 10, 12]
@@ -274,7 +416,7 @@ class WireDistributionAnalyzer(BaseAnalyzer):
         # Create stacked bar chart
         bottom = np.zeros(len(self.net_data))
         for i in layers_to_show:
-            if i < 20:  # Ensure layer index is within range
+            if i < layer_data.shape[1]:  # Ensure layer index is within range
                 layer_props = layer_data[:, i]
                 if np.sum(layer_props) > 0:  # Only plot layers with data
                     plt.bar(
@@ -310,10 +452,29 @@ class WireDistributionAnalyzer(BaseAnalyzer):
 class MetricsCorrelationAnalyzer(BaseAnalyzer):
     """Analyzer for net features and statistics."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        correlation_method: str = "pearson",
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, nets are streamed into mergeable moments
+                instead of being kept in DataFrames
+            correlation_method: "pearson" or "spearman", spearman is approximated by
+                a sample of nets in streaming mode
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
+        self.correlation_method = correlation_method
         self.net_data = []
         self.combined_df = None
+        self.correlation_matrix = None
 
     def load(
         self,
@@ -327,106 +488,19 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspace containing net data
             dir_to_display_name: Optional mapping from directory names to display names
-            pattern: File pattern to search for
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
 
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            net_db = vector_loader.load_nets(workspace.get_nets_path())
-
-            net_list = []
-            for vec_net in net_db:
-                # Calculate HPWL
-                llx = vec_net.feature.llx
-                lly = vec_net.feature.lly
-                urx = vec_net.feature.urx
-                ury = vec_net.feature.ury
-                hpwl = (urx - llx) + (ury - lly)
-
-                # Get actual routed wirelength
-                rwl = vec_net.feature.wire_len
-
-                # Get other features
-                r_value = vec_net.feature.R
-                c_value = vec_net.feature.C
-                power = vec_net.feature.power
-                delay = vec_net.feature.delay
-                slew = vec_net.feature.slew
-
-                # Calculate wirelength per layer
-                layer_lengths = [0] * 20  # Assume maximum 20 layers
-                total_wire_length = 0
-
-                for wire in vec_net.wires:
-                    x1 = wire.wire.node1.x
-                    y1 = wire.wire.node1.y
-                    x2 = wire.wire.node2.x
-                    y2 = wire.wire.node2.y
-                    l1 = wire.wire.node1.layer
-                    l2 = wire.wire.node2.layer
-
-                    # Only consider wires on the same layer
-                    if l1 == l2 and l1 < 20:
-                        wire_length = abs(x2 - x1) + abs(y2 - y1)
-                        layer_lengths[l1] += wire_length
-                        total_wire_length += wire_length
-
-                # Calculate layer wire length ratios
-                layer_ratios = [0] * 20
-                if total_wire_length > 0:
-                    layer_ratios = [
-                        length / total_wire_length for length in layer_lengths
-                    ]
-
-                net_list.append(
-                    {
-                        "hpwl": hpwl,
-                        "rwl": rwl,
-                        "R": r_value,
-                        "C": c_value,
-                        "power": power,
-                        "delay": delay,
-                        "slew": slew,
-                        "layer_lengths": layer_lengths,
-                        "layer_ratios": layer_ratios,
-                    }
-                )
-
-            # create DataFrame for the design
-            df = pd.DataFrame(
-                {
-                    "hpwl": [net["hpwl"] for net in net_list],
-                    "rwl": [net["rwl"] for net in net_list],
-                    "R": [net["R"] for net in net_list],
-                    "C": [net["C"] for net in net_list],
-                    "power": [net["power"] for net in net_list],
-                    "delay": [net["delay"] for net in net_list],
-                    "slew": [net["slew"] for net in net_list],
-                }
-            )
-
-            total_layer_lengths = np.zeros(20)
-            for net in net_list:
-                total_layer_lengths += np.array(net["layer_lengths"])
-
-            total_length = np.sum(total_layer_lengths)
-            layer_proportions = (
-                total_layer_lengths / total_length if total_length > 0 else np.zeros(20)
-            )
-
-            self.net_data.append(
-                {
-                    "df": df,
-                    "design_name": design_name,
-                    "layer_lengths": total_layer_lengths,
-                    "layer_proportions": layer_proportions,
-                }
-            )
+        extract = _extract_net_moments if self.streaming else _extract_net_data
+        self.net_data.extend(
+            net_data
+            for net_data in self.map_workspaces(workspaces, extract)
+            if net_data is not None
+        )
 
         if not self.net_data:
             raise ValueError("No valid results found from any directory.")
@@ -444,33 +518,55 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
         if verbose:
             print("Analyzing net features...")
 
-        # Combine all design DataFrames for correlation analysis
-        self.combined_df = pd.concat(
-            [r["df"] for r in self.net_data], ignore_index=True
-        )
+        if self.streaming:
+            # merge moments of all designs, no raw nets are kept
+            moments = StreamingMoments.merge_all([r["moments"] for r in self.net_data])
+            self.total_count = moments.count
+            self.correlation_matrix = moments.corr(self.correlation_method)
+            self.metrics_stats = {
+                metric: moments.summary(metric) for metric in NET_METRICS
+            }
+        else:
+            # Combine all design DataFrames for correlation analysis
+            self.combined_df = pd.concat(
+                [r["df"] for r in self.net_data], ignore_index=True
+            )
+            self.total_count = len(self.combined_df)
+            self.correlation_matrix = self.combined_df[NET_METRICS].corr(
+                method=self.correlation_method
+            )
+            self.metrics_stats = {
+                metric: {
+                    "mean": self.combined_df[metric].mean(),
+                    "std": self.combined_df[metric].std(),
+                    "min": self.combined_df[metric].min(),
+                    "max": self.combined_df[metric].max(),
+                }
+                for metric in NET_METRICS
+            }
 
         # Calculate summary statistics for each design
         self.design_stats = {}
         for result in self.net_data:
             design_name = result["design_name"]
-            df = result["df"]
-
-            stats = {
-                "count": len(df),
-                "mean_hpwl": df["hpwl"].mean(),
-                "mean_rwl": df["rwl"].mean(),
-                "mean_R": df["R"].mean(),
-                "mean_C": df["C"].mean(),
-                "mean_power": df["power"].mean(),
-                "mean_delay": df["delay"].mean(),
-                "mean_slew": df["slew"].mean(),
-                "layer_proportions": result["layer_proportions"],
-            }
+
+            if self.streaming:
+                moments = result["moments"]
+                stats = {"count": moments.count}
+                for metric in NET_METRICS:
+                    stats[f"mean_{metric}"] = moments.summary(metric)["mean"]
+            else:
+                df = result["df"]
+                stats = {"count": len(df)}
+                for metric in NET_METRICS:
+                    stats[f"mean_{metric}"] = df[metric].mean()
+
+            stats["layer_proportions"] = result["layer_proportions"]
             self.design_stats[design_name] = stats
 
     def report(self) -> str:
         """Generate a text report summarizing metrics correlation analysis."""
-        if not self.net_data or not hasattr(self, 'combined_df'):
+        if not self.net_data or self.correlation_matrix is None:
             return "No metrics correlation data available for analysis. Please run analyze() first."
 
         report_lines = []
@@ -478,24 +574,23 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
         
         # Overall statistics
         total_designs = len(self.net_data)
-        total_nets = len(self.combined_df)
+        total_nets = self.total_count
         
         report_lines.append(f"- Analyzed {total_designs} design(s) with {total_nets:,} total nets")
         report_lines.append("")
         
         # Combined metrics statistics
         report_lines.append("**Overall Metrics Statistics**")
-        metrics = ['hpwl', 'rwl', 'R', 'C', 'power', 'delay', 'slew']
+        metrics = NET_METRICS
         for metric in metrics:
-            if metric in self.combined_df.columns:
-                values = self.combined_df[metric]
-                report_lines.append(f"- {metric.upper()}: Mean={values.mean():.3e}, Std={values.std():.3e}, Range=[{values.min():.3e}, {values.max():.3e}]")
+            values = self.metrics_stats[metric]
+            report_lines.append(f"- {metric.upper()}: Mean={values['mean']:.3e}, Std={values['std']:.3e}, Range=[{values['min']:.3e}, {values['max']:.3e}]")
         
         report_lines.append("")
         
         # Key correlations
         report_lines.append("**Key Correlations**")
-        corr_matrix = self.combined_df[metrics].corr()
+        corr_matrix = self.correlation_matrix
         
         # Find strongest correlations (excluding self-correlations)
         strong_corrs = []
@@ -535,10 +630,9 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
         report_lines.append("**Layer Usage Summary**")
         if self.design_stats:
             # Average layer proportions across all designs
-            avg_layer_props = np.zeros(20)
-            for stats in self.design_stats.values():
-                avg_layer_props += np.array(stats['layer_proportions'])
-            avg_layer_props /= len(self.design_stats)
+            avg_layer_props = _stack_layers(
+                [stats['layer_proportions'] for stats in self.design_stats.values()]
+            ).mean(axis=0)
             
             # Show top used layers
             top_layers = np.argsort(avg_layer_props)[::-1][:5]
@@ -555,7 +649,7 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
         Args:
             save_path: Directory to save the visualizations
         """
-        if not hasattr(self, "combined_df") or self.combined_df is None:
+        if self.correlation_matrix is None:
             raise ValueError("No analysis results found. Please call analyze() first.")
 
         # Set up output directory
@@ -569,7 +663,7 @@ class MetricsCorrelationAnalyzer(BaseAnalyzer):
 
         # Calculate correlation matrix
         features = ["rwl", "hpwl", "R", "C", "power", "delay", "slew"]
-        corr_matrix = self.combined_df[features].corr()
+        corr_matrix = self.correlation_matrix.loc[features, features]
 
         # Create heatmap
         sns.heatmap(corr_matrix, annot=True, cmap="YlGnBu", fmt=".2f", linewidths=0.5)
@@ -16,20 +16,237 @@ import seaborn as sns
 from matplotlib import ticker
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
-from ..data import DataVectors
 from ..workspace import Workspace
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, create_data_vectors
+from .cache import cache_inputs
+from .statistics import BATCH_SIZE, REPORT_QUANTILES, QuantileSketch, StreamingMoments
 from .utility import save_fig
 
 
+@cache_inputs("patchs")
+def _extract_patch_data(workspace: Workspace) -> dict:
+    """extract patch feature DataFrame and layer congestion of a workspace."""
+    design_name = workspace.design
+
+    vector_loader = create_data_vectors(workspace)
+
+    patch_db = vector_loader.load_patchs(workspace.get_patchs_path())
+
+    patch_list = []
+    for vec_patch in patch_db:
+        # Extract basic patch features
+        patch_features = {
+            "CellDensity": vec_patch.cell_density,
+            "PinDensity": vec_patch.pin_density,
+            "NetDensity": vec_patch.net_density,
+            "RUDY": vec_patch.RUDY_congestion,
+            "Congestion": vec_patch.EGR_congestion,
+            "Timing": vec_patch.timing_map,
+            "Power": vec_patch.power_map,
+            "IRDrop": vec_patch.ir_drop_map,
+        }
+
+        # Extract per-layer congestion and wire density information
+        # Only consider routing layers (those with wire_width value)
+        layer_congestion = []
+        layer_wire_density = []
+        layer_info = []
+        for layer in vec_patch.patch_layer:
+            # Check if this is a routing layer (has wire_width value)
+            if hasattr(layer, 'wire_width') and layer.wire_width > 0:
+                layer_info.append({
+                    'id': layer.id,
+                    'wire_width': layer.wire_width
+                })
+                # Use 0.0 as default if congestion or wire_density is None
+                layer_congestion.append(layer.congestion if layer.congestion is not None else 0.0)
+                layer_wire_density.append(layer.wire_density if layer.wire_density is not None else 0.0)
+
+        patch_list.append(
+            {
+                "features": patch_features,
+                "layer_congestion": layer_congestion,
+                "layer_wire_density": layer_wire_density,
+                "layer_info": layer_info,
+            }
+        )
+
+    # create features DataFrame
+    features_df = pd.DataFrame([p["features"] for p in patch_list])
+
+    # Calculate average layer congestion and wire density
+    # Calculate averages only if there are layers
+    avg_layer_congestion = []
+    avg_layer_wire_density = []
+    if patch_list:
+        # Get max number of layers across all patches to handle variable layer counts
+        max_layers = max(len(p["layer_congestion"]) for p in patch_list)
+        
+        # For each layer position, calculate the average across all patches
+        for i in range(max_layers):
+            layer_congestions = []
+            layer_densities = []
+            
+            for p in patch_list:
+                if i < len(p["layer_congestion"]):
+                    layer_congestions.append(p["layer_congestion"][i])
+                    layer_densities.append(p["layer_wire_density"][i])
+            
+            if layer_congestions:  # Only calculate average if there are values
+                avg_layer_congestion.append(np.mean(layer_congestions))
+                avg_layer_wire_density.append(np.mean(layer_densities))
+
+    return {
+        "design_name": design_name,
+        "df": features_df,
+        "avg_layer_congestion": avg_layer_congestion,
+        "avg_layer_wire_density": avg_layer_wire_density,
+        "file_count": len(patch_list),
+        # routing layers of the first patch, assumes all patches have the same layers
+        "routing_layers": (
+            [info["id"] for info in patch_list[0]["layer_info"]] if patch_list else []
+        ),
+        "raw_layer_data": {
+            "congestion": [p["layer_congestion"] for p in patch_list],
+            "wire_density": [p["layer_wire_density"] for p in patch_list],
+            "layer_info": [p["layer_info"] for p in patch_list] if patch_list else [],
+        },
+    }
+
+
+@cache_inputs("patchs")
+def _extract_layer_sketches(workspace: Workspace) -> dict:
+    """stream patchs of a workspace into mergeable quantile sketches of congestion and
+    wire density per routing layer position, only one batch of patchs is kept in memory."""
+    vector_loader = create_data_vectors(workspace)
+
+    congestion_sketches = []
+    density_sketches = []
+    routing_layers = None
+    patch_num = 0
+
+    congestions = []
+    densities = []
+
+    def flush():
+        for values, sketches in [
+            (congestions, congestion_sketches),
+            (densities, density_sketches),
+        ]:
+            for index, layer_values in enumerate(values):
+                if index == len(sketches):
+                    sketches.append(QuantileSketch())
+                sketches[index].update(layer_values)
+                layer_values.clear()
+
+    for vec_patch in vector_loader.iter_patchs(
+        workspace.get_patchs_path(), fields={"patch_layer"}
+    ):
+        # Only consider routing layers (those with wire_width value)
+        layers = [
+            layer
+            for layer in vec_patch.patch_layer
+            if hasattr(layer, "wire_width") and layer.wire_width > 0
+        ]
+        if routing_layers is None:
+            routing_layers = [layer.id for layer in layers]
+
+        for index, layer in enumerate(layers):
+            if index == len(congestions):
+                congestions.append([])
+                densities.append([])
+            # Use 0.0 as default if congestion or wire_density is None
+            congestions[index].append(
+                layer.congestion if layer.congestion is not None else 0.0
+            )
+            densities[index].append(
+                layer.wire_density if layer.wire_density is not None else 0.0
+            )
+
+        patch_num += 1
+        if patch_num % BATCH_SIZE == 0:
+            flush()
+
+    flush()
+
+    return {
+        "design_name": workspace.design,
+        "avg_layer_congestion": [sketch.mean for sketch in congestion_sketches],
+        "avg_layer_wire_density": [sketch.mean for sketch in density_sketches],
+        "file_count": patch_num,
+        "routing_layers": routing_layers or [],
+        "layer_congestion": congestion_sketches,
+        "layer_wire_density": density_sketches,
+    }
+
+
+# patch features of the correlation analysis, name : VectorPatch field name
+PATCH_FEATURES = {
+    "CellDensity": "cell_density",
+    "PinDensity": "pin_density",
+    "NetDensity": "net_density",
+    "RUDY": "RUDY_congestion",
+    "Congestion": "EGR_congestion",
+    "Timing": "timing_map",
+    "Power": "power_map",
+    "IRDrop": "ir_drop_map",
+}
+
+
+@cache_inputs("patchs")
+def _extract_patch_moments(workspace: Workspace) -> dict:
+    """stream patchs of a workspace into mergeable moments of PATCH_FEATURES, only
+    one patch file is kept in memory."""
+    vector_loader = create_data_vectors(workspace)
+
+    moments = StreamingMoments(list(PATCH_FEATURES))
+    patch_num = 0
+
+    # only patch scalars are needed
+    for patchs in vector_loader.iter_dir(
+        workspace.get_patchs_path(), "get_patchs", {"fields": set()}
+    ):
+        moments.update(
+            np.array(
+                [
+                    [getattr(patch, field) for field in PATCH_FEATURES.values()]
+                    for patch in patchs
+                ],
+                dtype=float,
+            )
+        )
+        patch_num += len(patchs)
+
+    return {
+        "design_name": workspace.design,
+        "moments": moments,
+        "file_count": patch_num,
+    }
+
+
 class WireDensityAnalyzer(BaseAnalyzer):
     """Analyzer for wire density and congestion analysis"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, layer congestion and wire density of patchs
+                are streamed into mergeable quantile sketches instead of raw lists
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
         self.patch_data = {}
         self.design_stats = {}
         self.routing_layers = None  # Will be determined dynamically based on wire_width
+        self.layer_congestion_quantiles = {}
 
     def load(
         self,
@@ -43,95 +260,19 @@ class WireDensityAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspace containing patch data
             dir_to_display_name: Optional mapping from directory names to display names
-            pattern : Pattern to match patch files
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
             max_workers: Maximum number of worker processes (default: min(8, cpu_count()))
             verbose: Whether to show progress information
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            patch_db = vector_loader.load_patchs(workspace.get_patchs_path())
-
-            patch_list = []
-            for vec_patch in patch_db:
-                # Extract basic patch features
-                patch_features = {
-                    "CellDensity": vec_patch.cell_density,
-                    "PinDensity": vec_patch.pin_density,
-                    "NetDensity": vec_patch.net_density,
-                    "RUDY": vec_patch.RUDY_congestion,
-                    "Congestion": vec_patch.EGR_congestion,
-                    "Timing": vec_patch.timing_map,
-                    "Power": vec_patch.power_map,
-                    "IRDrop": vec_patch.ir_drop_map,
-                }
-
-                # Extract per-layer congestion and wire density information
-                # Only consider routing layers (those with wire_width value)
-                layer_congestion = []
-                layer_wire_density = []
-                layer_info = []
-                for layer in vec_patch.patch_layer:
-                    # Check if this is a routing layer (has wire_width value)
-                    if hasattr(layer, 'wire_width') and layer.wire_width > 0:
-                        layer_info.append({
-                            'id': layer.id,
-                            'wire_width': layer.wire_width
-                        })
-                        # Use 0.0 as default if congestion or wire_density is None
-                        layer_congestion.append(layer.congestion if layer.congestion is not None else 0.0)
-                        layer_wire_density.append(layer.wire_density if layer.wire_density is not None else 0.0)
-
-                patch_list.append(
-                    {
-                        "features": patch_features,
-                        "layer_congestion": layer_congestion,
-                        "layer_wire_density": layer_wire_density,
-                        "layer_info": layer_info,
-                    }
-                )
-
-            # create features DataFrame
-            features_df = pd.DataFrame([p["features"] for p in patch_list])
-
-            # Calculate average layer congestion and wire density
-            # Calculate averages only if there are layers
-            avg_layer_congestion = []
-            avg_layer_wire_density = []
-            if patch_list:
-                # Get max number of layers across all patches to handle variable layer counts
-                max_layers = max(len(p["layer_congestion"]) for p in patch_list)
-                
-                # For each layer position, calculate the average across all patches
-                for i in range(max_layers):
-                    layer_congestions = []
-                    layer_densities = []
-                    
-                    for p in patch_list:
-                        if i < len(p["layer_congestion"]):
-                            layer_congestions.append(p["layer_congestion"][i])
-                            layer_densities.append(p["layer_wire_density"][i])
-                    
-                    if layer_congestions:  # Only calculate average if there are values
-                        avg_layer_congestion.append(np.mean(layer_congestions))
-                        avg_layer_wire_density.append(np.mean(layer_densities))
-
-            self.patch_data[design_name] = {
-                "design_name": design_name,
-                "df": features_df,
-                "avg_layer_congestion": avg_layer_congestion,
-                "avg_layer_wire_density": avg_layer_wire_density,
-                "file_count": len(patch_list),
-                "raw_layer_data": {
-                    "congestion": [p["layer_congestion"] for p in patch_list],
-                    "wire_density": [p["layer_wire_density"] for p in patch_list],
-                    "layer_info": [p["layer_info"] for p in patch_list] if patch_list else [],
-                },
-            }
+        extract = _extract_layer_sketches if self.streaming else _extract_patch_data
+        for patch_data in self.map_workspaces(workspaces, extract):
+            if patch_data is None:
+                continue
+            self.patch_data[patch_data["design_name"]] = patch_data
 
         if not self.patch_data:
             raise ValueError("No valid results found from any directory.")
@@ -151,29 +292,49 @@ class WireDensityAnalyzer(BaseAnalyzer):
                 "file_count": data["file_count"],
                 "avg_layer_congestion": data["avg_layer_congestion"],
                 "avg_layer_wire_density": data["avg_layer_wire_density"],
-                "raw_layer_data": data["raw_layer_data"],
             }
+            if not self.streaming:
+                stats["raw_layer_data"] = data["raw_layer_data"]
 
-            # Determine routing layers based on layer_info from the first patch's data
-            # This assumes all patches have the same layer structure
-            if data["raw_layer_data"]["layer_info"] and len(data["raw_layer_data"]["layer_info"]) > 0:
-                # Get the first patch's layer_info
-                first_patch_layer_info = data["raw_layer_data"]["layer_info"][0]
-                self.routing_layers = [info['id'] for info in first_patch_layer_info]
-                
-                # Calculate layer-wise statistics
-                for i, layer_id in enumerate(self.routing_layers):
-                    if i < len(data["avg_layer_congestion"]):
-                        stats[f"layer_{layer_id}_congestion"] = data["avg_layer_congestion"][i]
-                        stats[f"layer_{layer_id}_wire_density"] = data["avg_layer_wire_density"][i]
-                    else:
-                        stats[f"layer_{layer_id}_congestion"] = 0.0
-                        stats[f"layer_{layer_id}_wire_density"] = 0.0
-            else:
-                self.routing_layers = []
+            # Routing layers are determined from the first patch's layer_info
+            self.routing_layers = data["routing_layers"]
+
+            # Calculate layer-wise statistics
+            for i, layer_id in enumerate(self.routing_layers):
+                if i < len(data["avg_layer_congestion"]):
+                    stats[f"layer_{layer_id}_congestion"] = data["avg_layer_congestion"][i]
+                    stats[f"layer_{layer_id}_wire_density"] = data["avg_layer_wire_density"][i]
+                else:
+                    stats[f"layer_{layer_id}_congestion"] = 0.0
+                    stats[f"layer_{layer_id}_wire_density"] = 0.0
 
             self.design_stats[design_name] = stats
 
+        # quantiles of layer congestion over the patches of all designs
+        layer_congestions = {}
+        for data in self.patch_data.values():
+            for i, layer_id in enumerate(data["routing_layers"]):
+                if self.streaming:
+                    if i < len(data["layer_congestion"]):
+                        layer_congestions.setdefault(layer_id, QuantileSketch()).merge(
+                            data["layer_congestion"][i]
+                        )
+                else:
+                    layer_congestions.setdefault(layer_id, []).extend(
+                        congestion[i]
+                        for congestion in data["raw_layer_data"]["congestion"]
+                        if i < len(congestion)
+                    )
+
+        for layer_id, congestions in layer_congestions.items():
+            if self.streaming:
+                quantiles = congestions.quantiles(REPORT_QUANTILES)
+            elif congestions:
+                quantiles = np.quantile(congestions, REPORT_QUANTILES)
+            else:
+                quantiles = np.full(len(REPORT_QUANTILES), np.nan)
+            self.layer_congestion_quantiles[layer_id] = quantiles
+
         print(f"Analysis completed for {len(self.design_stats)} designs.")
 
     def report(self) -> str:
@@ -193,6 +354,7 @@ class WireDensityAnalyzer(BaseAnalyzer):
         
         # Layer-wise congestion summary
         report_lines.append("**Layer-wise Congestion Summary**")
+        quantile_names = "/".join(f"P{q * 100:g}" for q in REPORT_QUANTILES)
         if hasattr(self, 'routing_layers') and self.routing_layers:
             for layer in self.routing_layers:
                 layer_congestions = []
@@ -204,7 +366,11 @@ class WireDensityAnalyzer(BaseAnalyzer):
                 if layer_congestions:
                     avg_congestion = np.mean(layer_congestions)
                     max_congestion = np.max(layer_congestions)
-                    report_lines.append(f"- Layer {layer}: Avg={avg_congestion:.3f}, Max={max_congestion:.3f} ({len(layer_congestions)} designs)")
+                    quantiles = "/".join(
+                        f"{value:.3f}"
+                        for value in self.layer_congestion_quantiles.get(layer, [])
+                    )
+                    report_lines.append(f"- Layer {layer}: Avg={avg_congestion:.3f}, Max={max_congestion:.3f} ({len(layer_congestions)} designs), Patch {quantile_names}={quantiles}")
         else:
             report_lines.append("- No routing layers identified for congestion analysis")
         
@@ -449,21 +615,30 @@ class WireDensityAnalyzer(BaseAnalyzer):
 class FeatureCorrelationAnalyzer(BaseAnalyzer):
     """Analyzer for patch feature correlation analysis"""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        correlation_method: str = "pearson",
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, patchs are streamed into mergeable moments
+                instead of being kept in DataFrames, medians are approximate
+            correlation_method: "pearson" or "spearman", spearman is approximated by
+                a sample of patchs in streaming mode
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
+        self.correlation_method = correlation_method
         self.patch_data = {}
         self.correlation_matrix = None
         self.feature_stats = {}
-        self.correlation_features = [
-            "CellDensity",
-            "PinDensity",
-            "NetDensity",
-            "RUDY",
-            "Congestion",
-            "Timing",
-            "Power",
-            "IRDrop",
-        ]
+        self.correlation_features = list(PATCH_FEATURES)
 
     def load(
         self,
@@ -477,93 +652,17 @@ class FeatureCorrelationAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of base directories containing patch data
             dir_to_display_name: Optional mapping from directory names to display names
-            pattern : Pattern to match patch files
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            patch_db = vector_loader.load_patchs(workspace.get_patchs_path())
-
-            patch_list = []
-            for vec_patch in patch_db:
-                # Extract basic patch features
-                patch_features = {
-                    "CellDensity": vec_patch.cell_density,
-                    "PinDensity": vec_patch.pin_density,
-                    "NetDensity": vec_patch.net_density,
-                    "RUDY": vec_patch.RUDY_congestion,
-                    "Congestion": vec_patch.EGR_congestion,
-                    "Timing": vec_patch.timing_map,
-                    "Power": vec_patch.power_map,
-                    "IRDrop": vec_patch.ir_drop_map,
-                }
-
-                # Extract per-layer congestion and wire density information
-                # Only consider routing layers (those with wire_width value)
-                layer_congestion = []
-                layer_wire_density = []
-                layer_info = []
-                for layer in vec_patch.patch_layer:
-                    # Check if this is a routing layer (has wire_width value)
-                    if hasattr(layer, 'wire_width') and layer.wire_width > 0:
-                        layer_info.append({
-                            'id': layer.id,
-                            'wire_width': layer.wire_width
-                        })
-                        # Use 0.0 as default if congestion or wire_density is None
-                        layer_congestion.append(layer.congestion if layer.congestion is not None else 0.0)
-                        layer_wire_density.append(layer.wire_density if layer.wire_density is not None else 0.0)
-
-                patch_list.append(
-                    {
-                        "features": patch_features,
-                        "layer_congestion": layer_congestion,
-                        "layer_wire_density": layer_wire_density,
-                        "layer_info": layer_info,
-                    }
-                )
-
-            # create features DataFrame
-            features_df = pd.DataFrame([p["features"] for p in patch_list])
-
-            # Calculate average layer congestion and wire density
-            # Calculate averages only if there are layers
-            avg_layer_congestion = []
-            avg_layer_wire_density = []
-            if patch_list:
-                # Get max number of layers across all patches to handle variable layer counts
-                max_layers = max(len(p["layer_congestion"]) for p in patch_list)
-                
-                # For each layer position, calculate the average across all patches
-                for i in range(max_layers):
-                    layer_congestions = []
-                    layer_densities = []
-                    
-                    for p in patch_list:
-                        if i < len(p["layer_congestion"]):
-                            layer_congestions.append(p["layer_congestion"][i])
-                            layer_densities.append(p["layer_wire_density"][i])
-                    
-                    if layer_congestions:  # Only calculate average if there are values
-                        avg_layer_congestion.append(np.mean(layer_congestions))
-                        avg_layer_wire_density.append(np.mean(layer_densities))
-
-            self.patch_data[design_name] = {
-                "design_name": design_name,
-                "df": features_df,
-                "avg_layer_congestion": avg_layer_congestion,
-                "avg_layer_wire_density": avg_layer_wire_density,
-                "file_count": len(patch_list),
-                "raw_layer_data": {
-                    "congestion": [p["layer_congestion"] for p in patch_list],
-                    "wire_density": [p["layer_wire_density"] for p in patch_list],
-                    "layer_info": [p["layer_info"] for p in patch_list] if patch_list else [],
-                },
-            }
+        extract = _extract_patch_moments if self.streaming else _extract_patch_data
+        for patch_data in self.map_workspaces(workspaces, extract):
+            if patch_data is None:
+                continue
+            self.patch_data[patch_data["design_name"]] = patch_data
 
         if not self.patch_data:
             raise ValueError("No valid results found from any directory.")
@@ -577,22 +676,28 @@ class FeatureCorrelationAnalyzer(BaseAnalyzer):
         if not self.patch_data:
             raise ValueError("No data loaded. Please call load() first.")
 
-        # Combine all design data
-        all_dfs = []
-        for design_name, data in self.patch_data.items():
-            df = data["df"].copy()
-            df["design_name"] = design_name
-            all_dfs.append(df)
-
-        combined_df = pd.concat(all_dfs, ignore_index=True)
-
-        # Calculate correlation matrix
-        self.correlation_matrix = combined_df[self.correlation_features].corr()
+        if self.streaming:
+            # merge moments of all designs, no raw patchs are kept
+            self.correlation_matrix = StreamingMoments.merge_all(
+                [data["moments"] for data in self.patch_data.values()]
+            ).corr(self.correlation_method)
+        else:
+            # Combine all design data
+            all_dfs = []
+            for design_name, data in self.patch_data.items():
+                df = data["df"].copy()
+                df["design_name"] = design_name
+                all_dfs.append(df)
+
+            combined_df = pd.concat(all_dfs, ignore_index=True)
+
+            # Calculate correlation matrix
+            self.correlation_matrix = combined_df[self.correlation_features].corr(
+                method=self.correlation_method
+            )
 
         # Calculate feature statistics for each design
         for design_name, data in self.patch_data.items():
-            df = data["df"]
-
             stats = {
                 "design": design_name,
                 "display_name": self.dir_to_display_name.get(design_name, design_name),
@@ -600,16 +705,23 @@ class FeatureCorrelationAnalyzer(BaseAnalyzer):
             }
 
             # Calculate statistics for each feature
-            for feature in self.correlation_features:
-                if feature in df.columns:
-                    stats[f"{feature}_mean"] = df[feature].mean()
-                    stats[f"{feature}_std"] = df[feature].std()
-                    stats[f"{feature}_median"] = df[feature].median()
-                    stats[f"{feature}_min"] = df[feature].min()
-                    stats[f"{feature}_max"] = df[feature].max()
-                else:
-                    for suffix in ["_mean", "_std", "_median", "_min", "_max"]:
-                        stats[f"{feature}{suffix}"] = 0.0
+            if self.streaming:
+                for feature in self.correlation_features:
+                    summary = data["moments"].summary(feature)
+                    for suffix in ["mean", "std", "median", "min", "max"]:
+                        stats[f"{feature}_{suffix}"] = summary[suffix]
+            else:
+                df = data["df"]
+                for feature in self.correlation_features:
+                    if feature in df.columns:
+                        stats[f"{feature}_mean"] = df[feature].mean()
+                        stats[f"{feature}_std"] = df[feature].std()
+                        stats[f"{feature}_median"] = df[feature].median()
+                        stats[f"{feature}_min"] = df[feature].min()
+                        stats[f"{feature}_max"] = df[feature].max()
+                    else:
+                        for suffix in ["_mean", "_std", "_median", "_min", "_max"]:
+                            stats[f"{feature}{suffix}"] = 0.0
 
             self.feature_stats[design_name] = stats
 
@@ -794,6 +906,33 @@ class FeatureCorrelationAnalyzer(BaseAnalyzer):
         print(f"Feature distribution plot saved to {output_path}")
 
 
+# features of MapAnalyzer, display name : VectorPatch field name
+MAP_FEATURES = {
+    "Cell Density": "cell_density",
+    "Pin Density": "pin_density",
+    "Congestion": "EGR_congestion",
+    "Timing": "timing_map",
+    "Power": "power_map",
+    "IR Drop": "ir_drop_map",
+    "net density": "net_density",
+    "RUDY": "RUDY_congestion",
+}
+
+
+@cache_inputs("patchs")
+def _extract_map_data(workspace: Workspace, features: List[str]) -> dict:
+    """extract the (features, rows, cols) patch grid and the patch number of a
+    workspace."""
+    vector_loader = create_data_vectors(workspace)
+
+    # only patch scalars are needed
+    patchs = vector_loader.load_patchs(workspace.get_patchs_path(), fields=set())
+    grid = vector_loader.patch_grid(
+        patchs, features=[MAP_FEATURES[feature] for feature in features]
+    )
+    return {"design": workspace.design, "grid": grid, "patch_num": len(patchs)}
+
+
 class MapAnalyzer(BaseAnalyzer):
     """
     Analyzer for visualizing chip layout spatial distribution of features.
@@ -803,25 +942,17 @@ class MapAnalyzer(BaseAnalyzer):
     patterns and hotspots.
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, max_workers: Optional[int] = None, use_cache: bool = True):
+        super().__init__(max_workers, use_cache)
         self.analysis_results = {}
-        self.features = [
-            "Cell Density",
-            "Pin Density",
-            "Congestion",
-            "Timing",
-            "Power",
-            "IR Drop",
-            "net density",
-            "RUDY",
-        ]
+        self.features = list(MAP_FEATURES)
+        self.grids = {}
 
     def load(
         self,
         workspaces: List[Workspace],
         dir_to_display_name: Dict[str, str],
-        pattern: Optional[str],
+        pattern: Optional[str] = None,
     ) -> None:
         """
         Load patch data with spatial position information from multiple directories.
@@ -829,45 +960,27 @@ class MapAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspace
             dir_to_display_name: Mapping from directory names to display names
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
 
         """
         print("Loading patch data with spatial positions...")
 
-        if pattern is None:
-            raise ValueError("Pattern must be specified to find patch files.")
-
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
 
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            patch_db = vector_loader.load_patchs(workspace.get_patchs_path())
-
-            patch_list = []
-            for vec_patch in patch_db:
-                # Extract basic patch features
-                patch_features = {
-                    "design": design_name,
-                    "row_id": vec_patch.patch_id_row,
-                    "col_id": vec_patch.patch_id_col,
-                    "Cell Density": vec_patch.cell_density,
-                    "Pin Density": vec_patch.pin_density,
-                    "Congestion": vec_patch.EGR_congestion,
-                    "Timing": vec_patch.timing_map,
-                    "Power": vec_patch.power_map,
-                    "IR Drop": vec_patch.ir_drop_map,
-                    "net density": vec_patch.net_density,
-                    "RUDY": vec_patch.RUDY_congestion,
-                }
-
-                patch_list.extend([patch_features])
+        # patch grids of all designs in the order of workspaces
+        patch_num = 0
+        for map_data in self.map_workspaces(
+            workspaces, _extract_map_data, self.features
+        ):
+            if map_data is None:
+                continue
+            self.grids[map_data["design"]] = map_data["grid"]
+            patch_num += map_data["patch_num"]
 
-        # create features DataFrame
-        self.data = pd.DataFrame(patch_list)
-        print(f"Loaded {len(self.data)} patches from {len(workspaces)} designs")
+        print(f"Loaded {patch_num} patches from {len(workspaces)} designs")
 
     def analyze(self) -> None:
         """
@@ -876,28 +989,16 @@ class MapAnalyzer(BaseAnalyzer):
         print("Analyzing spatial feature distributions...")
 
         # Analyze each design separately
-        for design in self.data["design"].unique():
-            design_data = self.data[self.data["design"] == design]
-
+        for design, grid in self.grids.items():
             # Determine layout dimensions
-            max_row = design_data["row_id"].max()
-            max_col = design_data["col_id"].max()
-            layout_dims = (max_row + 1, max_col + 1)
+            layout_dims = grid.shape[1:]
 
             print(f"Design {design}: {layout_dims[0]} rows x {layout_dims[1]} columns")
 
-            # Create layout arrays for each feature
-            design_layouts = {}
-            for feature in self.features:
-                layout = np.zeros(layout_dims)
-
-                # Fill layout with feature values
-                for _, patch in design_data.iterrows():
-                    row = int(patch["row_id"])
-                    col = int(patch["col_id"])
-                    layout[row, col] = patch[feature]
-
-                design_layouts[feature] = layout
+            # layouts are views of the feature planes of the patch grid
+            design_layouts = {
+                feature: grid[index] for index, feature in enumerate(self.features)
+            }
 
             # Calculate spatial statistics
             spatial_stats = {}
@@ -12,21 +12,119 @@ from typing import Dict, List, Optional
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from matplotlib import ticker
+from matplotlib import cbook, ticker
 
-from ..data import DataVectors
 from ..workspace import Workspace
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, create_data_vectors
+from .cache import cache_inputs
+from .statistics import BATCH_SIZE, REPORT_QUANTILES, FixedHistogram, QuantileSketch, summarize
 from .utility import save_fig
 
+# path delays of the delay analysis
+DELAY_METRICS = ["inst_delay", "net_delay", "total_delay"]
+
+
+@cache_inputs("wire_paths")
+def _extract_path_data(workspace: Workspace) -> dict:
+    """extract path delay and stage DataFrame of a workspace."""
+    vector_loader = create_data_vectors(workspace)
+
+    wire_paths = vector_loader.load_wire_paths(workspace.get_wire_paths_path())
+
+    path_list = []
+    for wire_path in wire_paths:
+        inst_delay = float(wire_path.inst_delay.sum())
+        net_delay = float(wire_path.net_delay.sum())
+        total_delay = inst_delay + net_delay
+        stage = wire_path.stage
+
+        path_list.append(
+            {
+                "inst_delay": inst_delay,
+                "net_delay": net_delay,
+                "total_delay": total_delay,
+                "stage": stage,
+            }
+        )
+
+    # transform results into DataFrame
+    df = pd.DataFrame(path_list)
+
+    return {
+        "design_name": workspace.design,
+        "df": df,
+        "file_count": len(path_list),
+    }
+
+
+@cache_inputs("wire_paths")
+def _extract_path_sketches(workspace: Workspace) -> dict:
+    """stream wire paths of a workspace into mergeable quantile sketches of path delays
+    and a unit-bin histogram of stages, one wire path is kept in memory at a time."""
+    vector_loader = create_data_vectors(workspace)
+
+    sketches = {metric: QuantileSketch() for metric in DELAY_METRICS}
+    # total delay of paths with stage information, used by the stage analysis
+    staged_delay = QuantileSketch()
+    stages = FixedHistogram(width=1.0)
+
+    path_num = 0
+    delays = []
+    path_stages = []
+
+    def flush():
+        delay_array = np.array(delays, dtype=float).reshape(-1, len(DELAY_METRICS))
+        stage_array = np.array(path_stages, dtype=float)
+        for index, metric in enumerate(DELAY_METRICS):
+            sketches[metric].update(delay_array[:, index])
+        staged_delay.update(delay_array[~np.isnan(stage_array), 2])
+        stages.update(stage_array)
+        delays.clear()
+        path_stages.clear()
+
+    for wire_path in vector_loader.iter_wire_paths(workspace.get_wire_paths_path()):
+        inst_delay = float(wire_path.inst_delay.sum())
+        net_delay = float(wire_path.net_delay.sum())
+        delays.append((inst_delay, net_delay, inst_delay + net_delay))
+        path_stages.append(np.nan if wire_path.stage is None else wire_path.stage)
+        path_num += 1
+
+        if len(delays) >= BATCH_SIZE:
+            flush()
+
+    flush()
+
+    return {
+        "design_name": workspace.design,
+        "sketches": sketches,
+        "staged_delay": staged_delay,
+        "stages": stages,
+        "file_count": path_num,
+    }
+
 
 class DelayAnalyzer(BaseAnalyzer):
     """Analyzer for path delay."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, wire paths are streamed into mergeable
+                quantile sketches instead of being kept in DataFrames
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
         self.path_data = {}
         self.design_stats = {}
+        self.delay_quantiles = {}
 
     def load(
         self,
@@ -40,42 +138,18 @@ class DelayAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspacecontaining net data
             dir_to_display_name: Optional mapping from directory names to display names
-            pattern : File pattern to search for wire path files
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
 
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            path_db = vector_loader.load_timing_paths_metrics(workspace.get_wire_paths_path())
-
-            path_list = []
-            for path_metric in path_db:
-                inst_delay = sum(path_metric.inst_delay)
-                net_delay = sum(path_metric.net_delay)
-                total_delay = inst_delay + net_delay
-                stage = path_metric.stage
-
-                path_list.append(
-                    {
-                        "inst_delay": inst_delay,
-                        "net_delay": net_delay,
-                        "total_delay": total_delay,
-                        "stage": stage,
-                    }
-                )
-
-            # transform results into DataFrame
-            df = pd.DataFrame(path_list)
-
-            self.path_data[design_name] = {
-                "design_name": design_name,
-                "df": df,
-                "file_count": len(path_list),
-            }
+        extract = _extract_path_sketches if self.streaming else _extract_path_data
+        for path_data in self.map_workspaces(workspaces, extract):
+            if path_data is None:
+                continue
+            self.path_data[path_data["design_name"]] = path_data
 
         if not self.path_data:
             raise ValueError("No valid results found from any directory.")
@@ -89,35 +163,48 @@ class DelayAnalyzer(BaseAnalyzer):
         if not self.path_data:
             raise ValueError("No data loaded. Please call load() first.")
 
-        # merge all dataframes into a single DataFrame
-        all_dfs = []
-        for design_name, data in self.path_data.items():
-            df = data["df"].copy()
-            df["design_name"] = design_name
-            all_dfs.append(df)
-
         # compute summary statistics for each design
         for design_name, data in self.path_data.items():
-            df = data["df"]
+            if self.streaming:
+                sketches = data["sketches"]
+                summaries = {
+                    metric: sketches[metric].summary() for metric in DELAY_METRICS
+                }
+                total_delay_box = sketches["total_delay"].box_stats()
+            else:
+                df = data["df"]
+                summaries = {metric: summarize(df[metric].values) for metric in DELAY_METRICS}
+                total_delay_box = cbook.boxplot_stats(df["total_delay"].values)[0]
 
             stats = {
                 "design": design_name,
                 "display_name": self.dir_to_display_name.get(design_name, design_name),
                 "file_count": data["file_count"],
-                "inst_delay_mean": df["inst_delay"].mean(),
-                "inst_delay_median": df["inst_delay"].median(),
-                "inst_delay_std": df["inst_delay"].std(),
-                "net_delay_mean": df["net_delay"].mean(),
-                "net_delay_median": df["net_delay"].median(),
-                "net_delay_std": df["net_delay"].std(),
-                "total_delay_mean": df["total_delay"].mean(),
-                "total_delay_median": df["total_delay"].median(),
-                "total_delay_std": df["total_delay"].std(),
-                "raw_data": df[["inst_delay", "net_delay", "total_delay"]].values,
             }
+            for metric in DELAY_METRICS:
+                stats[f"{metric}_mean"] = summaries[metric]["mean"]
+                stats[f"{metric}_median"] = summaries[metric]["median"]
+                stats[f"{metric}_std"] = summaries[metric]["std"]
+            stats["total_delay_box"] = total_delay_box
+            if not self.streaming:
+                stats["raw_data"] = df[DELAY_METRICS].values
 
             self.design_stats[design_name] = stats
 
+        # quantiles of path delays over all designs
+        for metric in DELAY_METRICS:
+            if self.streaming:
+                self.delay_quantiles[metric] = QuantileSketch.merge_all(
+                    [data["sketches"][metric] for data in self.path_data.values()]
+                ).quantiles(REPORT_QUANTILES)
+            else:
+                self.delay_quantiles[metric] = np.nanquantile(
+                    np.concatenate(
+                        [data["df"][metric].values for data in self.path_data.values()]
+                    ),
+                    REPORT_QUANTILES,
+                )
+
         print(f"Analysis completed for {len(self.design_stats)} designs.")
 
     def report(self) -> str:
@@ -155,6 +242,11 @@ class DelayAnalyzer(BaseAnalyzer):
         report_lines.append(f"- Instance Delay - Mean: {np.mean(all_inst_delays):.3f}, Std: {np.std(all_inst_delays):.3f}")
         report_lines.append(f"- Net Delay - Mean: {np.mean(all_net_delays):.3f}, Std: {np.std(all_net_delays):.3f}")
         report_lines.append(f"- Total Delay - Mean: {np.mean(all_total_delays):.3f}, Std: {np.std(all_total_delays):.3f}")
+        quantiles = ", ".join(
+            f"P{q * 100:g}: {value:.3f}"
+            for q, value in zip(REPORT_QUANTILES, self.delay_quantiles["total_delay"])
+        )
+        report_lines.append(f"- Total Delay Quantiles (all paths) - {quantiles}")
         
         # Per-design summary
         report_lines.append(f"")
@@ -204,20 +296,16 @@ class DelayAnalyzer(BaseAnalyzer):
             10
         )
 
-        delay_data = []
-        display_labels = []
-
+        # boxes are drawn from total delay statistics, raw delays are not needed
+        box_stats = []
         for _, row in top_designs.iterrows():
             design = row["design"]
             if design in self.design_stats:
-                delay_data.append(
-                    self.design_stats[design]["raw_data"][:, 2]
-                )  # total delay
-                display_labels.append(row["display_name"])
+                box = dict(self.design_stats[design]["total_delay_box"])
+                box["label"] = row["display_name"]
+                box_stats.append(box)
 
-        bp = plt.boxplot(
-            delay_data, labels=display_labels, showfliers=False, patch_artist=True
-        )
+        bp = plt.gca().bxp(box_stats, showfliers=False, patch_artist=True)
 
         for box in bp["boxes"]:
             box.set(facecolor="lightblue", alpha=0.8)
@@ -327,10 +415,25 @@ class DelayAnalyzer(BaseAnalyzer):
 class StageAnalyzer(BaseAnalyzer):
     """Analyzer for path stage."""
 
-    def __init__(self):
-        super().__init__()
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        streaming: bool = False,
+        use_cache: bool = True,
+    ):
+        """
+        Args:
+            max_workers: Maximum number of processes extracting workspaces in parallel
+            streaming: Out-of-core mode, stages are counted in mergeable histograms
+                instead of being kept in DataFrames
+            use_cache: Reuse extraction results cached in the analysis directory of
+                unchanged workspaces
+        """
+        super().__init__(max_workers, use_cache)
+        self.streaming = streaming
         self.path_data = {}
         self.design_stats = {}
+        self.stage_histogram = None
 
     def load(
         self,
@@ -344,45 +447,25 @@ class StageAnalyzer(BaseAnalyzer):
         Args:
             workspaces: List of workspacecontaining stage data
             dir_to_display_name: map directory names to display names
-            pattern : File pattern to search for wire path files
+            pattern: Deprecated and ignored, the vectors directories of the workspace
+                paths table are read
         """
+        self.deprecate_pattern(pattern)
         self.dir_to_display_name = dir_to_display_name or {}
         self.workspaces = workspaces
 
-        for workspace in workspaces:
-            design_name = workspace.design
-
-            vector_loader = DataVectors(workspace)
-
-            path_db = vector_loader.load_timing_paths_metrics(workspace.get_wire_paths_path())
-
-            path_list = []
-            for path_metric in path_db:
-                inst_delay = sum(path_metric.inst_delay)
-                net_delay = sum(path_metric.net_delay)
-                total_delay = inst_delay + net_delay
-                stage = path_metric.stage
-
-                path_list.append(
-                    {
-                        "inst_delay": inst_delay,
-                        "net_delay": net_delay,
-                        "total_delay": total_delay,
-                        "stage": stage,
-                    }
-                )
-
-            # transform results into DataFrame
-            df = pd.DataFrame(path_list)
-
-            # filter out rows without stage information
-            df_with_stage = df.dropna(subset=["stage"])
-
-            self.path_data[design_name] = {
-                "design_name": design_name,
-                "df": df_with_stage,
-                "file_count": len(path_list),
-            }
+        if self.streaming:
+            for path_data in self.map_workspaces(workspaces, _extract_path_sketches):
+                if path_data is None:
+                    continue
+                self.path_data[path_data["design_name"]] = path_data
+        else:
+            for path_data in self.map_workspaces(workspaces, _extract_path_data):
+                if path_data is None:
+                    continue
+                # filter out rows without stage information
+                path_data["df"] = path_data["df"].dropna(subset=["stage"])
+                self.path_data[path_data["design_name"]] = path_data
 
         if not self.path_data:
             raise ValueError("No valid results found from any directory.")
@@ -396,34 +479,40 @@ class StageAnalyzer(BaseAnalyzer):
         if not self.path_data:
             raise ValueError("No data loaded. Please call load() first.")
 
-        # merge all dataframes into a single DataFrame
-        all_dfs = []
-        for design_name, data in self.path_data.items():
-            df = data["df"].copy()
-            df["design_name"] = design_name
-            all_dfs.append(df)
-
         # compute summary statistics for each design
         for design_name, data in self.path_data.items():
-            df = data["df"]
-
-            # randomly select an example row
-            example_idx = np.random.randint(0, len(df))
+            if self.streaming:
+                stage = data["stages"].summary()
+                total_delay = data["staged_delay"].summary()
+            else:
+                df = data["df"]
+                stage = summarize(df["stage"].values)
+                total_delay = summarize(df["total_delay"].values)
 
             stats = {
                 "design": design_name,
                 "display_name": self.dir_to_display_name.get(design_name, design_name),
                 "file_count": data["file_count"],
-                "stage_mean": df["stage"].mean(),
-                "stage_median": df["stage"].median(),
-                "stage_std": df["stage"].std(),
-                "stage_min": df["stage"].min(),
-                "stage_max": df["stage"].max(),
-                "total_delay_mean": df["total_delay"].mean(),
+                "stage_mean": stage["mean"],
+                "stage_median": stage["median"],
+                "stage_std": stage["std"],
+                "stage_min": stage["min"],
+                "stage_max": stage["max"],
+                "total_delay_mean": total_delay["mean"],
             }
 
             self.design_stats[design_name] = stats
 
+        # stage distribution over all designs
+        if self.streaming:
+            self.stage_histogram = FixedHistogram.merge_all(
+                [data["stages"] for data in self.path_data.values()]
+            )
+        else:
+            self.stage_histogram = FixedHistogram(width=1.0)
+            for data in self.path_data.values():
+                self.stage_histogram.update(data["df"]["stage"].values)
+
         print(f"Analysis completed for {len(self.design_stats)} designs.")
 
     def report(self) -> str:
@@ -462,6 +551,11 @@ class StageAnalyzer(BaseAnalyzer):
         report_lines.append(f"**STAGE STATISTICS SUMMARY**")
         report_lines.append(f"- Average Stage Count - Mean: {np.mean(all_stage_means):.2f}, Std: {np.std(all_stage_means):.2f}")
         report_lines.append(f"- Stage Range - Min: {min(all_stage_mins)}, Max: {max(all_stage_maxs)}")
+        quantiles = ", ".join(
+            f"P{q * 100:g}: {self.stage_histogram.quantile(q):g}"
+            for q in REPORT_QUANTILES
+        )
+        report_lines.append(f"- Stage Quantiles (all paths) - {quantiles}")
         report_lines.append(f"- Total Delay - Mean: {np.mean(all_delay_means):.3f}, Std: {np.std(all_delay_means):.3f}")
         
         # Per-design summary
@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : statistics.py
+@Author : yhqiu
+@Desc : streaming statistics accumulators, mergeable across workspace workers
+"""
+
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+# rows kept by the sample of StreamingMoments, used by approximate Spearman
+# correlation and medians
+SAMPLE_SIZE = 10000
+
+# rows accumulated before a batch update when streaming rows one by one
+BATCH_SIZE = 65536
+
+# size parameter of QuantileSketch, the rank error is about 1.7 / SKETCH_K
+SKETCH_K = 200
+
+# quantiles shown by distribution reports
+REPORT_QUANTILES = [0.5, 0.9, 0.99]
+
+
+class StreamingMoments:
+    """
+    Streaming count, mean, covariance, min and max of numeric columns.
+
+    Rows are accumulated in batches and batches are combined by the parallel Welford
+    update (Chan et al.), so accumulators built by different workers can be merged
+    without the raw rows. Rows with any nan value are skipped, i.e. statistics use
+    complete rows only.
+
+    A bounded uniform sample of rows is kept alongside, it gives approximate Spearman
+    correlation and medians.
+    """
+
+    def __init__(
+        self, columns: List[str], sample_size: int = SAMPLE_SIZE, seed: int = 0
+    ):
+        self.columns = list(columns)
+        self.sample_size = sample_size
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        # sum of products of deviations from the mean
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+        self.min = np.full(len(self.columns), np.inf)
+        self.max = np.full(len(self.columns), -np.inf)
+        self.sample = np.zeros((0, len(self.columns)))
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, rows) -> "StreamingMoments":
+        """accumulate a batch of rows, array of shape (rows, columns)."""
+        rows = np.asarray(rows, dtype=float).reshape(-1, len(self.columns))
+        rows = rows[~np.isnan(rows).any(axis=1)]
+        if len(rows) == 0:
+            return self
+
+        self._update_sample(rows)
+
+        batch = StreamingMoments(self.columns, sample_size=0)
+        batch.count = len(rows)
+        batch.mean = rows.mean(axis=0)
+        deviation = rows - batch.mean
+        batch.comoment = deviation.T @ deviation
+        batch.min = rows.min(axis=0)
+        batch.max = rows.max(axis=0)
+        self._merge_moments(batch)
+        return self
+
+    def update_rows(self, rows: Iterable, batch_size: int = BATCH_SIZE):
+        """accumulate an iterable of rows, each row is a sequence of column values,
+        None values are treated as nan."""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                self.update(np.array(batch, dtype=float))
+                batch = []
+        if batch:
+            self.update(np.array(batch, dtype=float))
+        return self
+
+    def merge(self, other: "StreamingMoments") -> "StreamingMoments":
+        """merge the accumulator of other rows, e.g. built by another worker."""
+        if other.columns != self.columns:
+            raise ValueError("merge moments of different columns")
+
+        self._merge_sample(other)
+        self._merge_moments(other)
+        return self
+
+    @classmethod
+    def merge_all(cls, moments_list: List["StreamingMoments"]) -> "StreamingMoments":
+        """merge accumulators in order into a new accumulator."""
+        merged = cls(moments_list[0].columns, sample_size=moments_list[0].sample_size)
+        for moments in moments_list:
+            merged.merge(moments)
+        return merged
+
+    @property
+    def var(self) -> np.ndarray:
+        """sample variance of columns, ddof is 1 as pandas."""
+        if self.count < 2:
+            return np.full(len(self.columns), np.nan)
+        return np.diag(self.comoment) / (self.count - 1)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.var)
+
+    def cov(self) -> pd.DataFrame:
+        cov = (
+            self.comoment / (self.count - 1)
+            if self.count > 1
+            else np.full_like(self.comoment, np.nan)
+        )
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def corr(self, method: str = "pearson") -> pd.DataFrame:
+        """
+        Correlation matrix of columns.
+
+        Args:
+            method: "pearson" is exact over all accumulated rows, "spearman" is
+                approximated by the rank correlation of the sample
+        """
+        if method == "spearman":
+            return pd.DataFrame(self.sample, columns=self.columns).corr(
+                method="spearman"
+            )
+        if method != "pearson":
+            raise ValueError(f"Unsupported correlation method: {method}")
+
+        diagonal = np.diag(self.comoment)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.sqrt(np.outer(diagonal, diagonal))
+        return pd.DataFrame(
+            np.clip(corr, -1.0, 1.0), index=self.columns, columns=self.columns
+        )
+
+    def median(self) -> np.ndarray:
+        """approximate medians of columns from the sample."""
+        if len(self.sample) == 0:
+            return np.full(len(self.columns), np.nan)
+        return np.median(self.sample, axis=0)
+
+    def summary(self, column: str) -> dict:
+        """count, mean, std, median, min and max of a column."""
+        index = self.columns.index(column)
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "mean": np.nan if empty else self.mean[index],
+            "std": self.std[index],
+            "median": self.median()[index],
+            "min": np.nan if empty else self.min[index],
+            "max": np.nan if empty else self.max[index],
+        }
+
+    def _merge_moments(self, other: "StreamingMoments"):
+        if other.count == 0:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / count)
+        self.comoment = (
+            self.comoment
+            + other.comoment
+            + np.outer(delta, delta) * (self.count * other.count / count)
+        )
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.count = count
+
+    def _update_sample(self, rows: np.ndarray):
+        """reservoir sampling of the batch, self.count is the rows seen before."""
+        if self.sample_size <= 0:
+            return
+
+        # fill the reservoir first
+        fill = min(self.sample_size - len(self.sample), len(rows))
+        if fill > 0:
+            self.sample = np.vstack([self.sample, rows[:fill]])
+
+        # then row t replaces a random slot with probability sample_size / t
+        rest = rows[fill:]
+        if len(rest):
+            seen = self.count + fill + np.arange(1, len(rest) + 1)
+            slots = (self.rng.random(len(rest)) * seen).astype(np.int64)
+            mask = slots < self.sample_size
+            self.sample[slots[mask]] = rest[mask]
+
+    def _merge_sample(self, other: "StreamingMoments"):
+        """sample rows of both accumulators in proportion to their row counts."""
+        if self.sample_size <= 0 or other.count == 0:
+            return
+
+        count = self.count + other.count
+        size = min(self.sample_size, len(self.sample) + len(other.sample))
+        self_size = min(len(self.sample), int(round(size * self.count / count)))
+        other_size = min(len(other.sample), size - self_size)
+        self_size = min(len(self.sample), size - other_size)
+
+        self.sample = np.vstack(
+            [
+                self._choice(self.sample, self_size),
+                self._choice(other.sample, other_size),
+            ]
+        )
+
+    def _choice(self, sample: np.ndarray, size: int) -> np.ndarray:
+        if size >= len(sample):
+            return sample
+        return sample[np.sort(self.rng.choice(len(sample), size, replace=False))]
+
+
+def summarize(values) -> dict:
+    """exact count, mean, std, median, min and max of values, the in-memory counterpart
+    of QuantileSketch.summary, nan values are skipped."""
+    values = np.asarray(values, dtype=float).ravel()
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {
+            "count": 0,
+            "mean": np.nan,
+            "std": np.nan,
+            "median": np.nan,
+            "min": np.nan,
+            "max": np.nan,
+        }
+
+    return {
+        "count": len(values),
+        "mean": values.mean(),
+        "std": values.std(ddof=1) if len(values) > 1 else np.nan,
+        "median": np.median(values),
+        "min": values.min(),
+        "max": values.max(),
+    }
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch of a numeric stream, with exact count, mean,
+    variance, min and max.
+
+    Values are kept in compactor levels, an item of level h stands for 2^h values.
+    A full level is sorted and every other item is promoted to the next level, so the
+    sketch keeps O(k log(n / k)) items. Quantiles are exact until the first
+    compaction, i.e. for streams shorter than about k values.
+    """
+
+    def __init__(self, k: int = SKETCH_K, seed: int = 0):
+        self.k = k
+        self.levels = [np.zeros(0)]
+        self.count = 0
+        self.mean = 0.0
+        # sum of squared deviations from the mean
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values) -> "QuantileSketch":
+        """accumulate a batch of values, nan values are skipped."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        mean = values.mean()
+        self._merge_moments(
+            len(values), mean, np.sum((values - mean) ** 2), values.min(), values.max()
+        )
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """merge the sketch of other values, e.g. built by another worker."""
+        if other.count == 0:
+            return self
+
+        self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.zeros(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+        return self
+
+    @classmethod
+    def merge_all(cls, sketches: List["QuantileSketch"]) -> "QuantileSketch":
+        merged = cls(k=sketches[0].k if sketches else SKETCH_K)
+        for sketch in sketches:
+            merged.merge(sketch)
+        return merged
+
+    @property
+    def std(self) -> float:
+        """sample standard deviation, ddof is 1 as pandas."""
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: List[float]) -> np.ndarray:
+        if self.count == 0:
+            return np.full(len(qs), np.nan)
+
+        # no compaction yet, the quantiles are exact
+        if len(self.levels) == 1:
+            return np.quantile(self.levels[0], qs)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(level), 2.0**index) for index, level in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items = items[order]
+        ranks = np.cumsum(weights[order])
+
+        indexes = np.searchsorted(ranks, np.asarray(qs) * ranks[-1], side="left")
+        return items[np.minimum(indexes, len(items) - 1)]
+
+    def summary(self) -> dict:
+        """count, mean, std, median, min and max of the values."""
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "mean": np.nan if empty else self.mean,
+            "std": self.std,
+            "median": self.quantile(0.5),
+            "min": np.nan if empty else self.min,
+            "max": np.nan if empty else self.max,
+        }
+
+    def box_stats(self, label: str = None) -> dict:
+        """boxplot statistics for matplotlib bxp, whiskers extend to 1.5 IQR within the
+        range of values."""
+        q1, median, q3 = self.quantiles([0.25, 0.5, 0.75])
+        iqr = q3 - q1
+        return {
+            "label": label,
+            "q1": q1,
+            "med": median,
+            "q3": q3,
+            "whislo": max(self.min, q1 - 1.5 * iqr),
+            "whishi": min(self.max, q3 + 1.5 * iqr),
+            "fliers": [],
+        }
+
+    def _merge_moments(self, count, mean, m2, min_value, max_value):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.count * count / total
+        self.min = min(self.min, min_value)
+        self.max = max(self.max, max_value)
+        self.count = total
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels)
+        return max(2, int(np.ceil(self.k * (2.0 / 3.0) ** (depth - 1 - level))))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.zeros(0))
+
+                items = np.sort(items)
+                # an odd item stays in the level
+                keep = len(items) % 2
+                promoted = items[keep:][self.rng.integers(2) :: 2]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], promoted]
+                )
+                self.levels[level] = items[:keep]
+            level += 1
+
+
+class FixedHistogram:
+    """
+    Mergeable histogram with fixed-width bins [low + i * width, low + (i + 1) * width).
+
+    Bins are aligned to low and width, so histograms of different workers merge by
+    adding counts, the bins grow to cover new values. Statistics take each value as
+    the start of its bin, which is exact for integer values with width 1, e.g. stages.
+    """
+
+    def __init__(self, width: float = 1.0, low: float = 0.0):
+        self.width = width
+        self.low = low
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def count(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self.low + self.width * np.arange(len(self.counts) + 1)
+
+    def update(self, values) -> "FixedHistogram":
+        """accumulate a batch of values, nan values and values below low are skipped."""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values) & (values >= self.low)]
+        if len(values) == 0:
+            return self
+
+        bins = np.floor((values - self.low) / self.width).astype(np.int64)
+        self._add(np.bincount(bins))
+        return self
+
+    def merge(self, other: "FixedHistogram") -> "FixedHistogram":
+        if other.width != self.width or other.low != self.low:
+            raise ValueError("merge histograms of different bins")
+        self._add(other.counts)
+        return self
+
+    @classmethod
+    def merge_all(cls, histograms: List["FixedHistogram"]) -> "FixedHistogram":
+        merged = cls(histograms[0].width, histograms[0].low)
+        for histogram in histograms:
+            merged.merge(histogram)
+        return merged
+
+    def quantile(self, q: float) -> float:
+        """q quantile of the values, interpolated linearly between the two nearest
+        order statistics as numpy.quantile does."""
+        count = self.count
+        if count == 0:
+            return np.nan
+        ranks = np.cumsum(self.counts)
+        position = q * (count - 1)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, count - 1)
+        # the value of 0-based order statistic k starts the first bin with rank > k
+        lower_value, upper_value = self.edges[
+            np.searchsorted(ranks, [lower, upper], side="right")
+        ]
+        return lower_value + (position - lower) * (upper_value - lower_value)
+
+    def summary(self) -> dict:
+        """count, mean, std, median, min and max of the values."""
+        count = self.count
+        if count == 0:
+            return {
+                "count": 0,
+                "mean": np.nan,
+                "std": np.nan,
+                "median": np.nan,
+                "min": np.nan,
+                "max": np.nan,
+            }
+
+        values = self.edges[:-1]
+        mean = np.sum(values * self.counts) / count
+        variance = (
+            np.sum(self.counts * (values - mean) ** 2) / (count - 1)
+            if count > 1
+            else np.nan
+        )
+        nonzero = np.flatnonzero(self.counts)
+        return {
+            "count": count,
+            "mean": mean,
+            "std": np.sqrt(variance),
+            "median": self.quantile(0.5),
+            "min": values[nonzero[0]],
+            "max": values[nonzero[-1]],
+        }
+
+    def _add(self, counts: np.ndarray):
+        if len(counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(counts) - len(self.counts)))
+        self.counts[: len(counts)] += counts
@@ -2,15 +2,19 @@ from . import database
 from . import io
 from . import feature
 from . import vectors
+from . import corpus
 from .feature import DataFeature
 from .vectors import DataVectors
+from .corpus import DataCorpus
 
 __all__ = [
     'database',
     'io',
     'feature', 
     'vectors',
+    'corpus',
     'DataFeature',
     'DataVectors',
+    'DataCorpus',
 ]
 
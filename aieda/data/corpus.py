@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : corpus.py
+@Author : yell
+@Desc : data corpus api, vectors of many designs merged into one dataset
+"""
+from typing import List
+
+import numpy as np
+
+from ..workspace.workspace import Workspace
+from ..utility.log import Logger
+from .io import VectorsCorpus
+from .io.vectors_corpus import SHARD_ROWS
+from .vectors import DataVectors
+
+# tables of the corpus
+CORPUS_TABLES = ["nets", "wire_paths"]
+
+
+class DataCorpus:
+    """merge vectors of workspaces into a sharded columnar corpus, then select designs
+    and random-access rows without reading the vectors json files.
+
+    nets : one row per net, the scalar columns of VectorNetsColumnar nets table, with
+        ragged column layer_ratio
+    wire_paths : one row per timing wire path, path_hash and stage columns, with ragged
+        columns values (C/slew/R of nodes), incr and incr_is_net
+    """
+
+    def __init__(
+        self, corpus_dir: str, shard_rows: int = SHARD_ROWS, logger: Logger = None
+    ):
+        self.corpus = VectorsCorpus(corpus_dir, shard_rows=shard_rows, logger=logger)
+        self.logger = self.corpus.logger
+
+    def build(
+        self,
+        workspaces: List[Workspace],
+        tables: list = CORPUS_TABLES,
+        names: List[str] = None,
+    ):
+        """build the corpus from workspaces, the old corpus is removed.
+        names : unique design labels of workspaces, default are the workspace designs,
+            required if workspaces have the same design name
+        """
+        if names is None:
+            names = [workspace.design for workspace in workspaces]
+        if len(names) != len(workspaces):
+            raise ValueError("names and workspaces have different lengths")
+        if len(set(names)) != len(names):
+            raise ValueError(
+                "duplicate design names {}, give unique names".format(
+                    sorted({name for name in names if names.count(name) > 1})
+                )
+            )
+
+        self.corpus.create()
+
+        for name, workspace in zip(names, workspaces):
+            data_vectors = DataVectors(workspace)
+            design_tables = {}
+
+            if "nets" in tables:
+                design_tables["nets"] = self._nets_table(data_vectors)
+            if "wire_paths" in tables:
+                design_tables["wire_paths"] = self._wire_paths_table(data_vectors)
+
+            self.corpus.add_design(name, workspace.directory, design_tables)
+
+        self.corpus.write()
+        return self
+
+    def load(self):
+        return self.corpus.read()
+
+    @property
+    def designs(self) -> list:
+        return [design["name"] for design in self.corpus.designs]
+
+    def design_rows(self, table: str, design: str):
+        """global [start, end) rows of design in table."""
+        return self.corpus.design_rows(table, design)
+
+    def select(self, table: str, designs: list = None) -> np.ndarray:
+        """global rows of designs in table, all rows if designs is None."""
+        return self.corpus.select(table, designs)
+
+    def column(self, table: str, name: str, rows=None) -> np.ndarray:
+        return self.corpus.column(table, name, rows)
+
+    def columns(self, table: str, names: list, rows=None) -> dict:
+        return {name: self.corpus.column(table, name, rows) for name in names}
+
+    def ragged(self, table: str, name: str, row: int) -> np.ndarray:
+        return self.corpus.ragged(table, name, row)
+
+    def design_of(self, table: str, rows) -> list:
+        """design name of each global row."""
+        return [
+            self.corpus.designs[index]["name"]
+            for index in self.corpus.design_of(table, rows)
+        ]
+
+    def _nets_table(self, data_vectors: DataVectors):
+        columnar = data_vectors.load_nets_columnar()
+        if columnar.net_num == 0:
+            return {}, {}
+
+        columns = {
+            name: values
+            for name, values in columnar.nets.items()
+            if name != "layer_ratio" and not name.endswith("_offset")
+        }
+        ragged = {
+            "layer_ratio": (
+                columnar.nets["layer_ratio"],
+                columnar.nets["layer_ratio_offset"],
+            )
+        }
+        return columns, ragged
+
+    def _wire_paths_table(self, data_vectors: DataVectors):
+        packed = data_vectors.load_wire_paths_packed()
+        if packed.path_num == 0:
+            return {}, {}
+
+        columns = {"path_hash": packed.path_hash, "stage": packed.stage}
+        ragged = {
+            "values": (packed.values, packed.value_offset),
+            "incr": (packed.incr, packed.incr_offset),
+            "incr_is_net": (packed.incr_is_net, packed.incr_offset),
+        }
+        return columns, ragged
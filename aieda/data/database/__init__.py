@@ -60,6 +60,7 @@ from .eda import (
 
 # eda evaluation feature data structure from iEDA
 from .eda import (
+    FeatureCsvMaps,
     FeatureWirelength,
     FeatureDensityCell,
     FeatureDensityMargin,
@@ -95,6 +96,12 @@ from .vectors import (
     VectorNetRoutingEdge,
     VectorNetRoutingGraph,
     VectorNet,
+    VectorNetsColumnar,
+    VectorNodeView,
+    NodeTable,
+    VectorWireView,
+    WireTable,
+    VectorNetView,
     VectorPatchLayer,
     VectorPatch,
     VectorTimingWireGraphNode,
@@ -102,6 +109,8 @@ from .vectors import (
     VectorTimingWireGraph,
     VectorTimingWirePathGraph,
     VectorTimingWirePathData,
+    VectorTimingWirePath,
+    VectorWirePathsPacked,
     VectorLayers,
     VectorLayer,
     VectorVias,
@@ -113,6 +122,8 @@ from .vectors import (
     VectorInstanceGraphNode,
     VectorInstanceGraphEdge,
     VectorInstanceGraph,
+    VectorGraphArrays,
+    VectorNameTable,
     VectorPathMetrics,
     VectorViaRect,
 )
@@ -204,6 +215,12 @@ __all__ = [
     'VectorNetRoutingEdge',
     'VectorNetRoutingGraph',
     'VectorNet',
+    'VectorNetsColumnar',
+    'VectorNodeView',
+    'NodeTable',
+    'VectorWireView',
+    'WireTable',
+    'VectorNetView',
     'VectorPatchLayer',
     'VectorPatch',
     'VectorTimingWireGraphNode',
@@ -211,6 +228,8 @@ __all__ = [
     'VectorTimingWireGraph',
     'VectorTimingWirePathGraph',
     'VectorTimingWirePathData',
+    'VectorTimingWirePath',
+    'VectorWirePathsPacked',
     'VectorPathMetrics',
     'VectorLayers',
     'VectorLayer',
@@ -224,4 +243,6 @@ __all__ = [
     'VectorInstanceGraphNode',
     'VectorInstanceGraphEdge',
     'VectorInstanceGraph',
+    'VectorGraphArrays',
+    'VectorNameTable',
 ]
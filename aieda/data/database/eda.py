@@ -511,10 +511,85 @@ class FeatureTools(object):
 """
 ##########################################################################################
 from enum import Enum
-from typing import List
+from typing import ClassVar, List
+import hashlib
+import os
 import numpy as np
 
 
+def csv_map_cache_path(csv_path: str, cache_dir: str):
+    """.npy path of a converted csv map in cache_dir, named by the csv absolute path."""
+    digest = hashlib.sha1(os.path.abspath(csv_path).encode("utf-8")).hexdigest()
+    return "{}/{}.npy".format(cache_dir, digest)
+
+
+def convert_csv_map(csv_path: str, cache_dir: str):
+    """convert csv map to a .npy file in cache_dir, the .npy file is kept if it is
+    not older than the csv. return the .npy path, None if csv_path is empty."""
+    if not csv_path or not csv_path.strip():
+        return None
+
+    npy_path = csv_map_cache_path(csv_path, cache_dir)
+    if (
+        not os.path.isfile(npy_path)
+        or os.path.getmtime(npy_path) < os.path.getmtime(csv_path)
+    ):
+        data = np.loadtxt(csv_path, delimiter=",")
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first, maps may be converted in parallel
+        tmp_path = "{}.{}.tmp.npy".format(os.path.splitext(npy_path)[0], os.getpid())
+        np.save(tmp_path, data)
+        os.replace(tmp_path, npy_path)
+
+    return npy_path
+
+
+def load_csv_map(csv_path: str, cache_dir: str = None, mmap: bool = True):
+    """load csv map as numpy array, nothing is written.
+    if the map is converted to cache_dir by convert_csv_map and not older than the csv,
+    the .npy file is memory-mapped read only by default, so only touched pages are
+    read, else the csv is parsed in memory."""
+    if not csv_path or not csv_path.strip():
+        return None
+
+    if cache_dir is not None:
+        npy_path = csv_map_cache_path(csv_path, cache_dir)
+        if os.path.isfile(npy_path) and os.path.getmtime(
+            npy_path
+        ) >= os.path.getmtime(csv_path):
+            return np.load(npy_path, mmap_mode="r" if mmap else None)
+
+    return np.loadtxt(csv_path, delimiter=",")
+
+
+class FeatureCsvMaps(object):
+    """base of features with csv map paths, attribute <path field>_data is the map
+    array of the csv path, loaded by load_csv_map on first access.
+    csv_cache_dir is the directory of maps converted by convert_maps, maps converted
+    there are memory-mapped instead of parsed."""
+
+    csv_cache_dir: ClassVar[str] = None
+
+    def __getattr__(self, name):
+        # only called for attributes not found, i.e. maps not loaded yet
+        if name.endswith("_data") and name[: -len("_data")] in self.__dataclass_fields__:
+            data = load_csv_map(getattr(self, name[: -len("_data")]), self.csv_cache_dir)
+            object.__setattr__(self, name, data)
+            return data
+
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
+    def convert_maps(self, cache_dir: str):
+        """convert the csv maps to .npy files in cache_dir and use them from now on."""
+        for name in self.__dataclass_fields__:
+            convert_csv_map(getattr(self, name), cache_dir)
+            # drop maps loaded before conversion
+            self.__dict__.pop(name + "_data", None)
+        self.csv_cache_dir = cache_dir
+
+
 # wirelength
 @dataclass
 class FeatureWirelength(object):
@@ -527,51 +602,35 @@ class FeatureWirelength(object):
 
 # density
 @dataclass
-class FeatureDensityCell(object):
-    # csv map path
+class FeatureDensityCell(FeatureCsvMaps):
+    # csv map path, map array is <path field>_data
     allcell_density: str = None
     macro_density: str = None
     stdcell_density: str = None
-    # csv map value
-    allcell_density_data: np.ndarray = None
-    macro_density_data: np.ndarray = None
-    stdcell_density_data: np.ndarray = None
 
 
 @dataclass
-class FeatureDensityMargin(object):
-    # csv map path
+class FeatureDensityMargin(FeatureCsvMaps):
+    # csv map path, map array is <path field>_data
     horizontal: str = None
     union: str = None
     vertical: str = None
-    # csv map value
-    horizontal_data: np.ndarray = None
-    union_data: np.ndarray = None
-    vertical_data: np.ndarray = None
 
 
 @dataclass
-class FeatureDensityNet(object):
-    # csv map path
+class FeatureDensityNet(FeatureCsvMaps):
+    # csv map path, map array is <path field>_data
     allnet_density: str = None
     global_net_density: str = None
     local_net_density: str = None
-    # csv map value
-    allnet_density_data: np.ndarray = None
-    global_net_density_data: np.ndarray = None
-    local_net_density_data: np.ndarray = None
 
 
 @dataclass
-class FeatureDensityPin(object):
-    # csv map path
+class FeatureDensityPin(FeatureCsvMaps):
+    # csv map path, map array is <path field>_data
     allcell_pin_density: str = None
     macro_pin_density: str = None
     stdcell_pin_density: str = None
-    # csv map value
-    allcell_pin_density_data: np.ndarray = None
-    macro_pin_density_data: np.ndarray = None
-    stdcell_pin_density_data: np.ndarray = None
 
 
 @dataclass
@@ -584,15 +643,11 @@ class FeatureDensity(object):
 
 # congestion
 @dataclass
-class FeatureCongestionMapBase(object):
-    # csv map path
+class FeatureCongestionMapBase(FeatureCsvMaps):
+    # csv map path, map array is <path field>_data
     horizontal: str = None
     union: str = None
     vertical: str = None
-    # csv map value
-    horizontal_data: np.ndarray = None
-    union_data: np.ndarray = None
-    vertical_data: np.ndarray = None
 
 
 @dataclass
@@ -8,10 +8,15 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Dict
 
+import numpy as np
 
-@dataclass
+# missing integer values in columnar tables, missing float values are nan
+INT_NONE = -1
+
+
+@dataclass(slots=True)
 class VectorNode:
     id: Optional[int] = None
     x: Optional[int] = None
@@ -24,14 +29,14 @@ class VectorNode:
     pin_id: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorPath:
     node1: Optional[VectorNode] = None
     node2: Optional[VectorNode] = None
     via: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorWireFeature:
     wire_width: Optional[int] = None
     wire_len: Optional[int] = None
@@ -46,7 +51,7 @@ class VectorWireFeature:
     drc_type: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorWire:
     id: Optional[int] = None
     feature: Optional[VectorWireFeature] = None
@@ -55,15 +60,35 @@ class VectorWire:
     paths: List[VectorPath] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorPin:
     id: Optional[int] = None
-    pin_name: Optional[str] = None
-    instance: Optional[str] = None
     is_driver: Optional[str] = None
-
-
-@dataclass
+    # ids in name_table, node_id is the id of timing node name "instance:pin_name"
+    pin_name_id: Optional[int] = None
+    instance_id: Optional[int] = None
+    node_id: Optional[int] = None
+    # names of the ids, shared by the pins of a file or of a workspace
+    name_table: Optional["VectorNameTable"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def pin_name(self) -> Optional[str]:
+        """pin name resolved from pin_name_id."""
+        if self.name_table is None:
+            return None
+        return self.name_table.name(self.pin_name_id)
+
+    @property
+    def instance(self) -> Optional[str]:
+        """instance name resolved from instance_id."""
+        if self.name_table is None:
+            return None
+        return self.name_table.name(self.instance_id)
+
+
+@dataclass(slots=True)
 class VectorPlaceFeature:
     pin_num: Optional[int] = None
     aspect_ratio: Optional[float] = None
@@ -74,7 +99,7 @@ class VectorPlaceFeature:
     rsmt: Optional[float] = None
     hpwl: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True)
 class VectorNetFeature:
     llx: Optional[int] = None
     lly: Optional[int] = None
@@ -99,7 +124,7 @@ class VectorNetFeature:
     place_feature: Optional[VectorPlaceFeature] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorNetRoutingPoint:
     x: int
     y: int
@@ -120,7 +145,7 @@ class VectorNetRoutingPoint:
         return hash((self.x, self.y, self.layer_id))
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorNetRoutingVertex:
     id: int
     is_pin: bool
@@ -128,7 +153,7 @@ class VectorNetRoutingVertex:
     point: VectorNetRoutingPoint
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorNetRoutingEdge:
     source_id: int
     target_id: int
@@ -141,7 +166,7 @@ class VectorNetRoutingGraph:
     edges: List[VectorNetRoutingEdge]
 
 
-@dataclass
+@dataclass(slots=True)
 class VectorNet:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -154,6 +179,281 @@ class VectorNet:
 
 
 @dataclass
+class VectorNetsColumnar(object):
+    """nets stored as struct-of-arrays tables, rows of child tables are grouped by net.
+
+    nets : one row per net, pin_offset / wire_offset index into pins / wires
+    pins : one row per pin, net_index is the row of the owner net
+    wires : one row per wire, path_offset indexes into paths
+    paths : one row per wire path, wire_index is the row of the owner wire
+    """
+
+    nets: Dict[str, np.ndarray] = field(default_factory=dict)
+    pins: Dict[str, np.ndarray] = field(default_factory=dict)
+    wires: Dict[str, np.ndarray] = field(default_factory=dict)
+    paths: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def net_num(self) -> int:
+        return len(self.nets["id"]) if "id" in self.nets else 0
+
+    def pin_slice(self, net_index: int) -> slice:
+        offset = self.nets["pin_offset"]
+        return slice(int(offset[net_index]), int(offset[net_index + 1]))
+
+    def wire_slice(self, net_index: int) -> slice:
+        offset = self.nets["wire_offset"]
+        return slice(int(offset[net_index]), int(offset[net_index + 1]))
+
+    def path_slice(self, wire_index: int) -> slice:
+        offset = self.wires["path_offset"]
+        return slice(int(offset[wire_index]), int(offset[wire_index + 1]))
+
+    @property
+    def wire_table(self):
+        return WireTable(self)
+
+    def net(self, net_index: int):
+        """VectorNet view of a net row."""
+        return VectorNetView(self, net_index)
+
+    def iter_nets(self):
+        for net_index in range(self.net_num):
+            yield VectorNetView(self, net_index)
+
+
+def _int_value(column: np.ndarray, row: int):
+    value = int(column[row])
+    return None if value == INT_NONE else value
+
+
+def _float_value(column: np.ndarray, row: int):
+    value = float(column[row])
+    return None if np.isnan(value) else value
+
+
+class VectorNodeView(object):
+    """read-only VectorNode backed by a row of node columns, node columns are
+    named <field>1 / <field>2 in wires and paths tables."""
+
+    __slots__ = ("_table", "_row", "_index")
+
+    FIELDS = ["id", "x", "y", "real_x", "real_y", "row", "col", "layer", "pin_id"]
+
+    def __init__(self, table: Dict[str, np.ndarray], row: int, index: int):
+        # underscore names, "row" is also a node field
+        self._table = table
+        self._row = row
+        self._index = index
+
+    def __getattr__(self, name):
+        if name not in VectorNodeView.FIELDS:
+            raise AttributeError(name)
+
+        value = int(self._table["{}{}".format(name, self._index)][self._row])
+        # -1 is a valid pin_id in vectors, which means the node is not a pin
+        if value == INT_NONE and name != "pin_id":
+            return None
+        return value
+
+    def __repr__(self):
+        return "VectorNodeView({})".format(
+            ", ".join(
+                "{}={}".format(name, getattr(self, name))
+                for name in VectorNodeView.FIELDS
+            )
+        )
+
+
+class NodeTable(object):
+    """node1 or node2 columns of wires or paths table."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: Dict[str, np.ndarray], index: int):
+        self.table = table
+        self.index = index
+
+    def __len__(self):
+        return len(self.table["id{}".format(self.index)])
+
+    def __getitem__(self, row: int) -> VectorNodeView:
+        return VectorNodeView(self.table, row, self.index)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.table["{}{}".format(name, self.index)]
+
+
+class VectorWireView(object):
+    """read-only VectorWire backed by a row of wires table."""
+
+    __slots__ = ("columnar", "row")
+
+    def __init__(self, columnar: VectorNetsColumnar, row: int):
+        self.columnar = columnar
+        self.row = row
+
+    @property
+    def id(self):
+        return _int_value(self.columnar.wires["id"], self.row)
+
+    @property
+    def path_num(self):
+        return _int_value(self.columnar.wires["path_num"], self.row)
+
+    @property
+    def feature(self) -> VectorWireFeature:
+        wires = self.columnar.wires
+        return VectorWireFeature(
+            wire_width=_int_value(wires["wire_width"], self.row),
+            wire_len=_int_value(wires["wire_len"], self.row),
+            drc_num=_int_value(wires["drc_num"], self.row),
+            R=_float_value(wires["R"], self.row),
+            C=_float_value(wires["C"], self.row),
+            power=_float_value(wires["power"], self.row),
+            delay=_float_value(wires["delay"], self.row),
+            slew=_float_value(wires["slew"], self.row),
+            congestion=_float_value(wires["congestion"], self.row),
+            wire_density=_float_value(wires["wire_density"], self.row),
+        )
+
+    @property
+    def wire(self) -> VectorPath:
+        wires = self.columnar.wires
+        return VectorPath(
+            node1=VectorNodeView(wires, self.row, 1),
+            node2=VectorNodeView(wires, self.row, 2),
+            via=_int_value(wires["via"], self.row),
+        )
+
+    @property
+    def paths(self) -> List[VectorPath]:
+        paths = self.columnar.paths
+        path_slice = self.columnar.path_slice(self.row)
+        return [
+            VectorPath(
+                node1=VectorNodeView(paths, row, 1),
+                node2=VectorNodeView(paths, row, 2),
+                via=_int_value(paths["via"], row),
+            )
+            for row in range(path_slice.start, path_slice.stop)
+        ]
+
+
+class WireTable(object):
+    """wires table of VectorNetsColumnar, rows are accessed as VectorWireView."""
+
+    __slots__ = ("columnar",)
+
+    def __init__(self, columnar: VectorNetsColumnar):
+        self.columnar = columnar
+
+    def __len__(self):
+        return len(self.columnar.wires["id"])
+
+    def __getitem__(self, row: int) -> VectorWireView:
+        return VectorWireView(self.columnar, row)
+
+    @property
+    def node1(self) -> NodeTable:
+        return NodeTable(self.columnar.wires, 1)
+
+    @property
+    def node2(self) -> NodeTable:
+        return NodeTable(self.columnar.wires, 2)
+
+
+class VectorNetView(object):
+    """read-only VectorNet backed by a row of nets table, pins and wires are the
+    index ranges of the net in pins and wires tables."""
+
+    __slots__ = ("columnar", "row")
+
+    routing_graph = None
+
+    def __init__(self, columnar: VectorNetsColumnar, row: int):
+        self.columnar = columnar
+        self.row = row
+
+    @property
+    def id(self):
+        return _int_value(self.columnar.nets["id"], self.row)
+
+    @property
+    def name(self):
+        return str(self.columnar.nets["name"][self.row])
+
+    @property
+    def pin_num(self):
+        return _int_value(self.columnar.nets["pin_num"], self.row)
+
+    @property
+    def wire_num(self):
+        return _int_value(self.columnar.nets["wire_num"], self.row)
+
+    @property
+    def feature(self) -> VectorNetFeature:
+        nets = self.columnar.nets
+        row = self.row
+
+        place_feature = VectorPlaceFeature()
+        place_feature.pin_num = _int_value(nets["place_pin_num"], row)
+        for name in ["aspect_ratio", "width", "height", "area", "l_ness", "rsmt", "hpwl"]:
+            setattr(place_feature, name, _float_value(nets["place_" + name], row))
+
+        net_feature = VectorNetFeature(place_feature=place_feature)
+        for name in [
+            "llx",
+            "lly",
+            "urx",
+            "ury",
+            "wire_len",
+            "via_num",
+            "drc_num",
+            "aspect_ratio",
+            "width",
+            "height",
+            "area",
+            "volume",
+        ]:
+            setattr(net_feature, name, _int_value(nets[name], row))
+        for name in ["R", "C", "power", "delay", "slew", "l_ness"]:
+            setattr(net_feature, name, _float_value(nets[name], row))
+
+        offset = nets["layer_ratio_offset"]
+        net_feature.layer_ratio = nets["layer_ratio"][
+            offset[row] : offset[row + 1]
+        ].tolist()
+
+        return net_feature
+
+    @property
+    def pins(self) -> List[VectorPin]:
+        pins = self.columnar.pins
+        pin_slice = self.columnar.pin_slice(self.row)
+        name_table = VectorNameTable()
+        vec_pins = []
+        for row in range(pin_slice.start, pin_slice.stop):
+            vec_pin = VectorPin(
+                id=_int_value(pins["id"], row),
+                is_driver=_int_value(pins["is_driver"], row),
+            )
+            name_table.intern_pin(
+                vec_pin, str(pins["instance"][row]), str(pins["pin_name"][row])
+            )
+            vec_pins.append(vec_pin)
+        return vec_pins
+
+    @property
+    def wires(self) -> List[VectorWireView]:
+        wire_slice = self.columnar.wire_slice(self.row)
+        return [
+            VectorWireView(self.columnar, row)
+            for row in range(wire_slice.start, wire_slice.stop)
+        ]
+
+
+@dataclass(slots=True)
 class VectorPatchLayer:
     id: Optional[int] = None
     net_num: Optional[int] = None
@@ -230,6 +530,151 @@ class VectorPathMetrics:
     inst_delay: List[float] = field(default_factory=list)
     net_delay: List[float] = field(default_factory=list)
 
+
+@dataclass
+class VectorTimingWirePath(object):
+    """all the data of one timing wire path, parsed in a single walk of the path file.
+
+    capacitance, slew and resistance are aligned with nodes, incr has one value per
+    inst arc and net arc in path order, incr_is_net marks the net arcs, inst_delay and
+    net_delay split incr by arc type.
+    """
+
+    path_hash: str = None
+    capacitance: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    slew: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    resistance: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    incr: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    incr_is_net: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.bool_))
+    stage: Optional[float] = None
+    inst_delay: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    net_delay: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    # ids of node names in name_table
+    node_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    # names of the ids, shared by the paths of a file or of a workspace
+    name_table: Optional["VectorNameTable"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def nodes(self) -> List[str]:
+        """node names resolved from node_ids."""
+        if self.name_table is None:
+            return []
+        return self.name_table.names_of(self.node_ids)
+
+    def path_data(self) -> VectorTimingWirePathData:
+        return VectorTimingWirePathData(
+            capacitance_list=self.capacitance.tolist(),
+            slew_list=self.slew.tolist(),
+            resistance_list=self.resistance.tolist(),
+            incr_list=self.incr.tolist(),
+            nodes=list(self.nodes),
+        )
+
+    def metrics(self) -> VectorPathMetrics:
+        return VectorPathMetrics(
+            stage=self.stage,
+            inst_delay=self.inst_delay.tolist(),
+            net_delay=self.net_delay.tolist(),
+        )
+
+    def path_graph(self) -> VectorTimingWirePathGraph:
+        wire_path_nodes = []
+        wire_path_edges = []
+        for index, node_name in enumerate(self.nodes):
+            parts = node_name.split(":")
+            is_port = True if len(parts) == 1 else False
+            is_pin = True if len(parts) == 2 and not parts[1].isdigit() else False
+            wire_path_node = VectorTimingWireGraphNode(node_name, is_pin, is_port)
+            wire_path_nodes.append(wire_path_node)
+
+            if index > 0:
+                wire_path_edge = VectorTimingWireGraphEdge(index - 1, index)
+                wire_path_edges.append(wire_path_edge)
+
+        return VectorTimingWirePathGraph(wire_path_nodes, wire_path_edges)
+
+
+@dataclass
+class VectorWirePathsPacked(object):
+    """timing wire paths of a design packed to contiguous arrays, arrays of a path are
+    views into the packed arrays.
+
+    values : float32 (node_num, 3) capacitance, slew and resistance of nodes, rows of
+        path i are value_offset[i]:value_offset[i+1]
+    node_ids : int64 ids of node names in node_names, same rows as values
+    incr : float32 incr of arcs, rows of path i are incr_offset[i]:incr_offset[i+1],
+        incr_is_net is True for net arcs and False for inst arcs
+    path_hash, stage : one row per path, stage is nan if path has no net arc
+    """
+
+    values: np.ndarray = field(default_factory=lambda: np.zeros((0, 3), dtype=np.float32))
+    value_offset: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    node_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    node_names: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.str_))
+    incr: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    incr_offset: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.int64))
+    incr_is_net: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.bool_))
+    path_hash: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.str_))
+    stage: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    # table of node_names, built by path
+    name_table: Optional["VectorNameTable"] = field(
+        default=None, repr=False, compare=False
+    )
+
+    @property
+    def path_num(self) -> int:
+        return len(self.value_offset) - 1
+
+    def value_slice(self, path_index: int) -> slice:
+        return slice(
+            int(self.value_offset[path_index]), int(self.value_offset[path_index + 1])
+        )
+
+    def incr_slice(self, path_index: int) -> slice:
+        return slice(
+            int(self.incr_offset[path_index]), int(self.incr_offset[path_index + 1])
+        )
+
+    def path_values(self, path_index: int) -> np.ndarray:
+        """(length, 3) view of capacitance, slew and resistance of the path."""
+        return self.values[self.value_slice(path_index)]
+
+    def path_incr(self, path_index: int) -> np.ndarray:
+        return self.incr[self.incr_slice(path_index)]
+
+    def path_node_ids(self, path_index: int) -> np.ndarray:
+        return self.node_ids[self.value_slice(path_index)]
+
+    def path(self, path_index: int) -> VectorTimingWirePath:
+        """VectorTimingWirePath of a path, the arrays are views of the packed arrays."""
+        values = self.path_values(path_index)
+        incr = self.path_incr(path_index)
+        is_net = self.incr_is_net[self.incr_slice(path_index)]
+        stage = float(self.stage[path_index])
+
+        if self.name_table is None:
+            self.name_table = VectorNameTable.from_names(self.node_names.tolist())
+
+        return VectorTimingWirePath(
+            path_hash=str(self.path_hash[path_index]),
+            node_ids=self.path_node_ids(path_index).astype(np.int32),
+            name_table=self.name_table,
+            capacitance=values[:, 0],
+            slew=values[:, 1],
+            resistance=values[:, 2],
+            incr=incr,
+            incr_is_net=is_net,
+            stage=None if np.isnan(stage) else stage,
+            inst_delay=incr[~is_net],
+            net_delay=incr[is_net],
+        )
+
+    def iter_paths(self):
+        for path_index in range(self.path_num):
+            yield self.path(path_index)
+
 @dataclass
 class VectorLayer:
     id: int = None
@@ -297,6 +742,8 @@ class VectorInstance:
     ury: int = None
     orient: str = None
     status: str = None
+    # id in VectorNameTable of the workspace
+    name_id: int = None
 
 
 @dataclass
@@ -324,3 +771,190 @@ class VectorInstanceGraph(object):
     edges: List[VectorInstanceGraphEdge] = field(default_factory=list)
 
 
+@dataclass
+class VectorGraphArrays(object):
+    """graph stored as numpy arrays, node i is row i of the node arrays.
+
+    edge_src, edge_dst : int32 COO edges, rows of edge_attrs follow the edge order
+    node_name_ids : int32 ids of node names in names, names are interned
+    node_attrs, edge_attrs : {attribute : array}, e.g. is_pin, is_port, is_net_edge
+    """
+
+    node_name_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    names: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.str_))
+    edge_src: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    edge_dst: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    node_attrs: Dict[str, np.ndarray] = field(default_factory=dict)
+    edge_attrs: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def node_num(self) -> int:
+        return len(self.node_name_ids)
+
+    @property
+    def edge_num(self) -> int:
+        return len(self.edge_src)
+
+    @property
+    def node_names(self) -> np.ndarray:
+        return self.names[self.node_name_ids]
+
+    def csr(self):
+        """return (indptr, indices, edge_order) of out edges, out edges of node i are
+        indices[indptr[i]:indptr[i+1]], edge_order maps csr rows to edge rows."""
+        edge_order = np.argsort(self.edge_src, kind="stable")
+        indptr = np.zeros(self.node_num + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(self.edge_src, minlength=self.node_num), out=indptr[1:]
+        )
+        return indptr, self.edge_dst[edge_order], edge_order
+
+    def to_scipy(self, weight: str = None):
+        """scipy.sparse csr adjacency matrix, weight : edge attribute as data."""
+        import scipy.sparse
+
+        if weight is None:
+            data = np.ones(self.edge_num, dtype=np.float32)
+        else:
+            data = self.edge_attrs[weight]
+        return scipy.sparse.csr_matrix(
+            (data, (self.edge_src, self.edge_dst)), shape=(self.node_num, self.node_num)
+        )
+
+    def to_networkx(self, directed: bool = True):
+        """networkx graph, nodes are node rows with name and node attributes."""
+        import networkx as nx
+
+        graph = nx.DiGraph() if directed else nx.Graph()
+        node_names = self.node_names.tolist()
+        node_attrs = {name: values.tolist() for name, values in self.node_attrs.items()}
+        graph.add_nodes_from(
+            (
+                index,
+                dict(
+                    name=node_names[index],
+                    **{name: values[index] for name, values in node_attrs.items()},
+                ),
+            )
+            for index in range(self.node_num)
+        )
+
+        edge_attrs = {name: values.tolist() for name, values in self.edge_attrs.items()}
+        graph.add_edges_from(
+            (
+                src,
+                dst,
+                {name: values[index] for name, values in edge_attrs.items()},
+            )
+            for index, (src, dst) in enumerate(
+                zip(self.edge_src.tolist(), self.edge_dst.tolist())
+            )
+        )
+        return graph
+
+    def to_edge_index(self):
+        """torch long tensor (2, edge_num), the edge_index of PyTorch Geometric."""
+        import torch
+
+        return torch.from_numpy(
+            np.stack([self.edge_src, self.edge_dst]).astype(np.int64)
+        )
+
+
+class VectorNameTable(object):
+    """interned names of a workspace, each distinct name is stored once and mapped to
+    a dense int id, e.g. pin, instance and timing node names. names are resolved from
+    ids on demand, joins between tables compare ids."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def intern(self, name: str) -> Optional[int]:
+        """return id of name, a new id is assigned to an unseen name, None for None."""
+        if name is None:
+            return None
+
+        name_id = self.ids.get(name)
+        if name_id is None:
+            name_id = len(self.names)
+            self.ids[name] = name_id
+            self.names.append(name)
+        return name_id
+
+    def intern_array(self, names: List[str]) -> np.ndarray:
+        return np.fromiter(
+            (self.intern(name) for name in names), dtype=np.int32, count=len(names)
+        )
+
+    def id_of(self, name: str) -> Optional[int]:
+        """return id of name, None if name is not interned."""
+        return self.ids.get(name)
+
+    def name(self, name_id: int) -> Optional[str]:
+        return None if name_id is None else self.names[name_id]
+
+    def names_of(self, name_ids) -> List[str]:
+        return [self.names[name_id] for name_id in name_ids]
+
+    @classmethod
+    def from_names(cls, names: List[str]) -> "VectorNameTable":
+        """table of distinct names, the id of a name is its index."""
+        table = cls()
+        table.names = list(names)
+        table.ids = {name: name_id for name_id, name in enumerate(table.names)}
+        return table
+
+    def intern_pin(self, pin: VectorPin, instance: str, pin_name: str):
+        """set the name ids of pin, node_id is the id of "instance:pin_name"."""
+        pin.name_table = self
+        pin.pin_name_id = self.intern(pin_name)
+        pin.instance_id = self.intern(instance)
+        if instance is not None:
+            pin.node_id = self.intern("{}:{}".format(instance, pin_name))
+
+    def adopt_pins(self, pins):
+        """move the ids of pins interned in other tables, e.g. the table of the parsed
+        file, to this table."""
+        id_maps = _IdMaps(self)
+        for pin in pins:
+            if pin.name_table is self or pin.name_table is None:
+                continue
+            id_map = id_maps.get(pin.name_table)
+            pin.pin_name_id = _map_id(id_map, pin.pin_name_id)
+            pin.instance_id = _map_id(id_map, pin.instance_id)
+            pin.node_id = _map_id(id_map, pin.node_id)
+            pin.name_table = self
+
+    def adopt_wire_paths(self, wire_paths):
+        """move the node ids of wire paths interned in other tables to this table."""
+        id_maps = _IdMaps(self)
+        for wire_path in wire_paths:
+            if wire_path.name_table is self or wire_path.name_table is None:
+                continue
+            id_map = np.asarray(id_maps.get(wire_path.name_table), dtype=np.int32)
+            wire_path.node_ids = id_map[wire_path.node_ids]
+            wire_path.name_table = self
+
+
+class _IdMaps(object):
+    """ids in table of the names of other tables, computed once per other table."""
+
+    def __init__(self, table: VectorNameTable):
+        self.table = table
+        # {id(other) : (other, id map)}, other is kept alive while its map is used
+        self.maps = {}
+
+    def get(self, other: VectorNameTable) -> List[int]:
+        entry = self.maps.get(id(other))
+        if entry is None:
+            entry = (other, [self.table.intern(name) for name in other.names])
+            self.maps[id(other)] = entry
+        return entry[1]
+
+
+def _map_id(id_map: List[int], name_id: Optional[int]) -> Optional[int]:
+    return None if name_id is None else id_map[name_id]
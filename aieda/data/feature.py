@@ -47,7 +47,40 @@ class DataFeature:
             feature_path = self.workspace.paths_table.ieda_feature_json[eval_key]
 
             parser = FeatureParserJson(feature_path)
-            return parser.get_metrics()
+            metrics = parser.get_metrics()
+            for csv_maps in self._csv_maps(metrics):
+                csv_maps.csv_cache_dir = self.workspace.paths_table.ieda_output[
+                    "feature_cache"
+                ]
+            return metrics
+
+    def convert_csv_maps(self, flow: DbFlow):
+        """convert the density and congestion csv maps of flow to .npy files in the
+        workspace feature cache, load_feature_map memory-maps converted maps instead of
+        parsing the csv files. return the metrics of load_feature_map."""
+        metrics = self.load_feature_map(flow)
+        for csv_maps in self._csv_maps(metrics):
+            csv_maps.convert_maps(self.workspace.paths_table.ieda_output["feature_cache"])
+        return metrics
+
+    def _csv_maps(self, metrics):
+        """FeatureCsvMaps objects of feature metrics."""
+        from .database import FeatureCsvMaps
+
+        if metrics is None:
+            return []
+
+        csv_maps = []
+        features = [metrics.density, metrics.congestion]
+        while features:
+            feature = features.pop()
+            if isinstance(feature, FeatureCsvMaps):
+                csv_maps.append(feature)
+            elif hasattr(feature, "__dataclass_fields__"):
+                features.extend(
+                    getattr(feature, name) for name in feature.__dataclass_fields__
+                )
+        return csv_maps
 
     def load_drc(self, drc_path: str = None):
         from .io import FeatureParserJson
@@ -1,7 +1,26 @@
 from .feature_io import FeatureParserJson
 from .vectors_io import VectorsParserJson
+from .vectors_columnar import VectorsColumnar
+from .vectors_packed import VectorsPackedPaths
+from .vectors_corpus import VectorsCorpus
+from .vectors_index import VectorsNetIndex
+from .vectors_spatial import VectorsSpatialIndex, SPATIAL_KINDS
+from .vectors_manifest import VectorsManifest, MANIFEST_DIRS, scan_json_files
+from .vectors_cache import VectorsCache, VectorsMemoryCache, vectors_memory_cache
 
 __all__ = [
     'FeatureParserJson',
     'VectorsParserJson',
+    'VectorsColumnar',
+    'VectorsPackedPaths',
+    'VectorsCorpus',
+    'VectorsNetIndex',
+    'VectorsSpatialIndex',
+    'SPATIAL_KINDS',
+    'VectorsManifest',
+    'MANIFEST_DIRS',
+    'scan_json_files',
+    'VectorsCache',
+    'VectorsMemoryCache',
+    'vectors_memory_cache',
 ]
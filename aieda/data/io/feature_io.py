@@ -9,7 +9,6 @@
 from ...utility.json_parser import JsonParser
 from ...utility.log import Logger
 from ..database import *
-import numpy as np
 
 
 class FeatureParserJson(JsonParser):
@@ -859,21 +858,6 @@ class FeatureParserJson(JsonParser):
                     allcell_density=allcell_path,
                     macro_density=macro_path,
                     stdcell_density=stdcell_path,
-                    allcell_density_data=(
-                        np.loadtxt(allcell_path, delimiter=",")
-                        if allcell_path and allcell_path.strip()
-                        else None
-                    ),
-                    macro_density_data=(
-                        np.loadtxt(macro_path, delimiter=",")
-                        if macro_path and macro_path.strip()
-                        else None
-                    ),
-                    stdcell_density_data=(
-                        np.loadtxt(stdcell_path, delimiter=",")
-                        if stdcell_path and stdcell_path.strip()
-                        else None
-                    ),
                 )
 
             if "margin" in dict_density:
@@ -887,21 +871,6 @@ class FeatureParserJson(JsonParser):
                     horizontal=horizontal_path,
                     union=union_path,
                     vertical=vertical_path,
-                    horizontal_data=(
-                        np.loadtxt(horizontal_path, delimiter=",")
-                        if horizontal_path and horizontal_path.strip()
-                        else None
-                    ),
-                    union_data=(
-                        np.loadtxt(union_path, delimiter=",")
-                        if union_path and union_path.strip()
-                        else None
-                    ),
-                    vertical_data=(
-                        np.loadtxt(vertical_path, delimiter=",")
-                        if vertical_path and vertical_path.strip()
-                        else None
-                    ),
                 )
 
             if "net" in dict_density:
@@ -915,21 +884,6 @@ class FeatureParserJson(JsonParser):
                     allnet_density=allnet_path,
                     global_net_density=global_net_path,
                     local_net_density=local_net_path,
-                    allnet_density_data=(
-                        np.loadtxt(allnet_path, delimiter=",")
-                        if allnet_path and allnet_path.strip()
-                        else None
-                    ),
-                    global_net_density_data=(
-                        np.loadtxt(global_net_path, delimiter=",")
-                        if global_net_path and global_net_path.strip()
-                        else None
-                    ),
-                    local_net_density_data=(
-                        np.loadtxt(local_net_path, delimiter=",")
-                        if local_net_path and local_net_path.strip()
-                        else None
-                    ),
                 )
 
             if "pin" in dict_density:
@@ -943,21 +897,6 @@ class FeatureParserJson(JsonParser):
                     allcell_pin_density=allcell_pin_path,
                     macro_pin_density=macro_pin_path,
                     stdcell_pin_density=stdcell_pin_path,
-                    allcell_pin_density_data=(
-                        np.loadtxt(allcell_pin_path, delimiter=",")
-                        if allcell_pin_path and allcell_pin_path.strip()
-                        else None
-                    ),
-                    macro_pin_density_data=(
-                        np.loadtxt(macro_pin_path, delimiter=",")
-                        if macro_pin_path and macro_pin_path.strip()
-                        else None
-                    ),
-                    stdcell_pin_density_data=(
-                        np.loadtxt(stdcell_pin_path, delimiter=",")
-                        if stdcell_pin_path and stdcell_pin_path.strip()
-                        else None
-                    ),
                 )
 
             return feature_density
@@ -985,21 +924,6 @@ class FeatureParserJson(JsonParser):
                         horizontal=horizontal_path,
                         union=union_path,
                         vertical=vertical_path,
-                        horizontal_data=(
-                            np.loadtxt(horizontal_path, delimiter=",")
-                            if horizontal_path and horizontal_path.strip()
-                            else None
-                        ),
-                        union_data=(
-                            np.loadtxt(union_path, delimiter=",")
-                            if union_path and union_path.strip()
-                            else None
-                        ),
-                        vertical_data=(
-                            np.loadtxt(vertical_path, delimiter=",")
-                            if vertical_path and vertical_path.strip()
-                            else None
-                        ),
                     )
 
                 if "lutrudy" in map_data:
@@ -1013,21 +937,6 @@ class FeatureParserJson(JsonParser):
                         horizontal=horizontal_path,
                         union=union_path,
                         vertical=vertical_path,
-                        horizontal_data=(
-                            np.loadtxt(horizontal_path, delimiter=",")
-                            if horizontal_path and horizontal_path.strip()
-                            else None
-                        ),
-                        union_data=(
-                            np.loadtxt(union_path, delimiter=",")
-                            if union_path and union_path.strip()
-                            else None
-                        ),
-                        vertical_data=(
-                            np.loadtxt(vertical_path, delimiter=",")
-                            if vertical_path and vertical_path.strip()
-                            else None
-                        ),
                     )
 
                 if "rudy" in map_data:
@@ -1041,21 +950,6 @@ class FeatureParserJson(JsonParser):
                         horizontal=horizontal_path,
                         union=union_path,
                         vertical=vertical_path,
-                        horizontal_data=(
-                            np.loadtxt(horizontal_path, delimiter=",")
-                            if horizontal_path and horizontal_path.strip()
-                            else None
-                        ),
-                        union_data=(
-                            np.loadtxt(union_path, delimiter=",")
-                            if union_path and union_path.strip()
-                            else None
-                        ),
-                        vertical_data=(
-                            np.loadtxt(vertical_path, delimiter=",")
-                            if vertical_path and vertical_path.strip()
-                            else None
-                        ),
                     )
 
             if "overflow" in dict_congestion:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_cache.py
+@Author : yell
+@Desc : on-disk and in-memory caches of parsed vectors
+"""
+import os
+import pickle
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict
+
+from ...utility.json_parser import json_codec
+from ...utility.log import Logger
+
+# bump the version when the parsed data structure changes, old caches are ignored
+CACHE_VERSION = 4
+
+# default memory budget of VectorsMemoryCache in bytes, set AIEDA_VECTORS_MEMORY_CACHE
+# or call vectors_memory_cache.set_budget to change it
+MEMORY_CACHE_BUDGET = int(os.environ.get("AIEDA_VECTORS_MEMORY_CACHE", 2 << 30))
+
+# estimated bytes of parsed python objects per byte of plain json
+PARSED_SIZE_FACTOR = 4
+# estimated bytes of plain json per byte of compressed json
+COMPRESSED_SIZE_FACTOR = 8
+
+
+class VectorsCache:
+    """store the parse result of each vectors json file as a pickle file in cache_dir.
+
+    a cache entry is valid while the size and mtime of the source file are unchanged,
+    entries are keyed by source path, parse method and parse arguments.
+    """
+
+    def __init__(self, cache_dir: str, logger: Logger = None):
+        self.cache_dir = cache_dir
+        if logger is None:
+            self.logger = Logger("VectorsCache")
+        else:
+            self.logger = logger
+
+    def cache_path(self, filepath: str, method: str, kwargs: dict = None):
+        kwargs = kwargs or {}
+        args = [
+            (name, sorted(value) if isinstance(value, (set, frozenset)) else value)
+            for name, value in sorted(kwargs.items())
+        ]
+        key = "{}|{}|{}|{}".format(
+            CACHE_VERSION, os.path.abspath(filepath), method, args
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return "{}/{}/{}.pkl".format(self.cache_dir, method, digest)
+
+    def load(self, filepath: str, method: str, kwargs: dict = None):
+        """return (True, result) if cache hit, else (False, None)."""
+        cache_path = self.cache_path(filepath, method, kwargs)
+        if not os.path.isfile(cache_path):
+            return False, None
+
+        try:
+            stat = os.stat(filepath)
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+
+            if entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+                return False, None
+
+            return True, entry["result"]
+        except Exception as e:
+            self.logger.warning("invalid vectors cache %s : %s", cache_path, e)
+            return False, None
+
+    def save(self, filepath: str, method: str, kwargs: dict, result):
+        cache_path = self.cache_path(filepath, method, kwargs)
+
+        try:
+            stat = os.stat(filepath)
+            entry = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "result": result,
+            }
+
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # write to a temporary file first, workers may save the same entry
+            tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+            return True
+        except Exception as e:
+            self.logger.warning("save vectors cache %s failed : %s", cache_path, e)
+            return False
+
+    def clear(self):
+        if os.path.isdir(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+            self.logger.info("clear vectors cache %s", self.cache_dir)
+
+
+class VectorsMemoryCache:
+    """in-process LRU cache of vectors datasets loaded from directories.
+
+    an entry is valid while the signature (file names, sizes and mtimes) of the source
+    directory is unchanged. the size of an entry is the estimated bytes of its parsed
+    objects, the least recently used entries are dropped when the total size exceeds
+    budget.
+    """
+
+    def __init__(self, budget: int = MEMORY_CACHE_BUDGET):
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def signature(json_files: list):
+        """signature of source files."""
+        stats = []
+        for filepath in json_files:
+            stat = os.stat(filepath)
+            stats.append((filepath, stat.st_size, stat.st_mtime_ns))
+
+        return hash(tuple(stats))
+
+    @staticmethod
+    def estimate_size(json_files: list):
+        """estimated bytes of the parsed objects of source files, from the file sizes
+        on disk."""
+        size = 0
+        for filepath in json_files:
+            file_size = os.stat(filepath).st_size
+            if json_codec(filepath):
+                file_size *= COMPRESSED_SIZE_FACTOR
+            size += file_size * PARSED_SIZE_FACTOR
+        return size
+
+    def get(self, key, signature):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            if entry["signature"] != signature:
+                self._remove(key)
+                return None
+
+            self.entries.move_to_end(key)
+            return entry["value"]
+
+    def put(self, key, signature, value, size: int):
+        """size : estimated bytes of value, see estimate_size.
+        return False if the entry is larger than budget."""
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            if size > self.budget:
+                return False
+
+            self.entries[key] = {"signature": signature, "value": value, "size": size}
+            self.size += size
+
+            while self.size > self.budget:
+                self._remove(next(iter(self.entries)))
+
+            return True
+
+    def clear(self, directory: str = None):
+        """clear all entries, or entries loaded from paths under directory."""
+        with self.lock:
+            if directory is None:
+                self.entries.clear()
+                self.size = 0
+                return
+
+            directory = os.path.abspath(directory)
+            for key in [
+                key
+                for key in self.entries
+                if key[1] == directory or key[1].startswith(directory + os.sep)
+            ]:
+                self._remove(key)
+
+    def set_budget(self, budget: int):
+        """budget : bytes of the cached entries."""
+        with self.lock:
+            self.budget = budget
+            while self.size > self.budget and self.entries:
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self.size -= entry["size"]
+
+
+# shared by all DataVectors in the process, keys contain the source directory so
+# entries of different workspaces never collide
+vectors_memory_cache = VectorsMemoryCache()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_columnar.py
+@Author : yell
+@Desc : columnar (struct-of-arrays) storage for vectors nets
+"""
+import os
+
+import numpy as np
+from tqdm import tqdm
+
+from ...utility.json_parser import JsonParser
+from ...utility.log import Logger
+from ..database import VectorNetsColumnar
+from ..database.vectors import INT_NONE
+
+NET_INT_COLUMNS = [
+    "id",
+    "llx",
+    "lly",
+    "urx",
+    "ury",
+    "wire_len",
+    "via_num",
+    "drc_num",
+    "aspect_ratio",
+    "width",
+    "height",
+    "area",
+    "volume",
+    "pin_num",
+    "wire_num",
+]
+NET_FLOAT_COLUMNS = ["R", "C", "power", "delay", "slew", "l_ness"]
+PLACE_INT_COLUMNS = ["pin_num"]
+PLACE_FLOAT_COLUMNS = ["aspect_ratio", "width", "height", "area", "l_ness", "rsmt", "hpwl"]
+
+PIN_INT_COLUMNS = ["id", "is_driver"]
+
+NODE_COLUMNS = ["id", "x", "y", "real_x", "real_y", "row", "col", "layer", "pin_id"]
+# json keys of node columns, the node index 1 or 2 is appended
+NODE_KEYS = ["id", "x", "y", "real_x", "real_y", "r", "c", "l", "p"]
+
+WIRE_INT_COLUMNS = ["id", "via", "path_num", "wire_width", "wire_len", "drc_num"]
+WIRE_FLOAT_COLUMNS = [
+    "R",
+    "C",
+    "power",
+    "delay",
+    "slew",
+    "congestion",
+    "wire_density",
+]
+
+TABLES = ["nets", "pins", "wires", "paths"]
+
+# version of the table layout, tables written by another version are rebuilt
+COLUMNAR_VERSION = 2
+
+
+def _int(value):
+    return INT_NONE if value is None else value
+
+
+def _float(value):
+    return np.nan if value is None else value
+
+
+class VectorsColumnar:
+    """convert vectors nets json to columnar tables and read them back.
+
+    each table is saved as an uncompressed npz file in columnar_dir, npz members are
+    loaded on access, so reading a single column does not touch the other columns.
+    meta.json stores size and mtime of the source net files, the tables are invalid
+    if any source file changes.
+
+    drc_type lists of nets and wires are not stored, read the json nets for them.
+    """
+
+    def __init__(self, columnar_dir: str, logger: Logger = None):
+        self.columnar_dir = columnar_dir
+        if logger is None:
+            self.logger = Logger("VectorsColumnar")
+        else:
+            self.logger = logger
+
+    def table_path(self, table: str):
+        return "{}/{}.npz".format(self.columnar_dir, table)
+
+    @property
+    def meta_path(self):
+        return "{}/meta.json".format(self.columnar_dir)
+
+    def exists(self):
+        return os.path.isfile(self.meta_path) and all(
+            os.path.isfile(self.table_path(table)) for table in TABLES
+        )
+
+    def is_valid(self, json_files: list):
+        if not self.exists():
+            return False
+
+        parser = JsonParser(self.meta_path, self.logger)
+        if parser.read() is not True:
+            return False
+
+        if parser.json_data.get("version") != COLUMNAR_VERSION:
+            return False
+
+        files = parser.json_data.get("files", [])
+        if len(json_files) != len(files):
+            return False
+
+        for filepath, (meta_filepath, size, mtime) in zip(json_files, files):
+            if filepath != meta_filepath or not os.path.isfile(filepath):
+                return False
+            stat = os.stat(filepath)
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+
+        return True
+
+    def build_nets(self, json_files: list) -> VectorNetsColumnar:
+        """build columnar nets from net json files, nets keep the order of json_files."""
+        builder = self.NetsBuilder()
+
+        for filepath in tqdm(json_files, desc="vectors columnar nets"):
+            parser = JsonParser(filepath, self.logger)
+            for net_metadata in parser.iter_items():
+                builder.append(net_metadata)
+
+        return builder.build()
+
+    def write(self, columnar: VectorNetsColumnar, json_files: list):
+        os.makedirs(self.columnar_dir, exist_ok=True)
+        if os.path.isfile(self.meta_path):
+            os.remove(self.meta_path)
+
+        for table in TABLES:
+            np.savez(self.table_path(table), **getattr(columnar, table))
+
+        # meta is written last, a partly written directory is never valid
+        files = []
+        for filepath in json_files:
+            stat = os.stat(filepath)
+            files.append([filepath, stat.st_size, stat.st_mtime_ns])
+        parser = JsonParser(self.meta_path, self.logger)
+        parser.write(
+            {
+                "version": COLUMNAR_VERSION,
+                "files": files,
+                "net_num": columnar.net_num,
+            },
+            indent=None,
+        )
+
+        self.logger.info(
+            "write columnar nets to %s, nets num: %d", self.columnar_dir, columnar.net_num
+        )
+        return True
+
+    def read(self, columns: dict = None) -> VectorNetsColumnar:
+        """columns : optional {table : [column names]} to read only part of the tables."""
+        columnar = VectorNetsColumnar()
+        if not self.exists():
+            self.logger.error("columnar nets not exist. path = %s", self.columnar_dir)
+            return columnar
+
+        for table in TABLES:
+            if columns is not None and table not in columns:
+                continue
+
+            with np.load(self.table_path(table), allow_pickle=False) as npz:
+                names = npz.files if columns is None else columns[table]
+                setattr(columnar, table, {name: npz[name] for name in names})
+
+        return columnar
+
+    class NetsBuilder:
+        """accumulate net json dicts row by row, then pack rows to numpy columns."""
+
+        def __init__(self):
+            self.nets = {name: [] for name in NET_INT_COLUMNS + NET_FLOAT_COLUMNS}
+            self.nets["name"] = []
+            for name in PLACE_INT_COLUMNS + PLACE_FLOAT_COLUMNS:
+                self.nets["place_" + name] = []
+            self.nets["layer_ratio"] = []
+            self.layer_ratio_offset = [0]
+            self.pin_offset = [0]
+            self.wire_offset = [0]
+
+            self.pins = {name: [] for name in PIN_INT_COLUMNS}
+            self.pins["net_index"] = []
+            self.pins["instance"] = []
+            self.pins["pin_name"] = []
+
+            self.wires = {name: [] for name in WIRE_INT_COLUMNS + WIRE_FLOAT_COLUMNS}
+            self.wires["net_index"] = []
+            for index in [1, 2]:
+                for name in NODE_COLUMNS:
+                    self.wires["{}{}".format(name, index)] = []
+            self.path_offset = [0]
+
+            self.paths = {"wire_index": [], "via": []}
+            for index in [1, 2]:
+                for name in NODE_COLUMNS:
+                    self.paths["{}{}".format(name, index)] = []
+
+        def append(self, net_metadata: dict):
+            net_index = len(self.nets["id"])
+            feature_data = net_metadata.get("feature", {})
+            place_feature_data = feature_data.get("place_feature", {})
+
+            # net
+            self.nets["id"].append(_int(net_metadata.get("id")))
+            self.nets["name"].append(net_metadata.get("name") or "")
+            self.nets["pin_num"].append(_int(net_metadata.get("pin_num")))
+            self.nets["wire_num"].append(_int(net_metadata.get("wire_num")))
+            for name in NET_INT_COLUMNS:
+                if name not in ["id", "pin_num", "wire_num"]:
+                    self.nets[name].append(_int(feature_data.get(name)))
+            for name in NET_FLOAT_COLUMNS:
+                self.nets[name].append(_float(feature_data.get(name)))
+            for name in PLACE_INT_COLUMNS:
+                self.nets["place_" + name].append(_int(place_feature_data.get(name)))
+            for name in PLACE_FLOAT_COLUMNS:
+                self.nets["place_" + name].append(_float(place_feature_data.get(name)))
+
+            layer_ratio = feature_data.get("layer_ratio") or []
+            self.nets["layer_ratio"].extend(layer_ratio)
+            self.layer_ratio_offset.append(self.layer_ratio_offset[-1] + len(layer_ratio))
+
+            # pins
+            json_pins = net_metadata.get("pins", [])
+            for json_pin in json_pins:
+                self.pins["net_index"].append(net_index)
+                self.pins["id"].append(_int(json_pin.get("id")))
+                self.pins["instance"].append(json_pin.get("i") or "")
+                self.pins["pin_name"].append(json_pin.get("p") or "")
+                self.pins["is_driver"].append(_int(json_pin.get("driver")))
+            self.pin_offset.append(self.pin_offset[-1] + len(json_pins))
+
+            # wires
+            json_wires = net_metadata.get("wires", [])
+            for json_wire in json_wires:
+                wire_index = len(self.wires["id"])
+                wire_feature_data = json_wire.get("feature", {})
+                wire_data = json_wire.get("wire", {})
+
+                self.wires["net_index"].append(net_index)
+                self.wires["id"].append(_int(json_wire.get("id")))
+                self.wires["via"].append(_int(wire_data.get("via")))
+                self.wires["path_num"].append(_int(json_wire.get("path_num")))
+                for name in ["wire_width", "wire_len", "drc_num"]:
+                    self.wires[name].append(_int(wire_feature_data.get(name)))
+                for name in WIRE_FLOAT_COLUMNS:
+                    self.wires[name].append(_float(wire_feature_data.get(name)))
+                self._append_nodes(self.wires, wire_data)
+
+                # paths
+                json_paths = json_wire.get("paths", [])
+                for json_path in json_paths:
+                    self.paths["wire_index"].append(wire_index)
+                    self.paths["via"].append(_int(json_path.get("via")))
+                    self._append_nodes(self.paths, json_path)
+                self.path_offset.append(self.path_offset[-1] + len(json_paths))
+
+            self.wire_offset.append(self.wire_offset[-1] + len(json_wires))
+
+        def _append_nodes(self, table: dict, json_data: dict):
+            for index in [1, 2]:
+                for name, key in zip(NODE_COLUMNS, NODE_KEYS):
+                    table["{}{}".format(name, index)].append(
+                        _int(json_data.get("{}{}".format(key, index)))
+                    )
+
+        def build(self) -> VectorNetsColumnar:
+            columnar = VectorNetsColumnar()
+
+            columnar.nets = self._pack(
+                self.nets,
+                float_columns=NET_FLOAT_COLUMNS
+                + ["place_" + name for name in PLACE_FLOAT_COLUMNS]
+                + ["layer_ratio"],
+                str_columns=["name"],
+            )
+            columnar.nets["layer_ratio_offset"] = np.asarray(
+                self.layer_ratio_offset, dtype=np.int64
+            )
+            columnar.nets["pin_offset"] = np.asarray(self.pin_offset, dtype=np.int64)
+            columnar.nets["wire_offset"] = np.asarray(self.wire_offset, dtype=np.int64)
+
+            columnar.pins = self._pack(self.pins, str_columns=["instance", "pin_name"])
+
+            columnar.wires = self._pack(self.wires, float_columns=WIRE_FLOAT_COLUMNS)
+            columnar.wires["path_offset"] = np.asarray(self.path_offset, dtype=np.int64)
+
+            columnar.paths = self._pack(self.paths)
+
+            return columnar
+
+        def _pack(
+            self, rows: dict, float_columns: tuple = (), str_columns: tuple = ()
+        ):
+            table = {}
+            for name, values in rows.items():
+                if name in float_columns:
+                    table[name] = np.asarray(values, dtype=np.float64)
+                elif name in str_columns:
+                    table[name] = np.asarray(values, dtype=np.str_)
+                else:
+                    table[name] = np.asarray(values, dtype=np.int64)
+            return table
@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_corpus.py
+@Author : yell
+@Desc : sharded columnar corpus merging vectors of many designs
+"""
+import os
+import shutil
+
+import numpy as np
+
+from ...utility.json_parser import JsonParser
+from ...utility.log import Logger
+
+# max rows of a shard, shards never span designs
+SHARD_ROWS = 1 << 20
+
+
+class VectorsCorpus:
+    """rows of many designs merged into sharded columnar tables.
+
+    each table is split into shards of at most shard_rows rows, a shard holds rows of
+    a single design and stores each column as a npy file, read with mmap on access.
+    ragged columns are stored as <column>.npy values with <column>_offset.npy row
+    offsets local to the shard.
+
+    corpus.json holds the design table with the global [start, end) rows of each
+    design in each table, and the shard table with the global start row of each shard.
+    """
+
+    def __init__(
+        self, corpus_dir: str, shard_rows: int = SHARD_ROWS, logger: Logger = None
+    ):
+        self.corpus_dir = corpus_dir
+        self.shard_rows = max(1, shard_rows)
+        if logger is None:
+            self.logger = Logger("VectorsCorpus")
+        else:
+            self.logger = logger
+
+        # [{"name", "directory", "rows" : {table : [start, end]}}]
+        self.designs = []
+        # {table : [{"path", "start", "rows", "design", "ragged"}]}
+        self.shards = {}
+        self.shard_starts = {}
+        self.mmaps = {}
+
+    @property
+    def corpus_path(self):
+        return "{}/corpus.json".format(self.corpus_dir)
+
+    def create(self):
+        """start a new corpus, remove the old one in corpus_dir.
+        corpus_dir is removed only if it holds a corpus, i.e. corpus.json, a non-empty
+        directory without corpus.json is refused."""
+        if os.path.isdir(self.corpus_dir) and os.listdir(self.corpus_dir):
+            if not os.path.isfile(self.corpus_path):
+                raise FileExistsError(
+                    "corpus directory is not empty and holds no corpus.json : {}".format(
+                        self.corpus_dir
+                    )
+                )
+            shutil.rmtree(self.corpus_dir)
+        os.makedirs(self.corpus_dir, exist_ok=True)
+        self.designs = []
+        self.shards = {}
+        self.shard_starts = {}
+        self.mmaps = {}
+
+        # mark the directory as a corpus at once, so an interrupted build can be
+        # created again
+        self.write()
+
+    def add_design(self, name: str, directory: str, tables: dict):
+        """append rows of a design.
+        tables : {table : (columns, ragged)}, columns is {column : array with one row
+        per table row}, ragged is {column : (values, offset)} with offset of row_num + 1
+        name : unique label of the design in the corpus
+        """
+        if any(design["name"] == name for design in self.designs):
+            raise ValueError("design {} is already in the corpus".format(name))
+
+        design_index = len(self.designs)
+        design = {"name": name, "directory": directory, "rows": {}}
+
+        for table, (columns, ragged) in tables.items():
+            table_shards = self.shards.setdefault(table, [])
+            start = self.table_rows(table)
+            row_num = len(next(iter(columns.values()))) if columns else 0
+            if ragged and not columns:
+                row_num = len(next(iter(ragged.values()))[1]) - 1
+
+            for shard_start in range(0, row_num, self.shard_rows):
+                shard_end = min(shard_start + self.shard_rows, row_num)
+                shard_path = "{}/shard_{:05d}".format(table, len(table_shards))
+                self._write_shard(shard_path, columns, ragged, shard_start, shard_end)
+                table_shards.append(
+                    {
+                        "path": shard_path,
+                        "start": start + shard_start,
+                        "rows": shard_end - shard_start,
+                        "design": design_index,
+                        "ragged": sorted(ragged),
+                    }
+                )
+
+            design["rows"][table] = [start, start + row_num]
+            self.shard_starts.pop(table, None)
+
+        self.designs.append(design)
+        self.logger.info("add design %s to corpus, rows : %s", name, design["rows"])
+
+    def write(self):
+        parser = JsonParser(self.corpus_path, self.logger)
+        parser.write({"designs": self.designs, "shards": self.shards}, indent=None)
+
+        self.logger.info(
+            "write corpus to %s, designs num: %d", self.corpus_dir, len(self.designs)
+        )
+        return True
+
+    def read(self):
+        if not os.path.isfile(self.corpus_path):
+            self.logger.error("corpus not exist. path = %s", self.corpus_path)
+            return False
+
+        parser = JsonParser(self.corpus_path, self.logger)
+        if parser.read() is not True:
+            return False
+
+        self.designs = parser.json_data.get("designs", [])
+        self.shards = parser.json_data.get("shards", {})
+        self.shard_starts = {
+            table: np.asarray([shard["start"] for shard in shards], dtype=np.int64)
+            for table, shards in self.shards.items()
+        }
+        self.mmaps = {}
+        return True
+
+    def table_rows(self, table: str):
+        shards = self.shards.get(table, [])
+        return shards[-1]["start"] + shards[-1]["rows"] if shards else 0
+
+    def design_rows(self, table: str, design: str):
+        """global [start, end) rows of design in table."""
+        for item in self.designs:
+            if item["name"] == design:
+                start, end = item["rows"].get(table, [0, 0])
+                return start, end
+        raise KeyError(design)
+
+    def select(self, table: str, designs: list = None):
+        """global rows of designs in table, all rows if designs is None."""
+        if designs is None:
+            return np.arange(self.table_rows(table), dtype=np.int64)
+
+        rows = [
+            np.arange(*self.design_rows(table, design), dtype=np.int64)
+            for design in designs
+        ]
+        return np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+
+    def design_of(self, table: str, rows):
+        """design index of each global row."""
+        rows = np.asarray(rows, dtype=np.int64)
+        shard_indexes = self._shard_of(table, rows)
+        designs = np.asarray(
+            [shard["design"] for shard in self.shards[table]], dtype=np.int64
+        )
+        return designs[shard_indexes]
+
+    def column(self, table: str, name: str, rows=None):
+        """values of a fixed column at global rows, all rows if rows is None."""
+        shards = self.shards.get(table, [])
+        if rows is None:
+            return np.concatenate(
+                [self._load(shard["path"], name) for shard in shards]
+            )
+
+        rows = np.asarray(rows, dtype=np.int64)
+        shard_indexes = self._shard_of(table, rows)
+        parts = []
+        positions = []
+        for shard_index in np.unique(shard_indexes):
+            mask = shard_indexes == shard_index
+            shard = shards[shard_index]
+            parts.append(self._load(shard["path"], name)[rows[mask] - shard["start"]])
+            positions.append(np.flatnonzero(mask))
+
+        if not parts:
+            return np.zeros(0)
+
+        # restore the order of rows
+        values = np.concatenate(parts)
+        order = np.empty(len(rows), dtype=np.int64)
+        order[np.concatenate(positions)] = np.arange(len(rows))
+        return values[order]
+
+    def ragged(self, table: str, name: str, row: int):
+        """view of the values of a ragged column at a global row."""
+        shard = self.shards[table][int(self._shard_of(table, np.asarray([row]))[0])]
+        offset = self._load(shard["path"], name + "_offset")
+        local = row - shard["start"]
+        return self._load(shard["path"], name)[offset[local] : offset[local + 1]]
+
+    def _shard_of(self, table: str, rows: np.ndarray):
+        starts = self.shard_starts.get(table)
+        if starts is None:
+            starts = np.asarray(
+                [shard["start"] for shard in self.shards[table]], dtype=np.int64
+            )
+            self.shard_starts[table] = starts
+
+        if len(rows) and (rows.min() < 0 or rows.max() >= self.table_rows(table)):
+            raise IndexError("row out of range of table {}".format(table))
+        return np.searchsorted(starts, rows, side="right") - 1
+
+    def _load(self, shard_path: str, name: str):
+        key = (shard_path, name)
+        if key not in self.mmaps:
+            self.mmaps[key] = np.load(
+                "{}/{}/{}.npy".format(self.corpus_dir, shard_path, name),
+                mmap_mode="r",
+                allow_pickle=False,
+            )
+        return self.mmaps[key]
+
+    def _write_shard(self, shard_path, columns, ragged, start, end):
+        shard_dir = "{}/{}".format(self.corpus_dir, shard_path)
+        os.makedirs(shard_dir, exist_ok=True)
+
+        for name, values in columns.items():
+            np.save("{}/{}.npy".format(shard_dir, name), np.asarray(values)[start:end])
+
+        for name, (values, offset) in ragged.items():
+            offset = np.asarray(offset, dtype=np.int64)
+            np.save(
+                "{}/{}.npy".format(shard_dir, name),
+                np.asarray(values)[offset[start] : offset[end]],
+            )
+            np.save(
+                "{}/{}_offset.npy".format(shard_dir, name),
+                offset[start : end + 1] - offset[start],
+            )
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_index.py
+@Author : yell
+@Desc : index of nets in vectors json files for partial reads
+"""
+import os
+import json
+
+from tqdm import tqdm
+
+from ...utility.json_parser import JsonParser, open_json_file
+from ...utility.log import Logger
+
+
+def _scan_items(text: str):
+    """yield (item, start, end) of top-level json array elements or the json object
+    in text, positions are character offsets."""
+    decoder = json.JSONDecoder()
+    whitespace = " \t\n\r,"
+
+    pos = 0
+    while pos < len(text) and text[pos] in whitespace:
+        pos += 1
+
+    if pos == len(text):
+        return
+
+    if text[pos] != "[":
+        item, end = decoder.raw_decode(text, pos)
+        yield item, pos, end
+        return
+
+    pos += 1
+    while True:
+        while pos < len(text) and text[pos] in whitespace:
+            pos += 1
+        if pos == len(text) or text[pos] == "]":
+            return
+
+        item, end = decoder.raw_decode(text, pos)
+        yield item, pos, end
+        pos = end
+
+
+class VectorsNetIndex:
+    """map net id and net name to the file, byte offset and byte length of the net
+    in vectors nets json files.
+
+    offsets of compressed files are offsets in the uncompressed data. the index stores
+    size and mtime of the files, it is invalid if any of the nets files changes.
+    """
+
+    def __init__(self, index_path: str, logger: Logger = None):
+        self.index_path = index_path
+        if logger is None:
+            self.logger = Logger("VectorsNetIndex")
+        else:
+            self.logger = logger
+
+        # [[filepath, size, mtime]]
+        self.files = []
+        # [[net_id, net_name, file_index, offset, length]]
+        self.nets = []
+        self.id_map = {}
+        self.name_map = {}
+
+    def build(self, json_files: list):
+        self.files = []
+        self.nets = []
+
+        for file_index, filepath in enumerate(tqdm(json_files, desc="vectors nets index")):
+            stat = os.stat(filepath)
+            self.files.append([filepath, stat.st_size, stat.st_mtime_ns])
+
+            with open_json_file(filepath, "rb") as f:
+                data = f.read()
+
+            # latin-1 maps each byte to one char, so char offsets are byte offsets
+            try:
+                for item, start, end in _scan_items(data.decode("latin-1")):
+                    name = item.get("name")
+                    if name is not None and not name.isascii():
+                        # decode non-ascii names from the utf-8 bytes of the net
+                        name = json.loads(data[start:end]).get("name")
+                    self.nets.append(
+                        [item.get("id"), name, file_index, start, end - start]
+                    )
+            except ValueError:
+                self.logger.error("json file format error. path = %s", filepath)
+
+        self._build_maps()
+        return self
+
+    def is_valid(self, json_files: list):
+        if len(json_files) != len(self.files):
+            return False
+
+        for filepath, (index_filepath, size, mtime) in zip(json_files, self.files):
+            if filepath != index_filepath or not os.path.isfile(filepath):
+                return False
+            stat = os.stat(filepath)
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+
+        return True
+
+    def write(self):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        parser = JsonParser(self.index_path, self.logger)
+        parser.write({"files": self.files, "nets": self.nets}, indent=None)
+
+        self.logger.info(
+            "write nets index to %s, nets num: %d", self.index_path, len(self.nets)
+        )
+        return True
+
+    def read(self):
+        if not os.path.isfile(self.index_path):
+            return False
+
+        parser = JsonParser(self.index_path, self.logger)
+        if parser.read() is not True:
+            return False
+
+        self.files = parser.json_data.get("files", [])
+        self.nets = parser.json_data.get("nets", [])
+        self._build_maps()
+        return True
+
+    def find(self, id_or_name):
+        """return (filepath, offset, length) of the net, None if not found.
+        int for net id and str for net name."""
+        if isinstance(id_or_name, str):
+            net_index = self.name_map.get(id_or_name)
+        else:
+            net_index = self.id_map.get(id_or_name)
+
+        if net_index is None:
+            return None
+
+        _, _, file_index, offset, length = self.nets[net_index]
+        return self.files[file_index][0], offset, length
+
+    def _build_maps(self):
+        self.id_map = {}
+        self.name_map = {}
+        for net_index, (net_id, net_name, _, _, _) in enumerate(self.nets):
+            self.id_map[net_id] = net_index
+            self.name_map[net_name] = net_index
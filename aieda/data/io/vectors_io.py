@@ -6,233 +6,271 @@
 @Desc : parser for vectors
 """
 import os
+import hashlib
+import numpy as np
 from tqdm import tqdm
 
-from ...utility.json_parser import JsonParser
+from ...utility.json_parser import JsonParser, json_loads, open_json_file
 from ...utility.log import Logger
 from ..database import *
 
 
+# fields of VectorNet that can be projected, id, name, pin_num and wire_num are always parsed,
+# "paths" is the paths of each wire and only works with "wires"
+NET_FIELDS = frozenset(["feature", "pins", "wires", "paths", "routing_graph"])
+
+# fields of VectorPatch that can be projected, patch scalars are always parsed,
+# "nets" is the nets of each patch layer and only works with "patch_layer"
+PATCH_FIELDS = frozenset(["patch_layer", "nets"])
+
+
 class VectorsParserJson(JsonParser):
     def __init__(self, json_path: str, logger: Logger = None):
         super().__init__(json_path, logger)
+        # pin and timing node names of the parsed file, objects store ids of the table
+        self.name_table = VectorNameTable()
 
-    def get_nets(self) -> list[VectorNet]:
+    def get_nets(self, fields: set = None) -> list[VectorNet]:
+        """fields : subset of NET_FIELDS to parse, e.g. {"feature", "pins"}, None for all."""
         vec_nets = []
 
-        if self.read() is True:
-            # multi nets in json_data
-            if isinstance(self.json_data, list):
-                for net_metadata in self.json_data:
-                    vec_net = self._parse_single_net(net_metadata)
-                    vec_nets.append(vec_net)
-            else:
-                # sing net in json_data
-                vec_net = self._parse_single_net(self.json_data)
-                vec_nets.append(vec_net)
+        # multi nets or single net in json, compressed files are decoded net by net
+        for net_metadata in self.iter_items():
+            vec_net = self._parse_single_net(net_metadata, fields)
+            vec_nets.append(vec_net)
 
         return vec_nets
-    
-    def _parse_single_net(self, net_metadata) -> VectorNet:
-        """parse a single net from net_metadata dict."""
+
+    def get_net_at(self, offset: int, length: int, fields: set = None) -> VectorNet:
+        """parse the single net stored at byte offset of the json file,
+        offset is in the uncompressed data for compressed files."""
+        try:
+            with open_json_file(self.json_path, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+
+            return self._parse_single_net(json_loads(data), fields)
+        except (OSError, ValueError) as e:
+            self.logger.error("read net at %d of %s failed : %s", offset, self.json_path, e)
+            return None
+
+    def _parse_single_net(self, net_metadata, fields: set = None) -> VectorNet:
+        """parse a single net from net_metadata dict.
+        fields : subset of NET_FIELDS to parse, None for all.
+        """
+        if fields is None:
+            fields = NET_FIELDS
+
         try:
             # net
             vec_net = VectorNet()
             vec_net.id = net_metadata.get("id")
             vec_net.name = net_metadata.get("name")
-
-            # net feature
-            net_feature = VectorNetFeature()
-            feature_data = net_metadata.get("feature", {})
-            net_feature.llx = feature_data.get("llx")
-            net_feature.lly = feature_data.get("lly")
-            net_feature.urx = feature_data.get("urx")
-            net_feature.ury = feature_data.get("ury")
-            net_feature.wire_len = feature_data.get("wire_len")
-            net_feature.via_num = feature_data.get("via_num")
-            net_feature.drc_num = feature_data.get("drc_num")
-            net_feature.R = feature_data.get("R")
-            net_feature.C = feature_data.get("C")
-            net_feature.power = feature_data.get("power")
-            net_feature.delay = feature_data.get("delay")
-            net_feature.slew = feature_data.get("slew")
-            net_feature.aspect_ratio = feature_data.get("aspect_ratio")
-            net_feature.width = feature_data.get("width")
-            net_feature.height = feature_data.get("height")
-            net_feature.area = feature_data.get("area")
-            net_feature.drc_type = feature_data.get("drc_type")
-            net_feature.volume = feature_data.get("volume")
-            net_feature.layer_ratio = feature_data.get("layer_ratio")
-
-            # parse place_feature
-            place_feature_data = feature_data.get("place_feature", {})
-            place_feature = VectorPlaceFeature()
-            place_feature.pin_num = place_feature_data.get("pin_num")
-            place_feature.aspect_ratio = place_feature_data.get("aspect_ratio")
-            place_feature.width = place_feature_data.get("width")
-            place_feature.height = place_feature_data.get("height")
-            place_feature.area = place_feature_data.get("area")
-            place_feature.l_ness = place_feature_data.get("l_ness")
-            place_feature.rsmt = place_feature_data.get("rsmt")
-            place_feature.hpwl = place_feature_data.get("hpwl")
-            net_feature.place_feature = place_feature
-
-            vec_net.feature = net_feature
-
-            # pins
             vec_net.pin_num = net_metadata.get("pin_num", 0)
-            json_pins = net_metadata.get("pins", [])
-            for json_pin in json_pins:
-                vec_pin = VectorPin()
-                vec_pin.id = json_pin.get("id")
-                vec_pin.instance = json_pin.get("i")
-                vec_pin.pin_name = json_pin.get("p")
-                vec_pin.is_driver = json_pin.get("driver")
+            vec_net.wire_num = net_metadata.get("wire_num", 0)
 
-                vec_net.pins.append(vec_pin)
+            if "feature" in fields:
+                vec_net.feature = self._parse_net_feature(net_metadata.get("feature", {}))
 
-            # wires
-            vec_net.wire_num = net_metadata.get("wire_num", 0)
-            json_wires = net_metadata.get("wires", [])
-            for json_wire in json_wires:
-                vec_wire = VectorWire()
-                vec_wire.id = json_wire.get("id")
-
-                # wire feature
-                wire_feature = VectorWireFeature()
-                wire_feature_data = json_wire.get("feature", {})
-                wire_feature.wire_width = wire_feature_data.get("wire_width")
-                wire_feature.wire_len = wire_feature_data.get("wire_len")
-                wire_feature.drc_num = wire_feature_data.get("drc_num")
-                wire_feature.R = wire_feature_data.get("R")
-                wire_feature.C = wire_feature_data.get("C")
-                wire_feature.power = wire_feature_data.get("power")
-                wire_feature.delay = wire_feature_data.get("delay")
-                wire_feature.slew = wire_feature_data.get("slew")
-                wire_feature.congestion = wire_feature_data.get("congestion")
-                wire_feature.wire_density = wire_feature_data.get("wire_density")
-                wire_feature.drc_type = wire_feature_data.get("drc_type")
-
-                vec_wire.feature = wire_feature
-
-                # wire connections
-                wire_data = json_wire.get("wire", {})
-                wire_connections = VectorPath()
-
-                vec_node1 = VectorNode()
-                vec_node1.id = wire_data.get("id1")
-                vec_node1.x = wire_data.get("x1")
-                vec_node1.y = wire_data.get("y1")
-                vec_node1.real_x = wire_data.get("real_x1")
-                vec_node1.real_y = wire_data.get("real_y1")
-                vec_node1.row = wire_data.get("r1")
-                vec_node1.col = wire_data.get("c1")
-                vec_node1.layer = wire_data.get("l1")
-                vec_node1.pin_id = wire_data.get("p1")
-                wire_connections.node1 = vec_node1
-
-                vec_node2 = VectorNode()
-                vec_node2.id = wire_data.get("id2")
-                vec_node2.x = wire_data.get("x2")
-                vec_node2.y = wire_data.get("y2")
-                vec_node2.real_x = wire_data.get("real_x2")
-                vec_node2.real_y = wire_data.get("real_y2")
-                vec_node2.row = wire_data.get("r2")
-                vec_node2.col = wire_data.get("c2")
-                vec_node2.layer = wire_data.get("l2")
-                vec_node2.pin_id = wire_data.get("p2")
-                wire_connections.node2 = vec_node2
-                
-                if "via" in wire_data:
-                    wire_connections.via = wire_data.get("via")
-
-                vec_wire.wire = wire_connections
-
-                # path
-                vec_wire.path_num = json_wire.get("path_num", 0)
-                json_paths = json_wire.get("paths", [])
-                for json_path in json_paths:
-                    wire_path = VectorPath()
-
-                    vec_path_node1 = VectorNode()
-                    vec_path_node1.id = json_path.get("id1")
-                    vec_path_node1.x = json_path.get("x1")
-                    vec_path_node1.y = json_path.get("y1")
-                    vec_path_node1.real_x = json_path.get("real_x1")
-                    vec_path_node1.real_y = json_path.get("real_y1")
-                    vec_path_node1.row = json_path.get("r1")
-                    vec_path_node1.col = json_path.get("c1")
-                    vec_path_node1.layer = json_path.get("l1")
-                    wire_path.node1 = vec_path_node1
-
-                    vec_path_node2 = VectorNode()
-                    vec_path_node2.id = json_path.get("id2")
-                    vec_path_node2.x = json_path.get("x2")
-                    vec_path_node2.y = json_path.get("y2")
-                    vec_path_node2.real_x = json_path.get("real_x2")
-                    vec_path_node2.real_y = json_path.get("real_y2")
-                    vec_path_node2.row = json_path.get("r2")
-                    vec_path_node2.col = json_path.get("c2")
-                    vec_path_node2.layer = json_path.get("l2")
-                    wire_path.node2 = vec_path_node2
-
-                    if "via" in json_path:
-                        wire_path.via = json_path.get("via")
-
-                    vec_wire.paths.append(wire_path)
-
-                vec_net.wires.append(vec_wire)
-
-            # routing graph
-            routing_graph_data = net_metadata.get("routing_graph", {})
-            vertices = []
-            for v in routing_graph_data.get("vertices", []):
-                point = VectorNetRoutingPoint(
-                    x=v["x"], y=v["y"], layer_id=v["layer_id"]
-                )
-                vertex = VectorNetRoutingVertex(
-                    id=v["id"],
-                    is_pin=v["is_pin"],
-                    is_driver_pin=v["is_driver_pin"],
-                    point=point,
+            if "pins" in fields:
+                self._parse_net_pins(vec_net, net_metadata.get("pins", []))
+
+            if "wires" in fields:
+                self._parse_net_wires(
+                    vec_net, net_metadata.get("wires", []), "paths" in fields
                 )
-                vertices.append(vertex)
 
-            edges = []
-            for e in routing_graph_data.get("edges", []):
-                path = [VectorNetRoutingPoint(**p) for p in e["path"]]
-                edge = VectorNetRoutingEdge(
-                    source_id=e["source_id"], target_id=e["target_id"], path=path
+            if "routing_graph" in fields:
+                vec_net.routing_graph = self._parse_net_routing_graph(
+                    net_metadata.get("routing_graph", {})
                 )
-                edges.append(edge)
-            routing_graph = VectorNetRoutingGraph(vertices=vertices, edges=edges)
-            vec_net.routing_graph = routing_graph
 
             return vec_net
         except Exception as e:
             self.logger.error(f"Error parsing net data: {e}")
             return None
 
-    def get_patchs(self) -> list[VectorPatch]:
+    def _parse_net_feature(self, feature_data: dict) -> VectorNetFeature:
+        net_feature = VectorNetFeature()
+        net_feature.llx = feature_data.get("llx")
+        net_feature.lly = feature_data.get("lly")
+        net_feature.urx = feature_data.get("urx")
+        net_feature.ury = feature_data.get("ury")
+        net_feature.wire_len = feature_data.get("wire_len")
+        net_feature.via_num = feature_data.get("via_num")
+        net_feature.drc_num = feature_data.get("drc_num")
+        net_feature.R = feature_data.get("R")
+        net_feature.C = feature_data.get("C")
+        net_feature.power = feature_data.get("power")
+        net_feature.delay = feature_data.get("delay")
+        net_feature.slew = feature_data.get("slew")
+        net_feature.aspect_ratio = feature_data.get("aspect_ratio")
+        net_feature.width = feature_data.get("width")
+        net_feature.height = feature_data.get("height")
+        net_feature.area = feature_data.get("area")
+        net_feature.drc_type = feature_data.get("drc_type")
+        net_feature.volume = feature_data.get("volume")
+        net_feature.layer_ratio = feature_data.get("layer_ratio")
+
+        # parse place_feature
+        place_feature_data = feature_data.get("place_feature", {})
+        place_feature = VectorPlaceFeature()
+        place_feature.pin_num = place_feature_data.get("pin_num")
+        place_feature.aspect_ratio = place_feature_data.get("aspect_ratio")
+        place_feature.width = place_feature_data.get("width")
+        place_feature.height = place_feature_data.get("height")
+        place_feature.area = place_feature_data.get("area")
+        place_feature.l_ness = place_feature_data.get("l_ness")
+        place_feature.rsmt = place_feature_data.get("rsmt")
+        place_feature.hpwl = place_feature_data.get("hpwl")
+        net_feature.place_feature = place_feature
+
+        return net_feature
+
+    def _parse_net_pins(self, vec_net: VectorNet, json_pins: list):
+        for json_pin in json_pins:
+            vec_pin = VectorPin()
+            vec_pin.id = json_pin.get("id")
+            vec_pin.is_driver = json_pin.get("driver")
+            self.name_table.intern_pin(vec_pin, json_pin.get("i"), json_pin.get("p"))
+
+            vec_net.pins.append(vec_pin)
+
+    def _parse_net_wires(self, vec_net: VectorNet, json_wires: list, with_paths=True):
+        for json_wire in json_wires:
+            vec_wire = VectorWire()
+            vec_wire.id = json_wire.get("id")
+
+            # wire feature
+            wire_feature = VectorWireFeature()
+            wire_feature_data = json_wire.get("feature", {})
+            wire_feature.wire_width = wire_feature_data.get("wire_width")
+            wire_feature.wire_len = wire_feature_data.get("wire_len")
+            wire_feature.drc_num = wire_feature_data.get("drc_num")
+            wire_feature.R = wire_feature_data.get("R")
+            wire_feature.C = wire_feature_data.get("C")
+            wire_feature.power = wire_feature_data.get("power")
+            wire_feature.delay = wire_feature_data.get("delay")
+            wire_feature.slew = wire_feature_data.get("slew")
+            wire_feature.congestion = wire_feature_data.get("congestion")
+            wire_feature.wire_density = wire_feature_data.get("wire_density")
+            wire_feature.drc_type = wire_feature_data.get("drc_type")
+
+            vec_wire.feature = wire_feature
+
+            # wire connections
+            wire_data = json_wire.get("wire", {})
+            wire_connections = VectorPath()
+
+            vec_node1 = VectorNode()
+            vec_node1.id = wire_data.get("id1")
+            vec_node1.x = wire_data.get("x1")
+            vec_node1.y = wire_data.get("y1")
+            vec_node1.real_x = wire_data.get("real_x1")
+            vec_node1.real_y = wire_data.get("real_y1")
+            vec_node1.row = wire_data.get("r1")
+            vec_node1.col = wire_data.get("c1")
+            vec_node1.layer = wire_data.get("l1")
+            vec_node1.pin_id = wire_data.get("p1")
+            wire_connections.node1 = vec_node1
+
+            vec_node2 = VectorNode()
+            vec_node2.id = wire_data.get("id2")
+            vec_node2.x = wire_data.get("x2")
+            vec_node2.y = wire_data.get("y2")
+            vec_node2.real_x = wire_data.get("real_x2")
+            vec_node2.real_y = wire_data.get("real_y2")
+            vec_node2.row = wire_data.get("r2")
+            vec_node2.col = wire_data.get("c2")
+            vec_node2.layer = wire_data.get("l2")
+            vec_node2.pin_id = wire_data.get("p2")
+            wire_connections.node2 = vec_node2
+            
+            if "via" in wire_data:
+                wire_connections.via = wire_data.get("via")
+
+            vec_wire.wire = wire_connections
+
+            # path
+            vec_wire.path_num = json_wire.get("path_num", 0)
+            if with_paths:
+                self._parse_wire_paths(vec_wire, json_wire.get("paths", []))
+
+            vec_net.wires.append(vec_wire)
+
+    def _parse_wire_paths(self, vec_wire: VectorWire, json_paths: list):
+        for json_path in json_paths:
+            wire_path = VectorPath()
+
+            vec_path_node1 = VectorNode()
+            vec_path_node1.id = json_path.get("id1")
+            vec_path_node1.x = json_path.get("x1")
+            vec_path_node1.y = json_path.get("y1")
+            vec_path_node1.real_x = json_path.get("real_x1")
+            vec_path_node1.real_y = json_path.get("real_y1")
+            vec_path_node1.row = json_path.get("r1")
+            vec_path_node1.col = json_path.get("c1")
+            vec_path_node1.layer = json_path.get("l1")
+            wire_path.node1 = vec_path_node1
+
+            vec_path_node2 = VectorNode()
+            vec_path_node2.id = json_path.get("id2")
+            vec_path_node2.x = json_path.get("x2")
+            vec_path_node2.y = json_path.get("y2")
+            vec_path_node2.real_x = json_path.get("real_x2")
+            vec_path_node2.real_y = json_path.get("real_y2")
+            vec_path_node2.row = json_path.get("r2")
+            vec_path_node2.col = json_path.get("c2")
+            vec_path_node2.layer = json_path.get("l2")
+            wire_path.node2 = vec_path_node2
+
+            if "via" in json_path:
+                wire_path.via = json_path.get("via")
+
+            vec_wire.paths.append(wire_path)
+
+    def _parse_net_routing_graph(self, routing_graph_data: dict) -> VectorNetRoutingGraph:
+        vertices = []
+        for v in routing_graph_data.get("vertices", []):
+            point = VectorNetRoutingPoint(
+                x=v["x"], y=v["y"], layer_id=v["layer_id"]
+            )
+            vertex = VectorNetRoutingVertex(
+                id=v["id"],
+                is_pin=v["is_pin"],
+                is_driver_pin=v["is_driver_pin"],
+                point=point,
+            )
+            vertices.append(vertex)
+
+        edges = []
+        for e in routing_graph_data.get("edges", []):
+            path = [VectorNetRoutingPoint(**p) for p in e["path"]]
+            edge = VectorNetRoutingEdge(
+                source_id=e["source_id"], target_id=e["target_id"], path=path
+            )
+            edges.append(edge)
+        return VectorNetRoutingGraph(vertices=vertices, edges=edges)
+
+    def get_patchs(self, fields: set = None) -> list[VectorPatch]:
+        """fields : subset of PATCH_FIELDS to parse, None for all."""
         vec_patchs = []
-        
-        if self.read() is True:
-            # multi patches in json_data
-            if isinstance(self.json_data, list):
-                for patch_metadata in tqdm(
-                    self.json_data, total=len(self.json_data), desc="load patchs"
-                ):
-                    vec_patch = self._parse_single_patch(patch_metadata)
-                    vec_patchs.append(vec_patch)
-            else:
-                # single patch in json_data
-                vec_patch = self._parse_single_patch(self.json_data)
-                vec_patchs.append(vec_patch)
+
+        # multi patches or single patch in json, compressed files are decoded patch by
+        # patch
+        for patch_metadata in tqdm(self.iter_items(), desc="load patchs"):
+            vec_patch = self._parse_single_patch(patch_metadata, fields)
+            vec_patchs.append(vec_patch)
 
         return vec_patchs
-    
-    def _parse_single_patch(self, patch_metadata) -> VectorPatch:
-        """parse a single patch from patch_metadata dict."""
+
+    def _parse_single_patch(self, patch_metadata, fields: set = None) -> VectorPatch:
+        """parse a single patch from patch_metadata dict.
+        fields : subset of PATCH_FIELDS to parse, None for all.
+        """
+        if fields is None:
+            fields = PATCH_FIELDS
+
         try:
             vec_patch = VectorPatch()
 
@@ -259,7 +297,9 @@ class VectorsParserJson(JsonParser):
             vec_patch.ir_drop_map = patch_metadata.get("IR_drop")
 
             # patch layer
-            json_patch_layers = patch_metadata.get("patch_layer", [])
+            json_patch_layers = (
+                patch_metadata.get("patch_layer", []) if "patch_layer" in fields else []
+            )
             for json_patch_layer in json_patch_layers:
                 patch_layer = VectorPatchLayer()
                 patch_layer.id = json_patch_layer.get("id")
@@ -270,7 +310,7 @@ class VectorsParserJson(JsonParser):
                 patch_layer.wire_density = feature.get("wire_density")
                 patch_layer.congestion = feature.get("congestion")
 
-                json_nets = json_patch_layer.get("nets", [])
+                json_nets = json_patch_layer.get("nets", []) if "nets" in fields else []
                 for json_net in json_nets:
                     # net
                     vec_net = VectorNet()
@@ -466,6 +506,79 @@ class VectorsParserJson(JsonParser):
 
         return None
 
+    def get_wire_graph_arrays(self) -> VectorGraphArrays:
+        """timing wire graph as VectorGraphArrays without node and edge objects."""
+        return self._parse_graph_arrays(
+            node_attrs={"is_pin": np.bool_, "is_port": np.bool_},
+            edge_attrs={"is_net_edge": np.bool_},
+        )
+
+    def _parse_graph_arrays(self, node_attrs: dict, edge_attrs: dict):
+        """node_attrs, edge_attrs : {json key : dtype} of attributes to keep."""
+        if self.read() is not True:
+            return None
+
+        json_nodes = self.json_data.get("nodes", [])
+        json_edges = self.json_data.get("edges", [])
+        graph = VectorGraphArrays()
+
+        # intern node names
+        name_ids = {}
+        graph.node_name_ids = np.fromiter(
+            (
+                name_ids.setdefault(json_node.get("name"), len(name_ids))
+                for json_node in json_nodes
+            ),
+            dtype=np.int32,
+            count=len(json_nodes),
+        )
+        graph.names = np.asarray(
+            ["" if name is None else name for name in name_ids], dtype=np.str_
+        )
+        for key, dtype in node_attrs.items():
+            graph.node_attrs[key] = np.asarray(
+                [json_node.get(key) or 0 for json_node in json_nodes], dtype=dtype
+            )
+
+        # edges refer to nodes by node index, or by the number in node id "node_<n>"
+        index_of = {}
+        for index, json_node in enumerate(json_nodes):
+            index_of[json_node.get("id")] = index
+        src = np.asarray(
+            [self._graph_node_index(index_of, e.get("from_node")) for e in json_edges],
+            dtype=np.int32,
+        )
+        dst = np.asarray(
+            [self._graph_node_index(index_of, e.get("to_node")) for e in json_edges],
+            dtype=np.int32,
+        )
+        valid = (src >= 0) & (dst >= 0)
+        if not valid.all():
+            self.logger.warning(
+                "%d edges refer to unknown nodes. path = %s",
+                np.count_nonzero(~valid),
+                self.json_path,
+            )
+        graph.edge_src = src[valid]
+        graph.edge_dst = dst[valid]
+        for key, dtype in edge_attrs.items():
+            graph.edge_attrs[key] = np.asarray(
+                [json_edge.get(key) or 0 for json_edge in json_edges], dtype=dtype
+            )[valid]
+
+        self.logger.info(
+            "graph nodes num: %d, edges num: %d", graph.node_num, graph.edge_num
+        )
+        return graph
+
+    def _graph_node_index(self, index_of: dict, node):
+        index = index_of.get(node)
+        if index is None:
+            index = index_of.get("node_{}".format(node))
+        if index is None:
+            index = index_of.get(str(node))
+        return -1 if index is None else index
+
     class TimingWirePathData:
         def __init__(self):
             self.capacitance_list = []
@@ -517,154 +630,100 @@ class VectorsParserJson(JsonParser):
             hash_object = hashlib.md5(concatenated.encode())
             return hash_object.hexdigest()
 
+    def get_wire_path(self) -> VectorTimingWirePath:
+        """walk the wire path file once, return VectorTimingWirePath with nodes, C/slew/R/incr
+        arrays and delay metrics, None if the file can not be read."""
+        if self.read() is not True:
+            return None
+
+        nodes = []
+        capacitance = []
+        slew = []
+        resistance = []
+        incr = []
+        incr_is_net = []
+        inst_delay = []
+        net_delay = []
+        last_net_arc = None
+
+        for json_item in self.json_data:
+            for key, json_value in json_item.items():
+                if key.startswith("node_"):
+                    node_name = json_value.get("Point")
+                    if node_name.find("(") != -1:
+                        node_name = node_name[: node_name.find("(")].strip()
+                    nodes.append(node_name)
+                    capacitance.append(json_value.get("Capacitance", 0))
+                    slew.append(json_value.get("slew", 0))
+                    # default R value for nodes
+                    resistance.append(0)
+
+                elif key.startswith("net_arc_"):
+                    delay = json_value.get("Incr", 0)
+                    incr.append(delay)
+                    incr_is_net.append(True)
+                    net_delay.append(delay)
+                    last_net_arc = int(key.split("_")[-1])
+
+                    for edge_key, edge_value in json_value.items():
+                        if edge_key.startswith("edge_"):
+                            capacitance.append(edge_value.get("wire_C", 0))
+                            slew.append(edge_value.get("to_slew", 0))
+                            resistance.append(edge_value.get("wire_R", 0))
+                            # record edge node
+                            nodes.append(edge_value.get("wire_to_node", ""))
+
+                elif key.startswith("inst_arc_"):
+                    delay = json_value.get("Incr", 0)
+                    incr.append(delay)
+                    incr_is_net.append(False)
+                    inst_delay.append(delay)
+
+        return VectorTimingWirePath(
+            path_hash=hashlib.md5("".join(nodes).encode()).hexdigest(),
+            node_ids=self.name_table.intern_array(nodes),
+            name_table=self.name_table,
+            capacitance=np.asarray(capacitance, dtype=np.float64),
+            slew=np.asarray(slew, dtype=np.float64),
+            resistance=np.asarray(resistance, dtype=np.float64),
+            incr=np.asarray(incr, dtype=np.float64),
+            incr_is_net=np.asarray(incr_is_net, dtype=np.bool_),
+            stage=None if last_net_arc is None else (last_net_arc + 1) / 2,
+            inst_delay=np.asarray(inst_delay, dtype=np.float64),
+            net_delay=np.asarray(net_delay, dtype=np.float64),
+        )
+
     def get_timing_wire_paths(self):
         """return :
         path_hash : unique hash string
         wire_path_graph : VectorTimingWirePathGraph
         """
+        wire_path = self.get_wire_path()
+        if wire_path is None:
+            return None
 
-        def get_path_data_package() -> self.TimingWirePathData:
-            remove_parentheses_content = lambda s: (
-                s[: s.find("(")].strip() if s.find("(") != -1 else s
-            )
-
-            if self.read() is True:
-                path_data = self.TimingWirePathData()
-
-                for json_item in self.json_data:
-                    for key, json_value in json_item.items():
-                        if key.startswith("node_"):
-
-                            node_name = json_value.get("Point")
-                            node_name = remove_parentheses_content(node_name)
-                            path_data.nodes.append(node_name)
-                            path_data.capacitance_list.append(
-                                json_value.get("Capacitance", 0)
-                            )
-                            path_data.slew_list.append(json_value.get("slew", 0))
-                            path_data.resistance_list.append(
-                                0
-                            )  # Default R value for nodes
-
-                        elif key.startswith("net_arc_"):
-                            path_data.incr_list.append(json_value.get("Incr", 0))
-                            for edge_key, edge_value in json_value.items():
-                                if edge_key.startswith("edge_"):
-                                    path_data.capacitance_list.append(
-                                        edge_value.get("wire_C", 0)
-                                    )
-                                    path_data.slew_list.append(
-                                        edge_value.get("to_slew", 0)
-                                    )
-                                    path_data.resistance_list.append(
-                                        edge_value.get("wire_R", 0)
-                                    )
-
-                                    # record edge node
-                                    path_data.nodes.append(
-                                        edge_value.get("wire_to_node", "")
-                                    )
-
-                        elif key.startswith("inst_arc_"):
-                            path_data.incr_list.append(json_value.get("Incr", 0))
-
-            return path_data
-
-        def construct_path_graph(nodes) -> VectorTimingWirePathGraph:
-            """construct a path graph from yaml data."""
-            wire_path_nodes = []
-            wire_path_edges = []
-            for index, node_name in enumerate(nodes):
-                parts = node_name.split(":")
-                is_port = True if len(parts) == 1 else False
-                is_pin = True if len(parts) == 2 and not parts[1].isdigit() else False
-                wire_path_node = VectorTimingWireGraphNode(node_name, is_pin, is_port)
-                wire_path_nodes.append(wire_path_node)
-
-                if index > 0:
-                    wire_path_edge = VectorTimingWireGraphEdge(index - 1, index)
-                    wire_path_edges.append(wire_path_edge)
-
-            wire_path_graph = VectorTimingWirePathGraph(
-                wire_path_nodes, wire_path_edges
-            )
-            return wire_path_graph
-
-        path_data_package = get_path_data_package()
-        wire_path_graph = construct_path_graph(path_data_package.nodes)
-        path_hash = path_data_package.generate_hash()
-
-        return path_hash, wire_path_graph
+        return wire_path.path_hash, wire_path.path_graph()
 
     def get_wire_paths_data(self) -> VectorTimingWirePathData:
         """Get detailed wire path data including capacitance, slew, resistance, incr and nodes."""
-        
-        def remove_parentheses_content(s):
-            return s[:s.find("(")].strip() if s.find("(") != -1 else s
+        wire_path = self.get_wire_path()
+        if wire_path is None:
+            return None
 
-        if self.read() is True:
-            path_data = VectorTimingWirePathData()
-
-            for json_item in self.json_data:
-                for key, json_value in json_item.items():
-                    if key.startswith("node_"):
-                        # Process node data
-                        node_name = json_value.get("Point")
-                        node_name = remove_parentheses_content(node_name)
-                        path_data.nodes.append(node_name)
-                        path_data.capacitance_list.append(json_value.get("Capacitance", 0))
-                        path_data.slew_list.append(json_value.get("slew", 0))
-                        path_data.resistance_list.append(0)  # Default R value for nodes
-
-                    elif key.startswith("net_arc_"):
-                        # Process net arc data
-                        path_data.incr_list.append(json_value.get("Incr", 0))
-                        for edge_key, edge_value in json_value.items():
-                            if edge_key.startswith("edge_"):
-                                path_data.capacitance_list.append(edge_value.get("wire_C", 0))
-                                path_data.slew_list.append(edge_value.get("to_slew", 0))
-                                path_data.resistance_list.append(edge_value.get("wire_R", 0))
-
-                                # Record edge node
-                                path_data.nodes.append(edge_value.get("wire_to_node", ""))
-
-                    elif key.startswith("inst_arc_"):
-                        # Process instance arc data
-                        path_data.incr_list.append(json_value.get("Incr", 0))
-
-            return path_data
-        return None
+        return wire_path.path_data()
 
     def get_timing_paths_metrics(self) -> VectorPathMetrics:
+        wire_path = self.get_wire_path()
+        if wire_path is None:
+            return VectorPathMetrics()
 
-        path_data = VectorPathMetrics()
-        if self.read() is True:
-            for json_item in self.json_data:
-                for key, json_value in json_item.items():
-                    if key.startswith("node_"):
-                        break
-
-                    elif key.startswith("net_arc_"):
-                        path_data.net_delay.append(json_value.get("Incr", 0))
-                        # Find the last net_arc_ key
-                        net_arc_keys = [
-                            key
-                            for key in json_item.keys()
-                            if key.startswith("net_arc_")
-                        ]
-
-                    elif key.startswith("inst_arc_"):
-                        path_data.inst_delay.append(json_value.get("Incr", 0))
-
-            if net_arc_keys:
-                last_net_arc_key = max(
-                    net_arc_keys, key=lambda x: int(x.split("_")[-1])
-                )
-                path_data.stage = (int(last_net_arc_key.split("_")[-1]) + 1) / 2
-            else:
-                path_data.stage = None
+        return wire_path.metrics()
 
-        return path_data
+    def get_instance_graph_arrays(self) -> VectorGraphArrays:
+        """instance graph as VectorGraphArrays without node and edge objects."""
+        return self._parse_graph_arrays(
+            node_attrs={"leakage_power": np.float64}, edge_attrs={}
+        )
 
     def get_instance_graph(self):
         if self.read() is True:
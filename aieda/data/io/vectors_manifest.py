@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_manifest.py
+@Author : yell
+@Desc : manifest of vectors output files, replaces directory scans of loaders
+"""
+import os
+import re
+import zlib
+
+from tqdm import tqdm
+
+from ...utility.json_parser import JsonParser, is_json_file
+from ...utility.log import Logger
+
+# vectors sub directories recorded in the manifest
+MANIFEST_DIRS = ["nets", "patchs", "wire_paths"]
+
+# bytes read at a time when computing checksums
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+
+def scan_json_files(directory: str):
+    """collect plain and compressed json files under directory, sorted by natural
+    order of file names, e.g. net_2.json is before net_10.json."""
+    json_files = []
+    for root, dirs, files in os.walk(directory):
+        for file in files:
+            if is_json_file(file):
+                json_files.append(os.path.join(root, file))
+
+    def natural_key(path):
+        return [
+            int(part) if part.isdigit() else part for part in re.split(r"(\d+)", path)
+        ]
+
+    return sorted(json_files, key=natural_key)
+
+
+class VectorsManifest:
+    """file list of vectors nets, patchs and wire_paths directories, with size, mtime,
+    and optionally element count and crc32 checksum of each file.
+
+    the manifest also stores mtime of every scanned directory, a directory entry is
+    stale if any of its directories changed, i.e. files were added or removed. files
+    rewritten in place do not change the directory mtimes, is_valid(check_files=True)
+    and verify check the recorded files too.
+    """
+
+    def __init__(
+        self, vectors_dir: str, manifest_path: str = None, logger: Logger = None
+    ):
+        self.vectors_dir = vectors_dir
+        if manifest_path is None:
+            manifest_path = "{}/manifest.json".format(vectors_dir)
+        self.manifest_path = manifest_path
+        if logger is None:
+            self.logger = Logger("VectorsManifest")
+        else:
+            self.logger = logger
+
+        # {dir name : {"dirs" : [[path, mtime]],
+        #              "files" : [[path, size, mtime, count, crc32]]}}
+        self.dirs = {}
+
+    def build(
+        self,
+        dir_names: list = MANIFEST_DIRS,
+        count_items: bool = False,
+        checksum: bool = False,
+    ):
+        """count_items : record the element count of each file, which parses every file
+        checksum : record the crc32 of each file, which reads every file
+        counts and checksums not recorded are None."""
+        self.dirs = {}
+        for dir_name in dir_names:
+            directory = "{}/{}".format(self.vectors_dir, dir_name)
+            if not os.path.isdir(directory):
+                continue
+
+            dirs = []
+            for root, _, _ in os.walk(directory):
+                dirs.append([root, os.stat(root).st_mtime_ns])
+
+            files = []
+            for filepath in tqdm(
+                scan_json_files(directory), desc="manifest {}".format(dir_name)
+            ):
+                stat = os.stat(filepath)
+                files.append(
+                    [
+                        filepath,
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                        self._count_items(filepath) if count_items else None,
+                        self._checksum(filepath) if checksum else None,
+                    ]
+                )
+
+            self.dirs[dir_name] = {"dirs": dirs, "files": files}
+
+        return self
+
+    def write(self):
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        parser = JsonParser(self.manifest_path, self.logger)
+        parser.write({"vectors_dir": self.vectors_dir, "dirs": self.dirs}, indent=None)
+
+        self.logger.info(
+            "write vectors manifest to %s, files num: %d",
+            self.manifest_path,
+            sum(len(entry["files"]) for entry in self.dirs.values()),
+        )
+        return True
+
+    def read(self):
+        if not os.path.isfile(self.manifest_path):
+            return False
+
+        parser = JsonParser(self.manifest_path, self.logger)
+        if parser.read() is not True:
+            return False
+
+        self.dirs = parser.json_data.get("dirs", {})
+        return True
+
+    def find_dir(self, directory: str):
+        """return the manifest dir name of directory, None if not recorded."""
+        directory = os.path.abspath(directory)
+        for dir_name, entry in self.dirs.items():
+            if entry["dirs"] and os.path.abspath(entry["dirs"][0][0]) == directory:
+                return dir_name
+        return None
+
+    def is_valid(self, dir_name: str, check_files: bool = False):
+        """the entry is valid while its directory mtimes are unchanged.
+        check_files : also check size and mtime of every recorded file, files rewritten
+            in place do not change the directory mtime"""
+        entry = self.dirs.get(dir_name)
+        if entry is None:
+            return False
+
+        for directory, mtime in entry["dirs"]:
+            if not os.path.isdir(directory) or os.stat(directory).st_mtime_ns != mtime:
+                return False
+
+        if not check_files:
+            return True
+
+        for filepath, size, mtime, _, _ in entry["files"]:
+            if not os.path.isfile(filepath):
+                return False
+            stat = os.stat(filepath)
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+        return True
+
+    def files(self, directory: str):
+        """json files of directory in natural order, None if the directory is not in
+        the manifest or the entry is stale."""
+        dir_name = self.find_dir(directory)
+        if dir_name is None or not self.is_valid(dir_name):
+            return None
+        return [item[0] for item in self.dirs[dir_name]["files"]]
+
+    def stats(self, dir_name: str):
+        """return (file count, total size, element count) of a manifest dir, None if
+        the entry is missing or any of its files changed. the element count is None if
+        the manifest was built without count_items."""
+        if not self.is_valid(dir_name, check_files=True):
+            return None
+
+        files = self.dirs[dir_name]["files"]
+        counts = [item[3] for item in files]
+        return (
+            len(files),
+            sum(item[1] for item in files),
+            None if None in counts else sum(counts),
+        )
+
+    def verify(self, dir_name: str):
+        """return files of the dir whose size or mtime changed, or whose checksum
+        changed if checksums are recorded."""
+        changed = []
+        for filepath, size, mtime, _, checksum in self.dirs.get(dir_name, {}).get(
+            "files", []
+        ):
+            if not os.path.isfile(filepath):
+                changed.append(filepath)
+                continue
+
+            stat = os.stat(filepath)
+            if checksum is None:
+                if stat.st_size != size or stat.st_mtime_ns != mtime:
+                    changed.append(filepath)
+            elif stat.st_size != size or self._checksum(filepath) != checksum:
+                changed.append(filepath)
+        return changed
+
+    def _count_items(self, filepath: str):
+        """number of elements of the top level json array, 1 for a json object."""
+        count = 0
+        for _ in JsonParser(filepath, self.logger).iter_items():
+            count += 1
+        return count
+
+    def _checksum(self, filepath: str):
+        crc = 0
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+        return "{:08x}".format(crc)
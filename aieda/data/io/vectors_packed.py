@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_packed.py
+@Author : yell
+@Desc : packed ragged arrays of timing wire paths, saved as memory-mappable npy files
+"""
+import os
+
+import numpy as np
+
+from ...utility.json_parser import JsonParser
+from ...utility.log import Logger
+from ..database import VectorWirePathsPacked
+
+PACKED_ARRAYS = [
+    "values",
+    "value_offset",
+    "node_ids",
+    "node_names",
+    "incr",
+    "incr_offset",
+    "incr_is_net",
+    "path_hash",
+    "stage",
+]
+
+
+class VectorsPackedPaths:
+    """pack timing wire paths to VectorWirePathsPacked and read them back.
+
+    each array is saved as a npy file in packed_dir and read with mmap, so per-path
+    views do not load the whole design. meta.json stores size and mtime of the source
+    wire path files, the packed paths are invalid if any source file changes.
+    """
+
+    def __init__(self, packed_dir: str, logger: Logger = None):
+        self.packed_dir = packed_dir
+        if logger is None:
+            self.logger = Logger("VectorsPackedPaths")
+        else:
+            self.logger = logger
+
+    def array_path(self, name: str):
+        return "{}/{}.npy".format(self.packed_dir, name)
+
+    @property
+    def meta_path(self):
+        return "{}/meta.json".format(self.packed_dir)
+
+    def exists(self):
+        return os.path.isfile(self.meta_path) and all(
+            os.path.isfile(self.array_path(name)) for name in PACKED_ARRAYS
+        )
+
+    def is_valid(self, json_files: list):
+        if not self.exists():
+            return False
+
+        parser = JsonParser(self.meta_path, self.logger)
+        if parser.read() is not True:
+            return False
+
+        files = parser.json_data.get("files", [])
+        if len(json_files) != len(files):
+            return False
+
+        for filepath, (meta_filepath, size, mtime) in zip(json_files, files):
+            if filepath != meta_filepath or not os.path.isfile(filepath):
+                return False
+            stat = os.stat(filepath)
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+
+        return True
+
+    def build(self, wire_paths) -> VectorWirePathsPacked:
+        """pack an iterable of VectorTimingWirePath, node names are interned."""
+        values = []
+        value_offset = [0]
+        node_ids = []
+        name_ids = {}
+        incr = []
+        incr_offset = [0]
+        incr_is_net = []
+        path_hash = []
+        stage = []
+
+        for wire_path in wire_paths:
+            values.append(
+                np.stack(
+                    [wire_path.capacitance, wire_path.slew, wire_path.resistance], axis=1
+                ).astype(np.float32)
+            )
+            value_offset.append(value_offset[-1] + len(wire_path.nodes))
+            node_ids.extend(
+                name_ids.setdefault(node_name, len(name_ids))
+                for node_name in wire_path.nodes
+            )
+
+            incr.append(np.asarray(wire_path.incr, dtype=np.float32))
+            incr_offset.append(incr_offset[-1] + len(wire_path.incr))
+            incr_is_net.append(np.asarray(wire_path.incr_is_net, dtype=np.bool_))
+
+            path_hash.append(wire_path.path_hash)
+            stage.append(np.nan if wire_path.stage is None else wire_path.stage)
+
+        packed = VectorWirePathsPacked()
+        if len(path_hash) == 0:
+            return packed
+
+        packed.values = np.concatenate(values).reshape(-1, 3)
+        packed.value_offset = np.asarray(value_offset, dtype=np.int64)
+        packed.node_ids = np.asarray(node_ids, dtype=np.int64)
+        packed.node_names = np.asarray(list(name_ids), dtype=np.str_)
+        packed.incr = np.concatenate(incr)
+        packed.incr_offset = np.asarray(incr_offset, dtype=np.int64)
+        packed.incr_is_net = np.concatenate(incr_is_net)
+        packed.path_hash = np.asarray(path_hash, dtype=np.str_)
+        packed.stage = np.asarray(stage, dtype=np.float32)
+        return packed
+
+    def write(self, packed: VectorWirePathsPacked, json_files: list):
+        os.makedirs(self.packed_dir, exist_ok=True)
+        if os.path.isfile(self.meta_path):
+            os.remove(self.meta_path)
+
+        for name in PACKED_ARRAYS:
+            np.save(self.array_path(name), getattr(packed, name))
+
+        # meta is written last, a partly written directory is never valid
+        files = []
+        for filepath in json_files:
+            stat = os.stat(filepath)
+            files.append([filepath, stat.st_size, stat.st_mtime_ns])
+        parser = JsonParser(self.meta_path, self.logger)
+        parser.write({"files": files, "path_num": packed.path_num}, indent=None)
+
+        self.logger.info(
+            "write packed wire paths to %s, paths num: %d",
+            self.packed_dir,
+            packed.path_num,
+        )
+        return True
+
+    def read(self, mmap: bool = True) -> VectorWirePathsPacked:
+        packed = VectorWirePathsPacked()
+        if not self.exists():
+            self.logger.error("packed wire paths not exist. path = %s", self.packed_dir)
+            return packed
+
+        mmap_mode = "r" if mmap else None
+        for name in PACKED_ARRAYS:
+            setattr(
+                packed,
+                name,
+                np.load(self.array_path(name), mmap_mode=mmap_mode, allow_pickle=False),
+            )
+
+        return packed
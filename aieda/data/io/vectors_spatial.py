@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : vectors_spatial.py
+@Author : yell
+@Desc : uniform grid spatial index over vectors shapes for window queries
+"""
+import os
+import json
+
+import numpy as np
+
+from ...utility.log import Logger
+
+# kinds of indexed shapes
+SPATIAL_KINDS = ["net", "instance", "patch", "drc"]
+
+# average number of shapes per grid cell
+ITEMS_PER_CELL = 4
+# shapes overlapping more cells are kept in the overflow list instead of the cells
+MAX_CELLS_PER_ITEM = 64
+
+
+class VectorsSpatialIndex:
+    """uniform grid over bounding boxes of nets, instances, patchs and drc shapes.
+
+    each shape is registered in all the grid cells its box overlaps, cell members are
+    stored in CSR form (cell_offset, cell_items). shapes overlapping more than
+    MAX_CELLS_PER_ITEM cells, e.g. die-spanning nets, are kept in overflow_items and
+    checked by every query instead. a window query collects the members of overlapped
+    cells and the overflow items, and keeps the shapes whose boxes really intersect
+    the window.
+
+    the index is saved as npz with the signature of its source files, it is invalid
+    if any source file changes.
+    """
+
+    def __init__(self, index_path: str, logger: Logger = None):
+        self.index_path = index_path
+        if logger is None:
+            self.logger = Logger("VectorsSpatialIndex")
+        else:
+            self.logger = logger
+
+        self.kinds = np.zeros(0, dtype=np.int8)
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.boxes = np.zeros((0, 4), dtype=np.float64)
+        # llx, lly of the grid, cell width and height
+        self.origin = np.zeros(2, dtype=np.float64)
+        self.cell_size = np.ones(2, dtype=np.float64)
+        self.grid_shape = np.ones(2, dtype=np.int64)
+        self.cell_offset = np.zeros(2, dtype=np.int64)
+        self.cell_items = np.zeros(0, dtype=np.int64)
+        self.overflow_items = np.zeros(0, dtype=np.int64)
+        self.signature = ""
+
+    @staticmethod
+    def source_signature(source_files: list):
+        stats = []
+        for filepath in source_files:
+            if os.path.isfile(filepath):
+                stat = os.stat(filepath)
+                stats.append([filepath, stat.st_size, stat.st_mtime_ns])
+        return json.dumps(stats)
+
+    def build(self, shapes: dict, signature: str = ""):
+        """shapes : {kind : (ids, boxes)}, boxes are [llx, lly, urx, ury] of each id."""
+        kinds = []
+        ids = []
+        boxes = []
+        for kind, (kind_ids, kind_boxes) in shapes.items():
+            if len(kind_ids) == 0:
+                continue
+            kinds.append(np.full(len(kind_ids), SPATIAL_KINDS.index(kind), dtype=np.int8))
+            ids.append(np.asarray(kind_ids, dtype=np.int64))
+            boxes.append(np.asarray(kind_boxes, dtype=np.float64).reshape(-1, 4))
+
+        self.signature = signature
+        if len(ids) == 0:
+            return self
+
+        self.kinds = np.concatenate(kinds)
+        self.ids = np.concatenate(ids)
+        # normalize boxes, some shapes have llx > urx
+        boxes = np.concatenate(boxes)
+        self.boxes = np.stack(
+            [
+                np.minimum(boxes[:, 0], boxes[:, 2]),
+                np.minimum(boxes[:, 1], boxes[:, 3]),
+                np.maximum(boxes[:, 0], boxes[:, 2]),
+                np.maximum(boxes[:, 1], boxes[:, 3]),
+            ],
+            axis=1,
+        )
+
+        # grid covers all the boxes
+        llx, lly = self.boxes[:, 0].min(), self.boxes[:, 1].min()
+        urx, ury = self.boxes[:, 2].max(), self.boxes[:, 3].max()
+        width = max(urx - llx, 1.0)
+        height = max(ury - lly, 1.0)
+        cell_num = max(1, len(self.ids) // ITEMS_PER_CELL)
+        cols = max(1, int(round(np.sqrt(cell_num * width / height))))
+        rows = max(1, int(round(cell_num / cols)))
+
+        self.origin = np.array([llx, lly], dtype=np.float64)
+        self.cell_size = np.array([width / cols, height / rows], dtype=np.float64)
+        self.grid_shape = np.array([rows, cols], dtype=np.int64)
+
+        col_min, row_min = self._cells_of(self.boxes[:, 0], self.boxes[:, 1])
+        col_max, row_max = self._cells_of(self.boxes[:, 2], self.boxes[:, 3])
+
+        # expand every item to the cells it overlaps, large items go to overflow
+        col_span = col_max - col_min + 1
+        row_span = row_max - row_min + 1
+        counts = col_span * row_span
+        overflow = counts > MAX_CELLS_PER_ITEM
+        self.overflow_items = np.flatnonzero(overflow).astype(np.int64)
+        counts[overflow] = 0
+        items = np.repeat(np.arange(len(self.ids), dtype=np.int64), counts)
+        local = np.arange(len(items), dtype=np.int64) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        cell_rows = row_min[items] + local // col_span[items]
+        cell_cols = col_min[items] + local % col_span[items]
+        cells = cell_rows * cols + cell_cols
+
+        order = np.argsort(cells, kind="stable")
+        self.cell_items = items[order]
+        self.cell_offset = np.zeros(rows * cols + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cells, minlength=rows * cols), out=self.cell_offset[1:])
+
+        return self
+
+    def query(self, llx, lly, urx, ury, kinds: list = None):
+        """return {kind : [ids]} of shapes intersecting the window, ids are sorted."""
+        kinds = SPATIAL_KINDS if kinds is None else kinds
+        result = {kind: [] for kind in kinds}
+        if len(self.ids) == 0:
+            return result
+
+        col_min, row_min = self._cells_of(np.array([llx]), np.array([lly]))
+        col_max, row_max = self._cells_of(np.array([urx]), np.array([ury]))
+        cols = int(self.grid_shape[1])
+
+        candidates = []
+        for row in range(int(row_min[0]), int(row_max[0]) + 1):
+            start = self.cell_offset[row * cols + int(col_min[0])]
+            end = self.cell_offset[row * cols + int(col_max[0]) + 1]
+            candidates.append(self.cell_items[start:end])
+        candidates.append(self.overflow_items)
+        candidates = np.unique(np.concatenate(candidates))
+
+        boxes = self.boxes[candidates]
+        hit = (
+            (boxes[:, 0] <= urx)
+            & (boxes[:, 2] >= llx)
+            & (boxes[:, 1] <= ury)
+            & (boxes[:, 3] >= lly)
+        )
+        candidates = candidates[hit]
+
+        for kind in kinds:
+            kind_items = candidates[self.kinds[candidates] == SPATIAL_KINDS.index(kind)]
+            result[kind] = np.sort(self.ids[kind_items]).tolist()
+
+        return result
+
+    def write(self):
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        np.savez(
+            self.index_path,
+            kinds=self.kinds,
+            ids=self.ids,
+            boxes=self.boxes,
+            origin=self.origin,
+            cell_size=self.cell_size,
+            grid_shape=self.grid_shape,
+            cell_offset=self.cell_offset,
+            cell_items=self.cell_items,
+            overflow_items=self.overflow_items,
+            signature=np.array(self.signature),
+        )
+
+        self.logger.info(
+            "write spatial index to %s, shapes num: %d", self.index_path, len(self.ids)
+        )
+        return True
+
+    def read(self):
+        if not os.path.isfile(self.index_path):
+            return False
+
+        try:
+            with np.load(self.index_path, allow_pickle=False) as npz:
+                self.kinds = npz["kinds"]
+                self.ids = npz["ids"]
+                self.boxes = npz["boxes"]
+                self.origin = npz["origin"]
+                self.cell_size = npz["cell_size"]
+                self.grid_shape = npz["grid_shape"]
+                self.cell_offset = npz["cell_offset"]
+                self.cell_items = npz["cell_items"]
+                self.overflow_items = npz["overflow_items"]
+                self.signature = str(npz["signature"])
+            return True
+        except Exception as e:
+            self.logger.warning("invalid spatial index %s : %s", self.index_path, e)
+            return False
+
+    def _cells_of(self, x: np.ndarray, y: np.ndarray):
+        """clipped grid column and row of points."""
+        col = np.floor((x - self.origin[0]) / self.cell_size[0]).astype(np.int64)
+        row = np.floor((y - self.origin[1]) / self.cell_size[1]).astype(np.int64)
+        col = np.clip(col, 0, self.grid_shape[1] - 1)
+        row = np.clip(row, 0, self.grid_shape[0] - 1)
+        return col, row
@@ -6,25 +6,367 @@
 @Desc : data vectorization api
 """
 import os
+import weakref
 import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import multiprocessing
 
+import numpy as np
+
 from typing import List
 
 from ..workspace.workspace import Workspace
 from ..flows import DbFlow
-from .io import VectorsParserJson
+from .io import (
+    VectorsParserJson,
+    VectorsColumnar,
+    VectorsPackedPaths,
+    VectorsCache,
+    VectorsNetIndex,
+    VectorsSpatialIndex,
+    VectorsManifest,
+    MANIFEST_DIRS,
+    scan_json_files,
+    vectors_memory_cache,
+)
+from ..utility.json_parser import json_codec, json_codec_path, convert_json_file
+from .database import (
+    VectorTimingWirePath,
+    VectorWirePathsPacked,
+    VectorGraphArrays,
+    VectorNameTable,
+)
+from .feature import DataFeature
+
+
+# default features of load_patch_grid, VectorPatch field names
+PATCH_GRID_FEATURES = [
+    "cell_density",
+    "pin_density",
+    "net_density",
+    "RUDY_congestion",
+    "EGR_congestion",
+    "timing_map",
+    "power_map",
+    "ir_drop_map",
+]
+
+# name tables of workspaces in the process, {(workspace directory, design) : table},
+# a table is released once no DataVectors or loaded object of the workspace uses it
+vectors_name_tables = weakref.WeakValueDictionary()
+
+
+def collect_json_files(directory: str, manifest: VectorsManifest = None):
+    """collect json files under directory, sorted by natural order of file names,
+    e.g. net_2.json is before net_10.json. the file list is taken from manifest
+    without scanning the directory if the manifest records it and is not stale."""
+    if manifest is not None:
+        json_files = manifest.files(directory)
+        if json_files is not None:
+            return json_files
+
+    return scan_json_files(directory)
+
+
+def parse_file(
+    filepath: str, method: str, kwargs: dict = None, cache_dir: str = None
+):
+    """parse one json file by VectorsParserJson.<method>(**kwargs), the result is read
+    from and saved to the vectors cache in cache_dir if cache_dir is not None."""
+    kwargs = kwargs or {}
+    cache = VectorsCache(cache_dir) if cache_dir is not None else None
+
+    if cache is not None:
+        hit, result = cache.load(filepath, method, kwargs)
+        if hit:
+            return result
+
+    result = getattr(VectorsParserJson(filepath), method)(**kwargs)
+
+    # do not cache failed parsing
+    if cache is not None and result:
+        cache.save(filepath, method, kwargs, result)
+
+    return result
+
+
+def parse_files(
+    json_files: list, method: str, kwargs: dict = None, cache_dir: str = None
+):
+    """parse json files by VectorsParserJson.<method>, run in worker processes,
+    so it must stay a module level function to be picklable.
+    return (results, errors), the result of a file that fails is None and its
+    (filepath, error message) is in errors, the other files of the chunk are kept."""
+    results = []
+    errors = []
+    for filepath in json_files:
+        try:
+            results.append(parse_file(filepath, method, kwargs, cache_dir))
+        except Exception as e:
+            results.append(None)
+            errors.append((filepath, str(e)))
+    return results, errors
 
 
 class DataVectors:
-    def __init__(self, workspace: Workspace, vectors_paths = None):
+    def __init__(
+        self,
+        workspace: Workspace,
+        vectors_paths=None,
+        parallel_mode: str = "thread",
+        max_workers: int = None,
+        chunk_size: int = 64,
+        use_cache: bool = True,
+        use_memory_cache: bool = True,
+    ):
+        """parallel_mode : "thread", "process" or "serial" for reading vectors directories,
+            "process" pays off for many large files on many cores
+        max_workers : worker number, default is cpu count
+        chunk_size : file number parsed by one task of the worker pool
+        use_cache : cache parsed vectors files in vectors_paths["cache"]
+        use_memory_cache : share datasets loaded from directories with other DataVectors
+            in the process by vectors_memory_cache
+        """
         self.workspace = workspace
         if vectors_paths is None:
             self.vectors_paths = self.workspace.paths_table.ieda_vectors
         else:
             self.vectors_paths = vectors_paths
 
+        self.parallel_mode = parallel_mode
+        self.max_workers = (
+            max_workers if max_workers is not None else multiprocessing.cpu_count()
+        )
+        self.chunk_size = max(1, chunk_size)
+        self.cache_dir = self.vectors_paths.get("cache") if use_cache else None
+        self.use_memory_cache = use_memory_cache
+        self.net_index = None
+        self.spatial_index = None
+        self.manifest = None
+        self._name_table = None
+
+    def clear_cache(self):
+        """clear the disk cache, memory cache and name table of the workspace."""
+        if self.cache_dir is not None:
+            VectorsCache(self.cache_dir, logger=self.workspace.logger).clear()
+        self.clear_name_table()
+
+    def clear_name_table(self):
+        """release the name table of the workspace, the memory cache of the workspace
+        is cleared too, its objects hold ids of the released table. ids of objects
+        loaded before are invalid, reload them to get ids of the new table."""
+        vectors_name_tables.pop(self._name_table_key(), None)
+        self._name_table = None
+        vectors_memory_cache.clear(self.workspace.directory)
+
+    def load_manifest(self, reload: bool = False) -> VectorsManifest:
+        """load the vectors manifest, None if the manifest does not exist."""
+        if self.manifest is not None and not reload:
+            return self.manifest
+
+        manifest_path = self.vectors_paths.get("manifest")
+        if manifest_path is None:
+            return None
+
+        manifest = VectorsManifest(
+            os.path.dirname(manifest_path), manifest_path, logger=self.workspace.logger
+        )
+        if manifest.read():
+            self.manifest = manifest
+        return self.manifest
+
+    def build_manifest(
+        self,
+        vectors_dir: str = None,
+        manifest_path: str = None,
+        count_items: bool = False,
+        checksum: bool = False,
+    ):
+        """rebuild the manifest of vectors nets, patchs and wire_paths directories,
+        run it when the manifest is missing or stale.
+        count_items, checksum : see VectorsManifest.build, both read every file"""
+        if manifest_path is None:
+            manifest_path = self.vectors_paths["manifest"]
+        if vectors_dir is None:
+            vectors_dir = os.path.dirname(manifest_path)
+
+        manifest = VectorsManifest(
+            vectors_dir, manifest_path, logger=self.workspace.logger
+        )
+        manifest.build(count_items=count_items, checksum=checksum).write()
+        self.manifest = manifest
+        return manifest
+
+    def list_json_files(self, directory: str):
+        """json files of directory, from the manifest if it is valid for directory."""
+        return collect_json_files(directory, self.load_manifest())
+
+    def convert_json_codec(
+        self, codec: str = None, directories: list = None, remove_source: bool = True
+    ):
+        """convert json files of vectors directories to codec, e.g. existing .gz trees
+        to .zst, return the converted paths.
+        codec : "" for plain json, "gz", "zst" or "lz4", default is the workspace
+            vectors codec
+        directories : default are nets, patchs and wire_paths directories
+        """
+        if codec is None:
+            codec = self.workspace.vectors_codec
+        if directories is None:
+            directories = [self.vectors_paths[name] for name in MANIFEST_DIRS]
+
+        json_files = []
+        for directory in directories:
+            json_files.extend(
+                filepath
+                for filepath in scan_json_files(directory)
+                if json_codec(filepath) != codec
+            )
+
+        self.workspace.logger.info(
+            "convert %d json files to codec '%s'", len(json_files), codec
+        )
+        # codecs release the GIL, threads are enough
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            converted = list(
+                tqdm.tqdm(
+                    executor.map(
+                        lambda filepath: convert_json_file(filepath, codec, remove_source),
+                        json_files,
+                    ),
+                    total=len(json_files),
+                    desc="convert json codec",
+                )
+            )
+
+        # the file lists changed, rebuild the manifest if there is one
+        if self.load_manifest(reload=True) is not None:
+            self.build_manifest()
+
+        return converted
+
+    def read_file(self, filepath: str, method: str, kwargs: dict = None):
+        """parse a single json file by VectorsParserJson.<method>(**kwargs)."""
+        return parse_file(filepath, method, kwargs, self.cache_dir)
+
+    def read_files(
+        self, json_files: list, method: str, desc: str = None, kwargs: dict = None
+    ):
+        """parse json_files by VectorsParserJson.<method>(**kwargs), the results keep
+        the order of json_files whatever the parallel mode is. the result of a file
+        that fails to parse is None, the error is logged with the file path."""
+        kwargs = kwargs or {}
+        desc = "vectors {}".format(method) if desc is None else desc
+
+        # use serial parsing for few files
+        if self.parallel_mode == "serial" or len(json_files) < 10:
+            results = []
+            for filepath in tqdm.tqdm(json_files, desc=desc):
+                file_results, errors = parse_files(
+                    [filepath], method, kwargs, self.cache_dir
+                )
+                self._log_errors(errors)
+                results.extend(file_results)
+            return results
+
+        chunks = [
+            json_files[i : i + self.chunk_size]
+            for i in range(0, len(json_files), self.chunk_size)
+        ]
+        chunk_results = [[None] * len(chunk) for chunk in chunks]
+
+        if self.parallel_mode == "process":
+            executor_type = ProcessPoolExecutor
+        else:
+            executor_type = ThreadPoolExecutor
+
+        max_workers = min(self.max_workers, len(chunks))
+        with tqdm.tqdm(total=len(json_files), desc=desc) as pbar:
+            with executor_type(max_workers=max_workers) as executor:
+                future_to_index = {
+                    executor.submit(
+                        parse_files, chunk, method, kwargs, self.cache_dir
+                    ): index
+                    for index, chunk in enumerate(chunks)
+                }
+
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        chunk_results[index], errors = future.result()
+                        self._log_errors(errors)
+                    except Exception as e:
+                        # the worker itself failed, e.g. a broken process pool
+                        self.workspace.logger.error(
+                            "error processing files %s : %s", chunks[index], e
+                        )
+                    pbar.update(len(chunks[index]))
+
+        return [result for results in chunk_results for result in results]
+
+    def _log_errors(self, errors: list):
+        for filepath, error in errors:
+            self.workspace.logger.error("error processing file %s : %s", filepath, error)
+
+    def read_dir(
+        self, directory: str, method: str, kwargs: dict = None, desc: str = None
+    ):
+        """parse all json files in directory, return the result list of files.
+        results are shared in the process by vectors_memory_cache."""
+        json_files = self.list_json_files(directory)
+        if not self.use_memory_cache:
+            return self.read_files(json_files, method, desc, kwargs)
+
+        signature = vectors_memory_cache.signature(json_files)
+        results = self._get_memory_cache(directory, method, kwargs, signature)
+        if results is None:
+            results = self.read_files(json_files, method, desc, kwargs)
+            vectors_memory_cache.put(
+                self._memory_key(directory, method, kwargs),
+                signature,
+                results,
+                vectors_memory_cache.estimate_size(json_files),
+            )
+
+        return list(results)
+
+    def iter_dir(self, directory: str, method: str, kwargs: dict = None):
+        """yield the result of json files in directory one by one. results cached by
+        read_dir are reused, but iter_dir never fills vectors_memory_cache, so only one
+        file result is held at a time."""
+        json_files = self.list_json_files(directory)
+
+        if self.use_memory_cache:
+            signature = vectors_memory_cache.signature(json_files)
+            cached = self._get_memory_cache(directory, method, kwargs, signature)
+            if cached is not None:
+                yield from cached
+                return
+
+        for filepath in json_files:
+            yield self.read_file(filepath, method, kwargs)
+
+    def _memory_key(self, directory: str, method: str, kwargs: dict = None):
+        fields = (kwargs or {}).get("fields")
+        return (
+            method,
+            os.path.abspath(directory),
+            None if fields is None else frozenset(fields),
+        )
+
+    def _get_memory_cache(
+        self, directory: str, method: str, kwargs: dict, signature
+    ):
+        results = vectors_memory_cache.get(
+            self._memory_key(directory, method, kwargs), signature
+        )
+        if results is None and (kwargs or {}).get("fields") is not None:
+            # fully parsed results contain all the projected fields
+            results = vectors_memory_cache.get(
+                self._memory_key(directory, method), signature
+            )
+        return results
+
     def load_cells(self, cells_path: str = None):
         if cells_path is None:
             # read from workspace vectors/tech/cells.json
@@ -57,363 +399,492 @@ class DataVectors:
         parser = VectorsParserJson(
             json_path=instances_path, logger=self.workspace.logger
         )
-        return parser.get_instances()
-
-    def load_nets(self, nets_dir: str = None, net_path: str = None):
+        instances = parser.get_instances()
+        if instances is not None:
+            self.intern_instances(instances.instances)
+        return instances
+
+    def load_nets(self, nets_dir: str = None, net_path: str = None, fields: set = None):
+        """fields : subset of NET_FIELDS to parse, e.g. {"feature", "pins"} skips wires,
+        paths and routing graphs, None for all."""
         nets = []
-
-        def read_from_dir():
-            # 收集所有JSON文件路径
-            json_files = []
-            for root, dirs, files in os.walk(nets_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        json_files.append(os.path.join(root, file))
-            
-            # 如果文件数量较少，使用顺序处理
-            if len(json_files) < 10:
-                for filepath in tqdm.tqdm(json_files, desc="vectors read nets"):
-                    json_parser = VectorsParserJson(filepath)
-                    nets.extend(json_parser.get_nets())
-            else:
-                # 使用线程池并行处理
-                max_workers = min(multiprocessing.cpu_count(), 16)
-                results = []
-                
-                with tqdm.tqdm(total=len(json_files), desc="vectors read nets") as pbar:
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 提交所有任务
-                        future_to_file = {executor.submit(process_net_file, filepath): filepath 
-                                        for filepath in json_files}
-                        
-                        # 收集结果
-                        for future in as_completed(future_to_file):
-                            try:
-                                result = future.result()
-                                if result:
-                                    nets.extend(result)
-                            except Exception as e:
-                                print(f"Error processing file {future_to_file[future]}: {e}")
-                            pbar.update(1)
-        
-        def process_net_file(filepath):
-            """在线程中处理单个网络文件"""
-            json_parser = VectorsParserJson(filepath)
-            return json_parser.get_nets()
+        kwargs = {"fields": fields}
 
         if nets_dir is not None and os.path.isdir(nets_dir):
             self.workspace.logger.info("read nets from %s", nets_dir)
             # get data from nets directory
-            read_from_dir()
+            for result in self.read_dir(nets_dir, "get_nets", kwargs):
+                if result:
+                    nets.extend(result)
 
         if net_path is not None and os.path.isfile(net_path):
             self.workspace.logger.info("read nets from %s", net_path)
             # get nets from nets josn file
-            json_parser = VectorsParserJson(net_path)
-
-            nets.extend(json_parser.get_nets())
+            nets.extend(self.read_file(net_path, "get_nets", kwargs))
 
         if nets_dir is None and net_path is None:
             # read nets from output/vectors/nets in workspace
             nets_dir = self.vectors_paths["nets"]
 
             self.workspace.logger.info("read nets from workspace %s", nets_dir)
-            read_from_dir()
+            for result in self.read_dir(nets_dir, "get_nets", kwargs):
+                if result:
+                    nets.extend(result)
 
+        self.intern_pins(nets)
         return nets
 
-    def load_patchs(self, patchs_dir: str = None, patch_path: str = None):
-        patchs = []
+    def iter_nets(self, nets_dir: str = None, fields: set = None):
+        """yield nets one by one from nets directory, only one json file is kept in memory.
+        fields : subset of NET_FIELDS to parse, e.g. {"feature", "wires"}, None for all.
+        """
+        if nets_dir is None:
+            nets_dir = self.vectors_paths["nets"]
+
+        self.workspace.logger.info("iterate nets from %s", nets_dir)
+        for result in self.iter_dir(nets_dir, "get_nets", {"fields": fields}):
+            self.intern_pins(result)
+            for vec_net in result:
+                if vec_net is not None:
+                    yield vec_net
+
+    @property
+    def name_table(self) -> VectorNameTable:
+        """interned pin, instance and timing node names of the workspace, the table is
+        shared by all DataVectors of the workspace in the process, ids are valid in the
+        process only. the table lives while this DataVectors or an object loaded by a
+        DataVectors of the workspace (including the memory cache) references it, or until
+        clear_name_table."""
+        if self._name_table is None:
+            key = self._name_table_key()
+            name_table = vectors_name_tables.get(key)
+            if name_table is None:
+                name_table = VectorNameTable()
+                vectors_name_tables[key] = name_table
+            self._name_table = name_table
+        return self._name_table
+
+    def _name_table_key(self):
+        return (os.path.abspath(self.workspace.directory), self.workspace.design)
+
+    def intern_pins(self, nets: list):
+        """move the name ids of pins from the table of the parsed file to the name table
+        of the workspace."""
+        self.name_table.adopt_pins(
+            pin for vec_net in nets if vec_net is not None for pin in vec_net.pins
+        )
+
+    def intern_instances(self, instances: list):
+        name_table = self.name_table
+        for instance in instances:
+            instance.name_id = name_table.intern(instance.name)
+            if instance.name_id is not None:
+                instance.name = name_table.names[instance.name_id]
+
+    def intern_wire_paths(self, wire_paths: List[VectorTimingWirePath]):
+        """move the node ids of wire paths to the name table of the workspace."""
+        self.name_table.adopt_wire_paths(wire_paths)
+
+    def load_net_index(
+        self, nets_dir: str = None, index_path: str = None, rebuild: bool = False
+    ) -> VectorsNetIndex:
+        """load the net id / name index of nets json files, the index is built and
+        saved to index_path if it does not exist or the nets files changed."""
+        if nets_dir is None:
+            nets_dir = self.vectors_paths["nets"]
+        if index_path is None:
+            index_path = json_codec_path(
+                self.vectors_paths["nets_index"], self.workspace.vectors_codec
+            )
+
+        json_files = self.list_json_files(nets_dir)
+        net_index = VectorsNetIndex(index_path, logger=self.workspace.logger)
+        if rebuild or not net_index.read() or not net_index.is_valid(json_files):
+            self.workspace.logger.info("build nets index of %s", nets_dir)
+            net_index.build(json_files)
+            net_index.write()
+
+        self.net_index = net_index
+        return net_index
+
+    def get_net(self, id_or_name, fields: set = None):
+        """read a single net by net id (int) or net name (str) through the nets index,
+        return None if the net does not exist."""
+        if self.net_index is None:
+            self.load_net_index()
+
+        location = self.net_index.find(id_or_name)
+        if location is None:
+            self.workspace.logger.warning("net %s not found in nets index", id_or_name)
+            return None
+
+        filepath, offset, length = location
+        parser = VectorsParserJson(filepath, logger=self.workspace.logger)
+        vec_net = parser.get_net_at(offset, length, fields)
+        self.intern_pins([vec_net])
+        return vec_net
+
+    def get_nets(self, ids_or_names: list, fields: set = None):
+        """read nets by net ids or names, missing nets are skipped."""
+        nets = [self.get_net(id_or_name, fields) for id_or_name in ids_or_names]
+        return [net for net in nets if net is not None]
+
+    def convert_nets_columnar(self, nets_dir: str = None, columnar_dir: str = None):
+        """convert nets json to columnar tables, return the columnar directory."""
+        if nets_dir is None:
+            nets_dir = self.vectors_paths["nets"]
+        if columnar_dir is None:
+            columnar_dir = self.vectors_paths["nets_columnar"]
+
+        self.workspace.logger.info(
+            "convert nets from %s to columnar %s", nets_dir, columnar_dir
+        )
+        json_files = self.list_json_files(nets_dir)
+        columnar = VectorsColumnar(columnar_dir, logger=self.workspace.logger)
+        columnar.write(columnar.build_nets(json_files), json_files)
+
+        return columnar_dir
+
+    def load_nets_columnar(
+        self,
+        columnar_dir: str = None,
+        columns: dict = None,
+        convert: bool = True,
+        nets_dir: str = None,
+    ):
+        """load nets as VectorNetsColumnar tables.
+        columns : optional {table : [column names]} to read only part of the tables
+        convert : convert nets json to columnar tables if they do not exist or are
+            outdated, i.e. a net file of nets_dir is added, removed or changed
+        """
+        if nets_dir is None:
+            nets_dir = self.vectors_paths["nets"]
+        if columnar_dir is None:
+            columnar_dir = self.vectors_paths["nets_columnar"]
+
+        columnar = VectorsColumnar(columnar_dir, logger=self.workspace.logger)
+        if convert and not columnar.is_valid(self.list_json_files(nets_dir)):
+            self.convert_nets_columnar(nets_dir, columnar_dir)
 
-        def read_from_dir():
-            # 收集所有JSON文件路径
-            json_files = []
-            for root, dirs, files in os.walk(patchs_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        json_files.append(os.path.join(root, file))
-            
-            # 如果文件数量较少，使用顺序处理
-            if len(json_files) < 10:
-                for filepath in tqdm.tqdm(json_files, desc="vectors read patchs"):
-                    json_parser = VectorsParserJson(filepath)
-                    patchs.extend(json_parser.get_patchs())
-            else:
-                # 使用线程池并行处理
-                max_workers = min(multiprocessing.cpu_count(), 16)
-                
-                with tqdm.tqdm(total=len(json_files), desc="vectors read patchs") as pbar:
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 提交所有任务
-                        future_to_file = {executor.submit(process_patch_file, filepath): filepath 
-                                        for filepath in json_files}
-                        
-                        # 收集结果
-                        for future in as_completed(future_to_file):
-                            try:
-                                result = future.result()
-                                if result:
-                                    patchs.extend(result)
-                            except Exception as e:
-                                print(f"Error processing file {future_to_file[future]}: {e}")
-                            pbar.update(1)
-        
-        def process_patch_file(filepath):
-            """在线程中处理单个patch文件"""
-            json_parser = VectorsParserJson(filepath)
-            return json_parser.get_patchs()
+        self.workspace.logger.info("read columnar nets from %s", columnar_dir)
+        return columnar.read(columns=columns)
+
+    def load_patchs(
+        self, patchs_dir: str = None, patch_path: str = None, fields: set = None
+    ):
+        """fields : subset of PATCH_FIELDS to parse, set() for patch scalars only,
+        None for all."""
+        patchs = []
+        kwargs = {"fields": fields}
 
         if patchs_dir is not None and os.path.isdir(patchs_dir):
             self.workspace.logger.info("read patchs from %s", patchs_dir)
             # get data from patchs directory
-            read_from_dir()
+            for result in self.read_dir(patchs_dir, "get_patchs", kwargs):
+                if result:
+                    patchs.extend(result)
 
         if patch_path is not None and os.path.isfile(patch_path):
             self.workspace.logger.info("read patchs from %s", patch_path)
             # get patchs from patch josn file
-            json_parser = VectorsParserJson(patch_path)
-
-            patchs.extend(json_parser.get_patchs())
+            patchs.extend(self.read_file(patch_path, "get_patchs", kwargs))
 
         if patchs_dir is None and patch_path is None:
             # read patchs from output/vectors/patchs in workspace
             patchs_dir = self.vectors_paths["patchs"]
 
             self.workspace.logger.info("read patchs from workspace %s", patchs_dir)
-            read_from_dir()
+            for result in self.read_dir(patchs_dir, "get_patchs", kwargs):
+                if result:
+                    patchs.extend(result)
 
         return patchs
 
+    def load_patch_grid(
+        self, features: list = None, patchs_dir: str = None
+    ) -> np.ndarray:
+        """load patch features as a dense (features, rows, cols) cube, patchs are
+        scattered to [patch_id_row, patch_id_col] at once.
+        features : VectorPatch field names, default PATCH_GRID_FEATURES
+        cells without patch are 0, missing feature values are nan.
+        """
+        if features is None:
+            features = PATCH_GRID_FEATURES
+        if patchs_dir is None:
+            patchs_dir = self.vectors_paths["patchs"]
+
+        # only patch scalars are needed
+        patchs = self.load_patchs(patchs_dir, fields=set())
+        return self.patch_grid(patchs, features)
+
+    def patch_grid(self, patchs: list, features: list = None) -> np.ndarray:
+        """scatter features of loaded patchs to a dense (features, rows, cols) cube,
+        see load_patch_grid."""
+        if features is None:
+            features = PATCH_GRID_FEATURES
+        if not patchs:
+            return np.zeros((len(features), 0, 0))
+
+        rows = np.fromiter(
+            (patch.patch_id_row for patch in patchs), dtype=np.int64, count=len(patchs)
+        )
+        cols = np.fromiter(
+            (patch.patch_id_col for patch in patchs), dtype=np.int64, count=len(patchs)
+        )
+        # None values are converted to nan
+        values = np.array(
+            [[getattr(patch, feature) for feature in features] for patch in patchs],
+            dtype=float,
+        ).reshape(len(patchs), len(features))
+
+        grid = np.zeros((len(features), rows.max() + 1, cols.max() + 1))
+        grid[:, rows, cols] = values.T
+        return grid
+
+    def iter_patchs(self, patchs_dir: str = None, fields: set = None):
+        """yield patchs one by one from patchs directory, only one json file is kept in memory.
+        fields : subset of PATCH_FIELDS to parse, e.g. set() for patch scalars only, None for all.
+        """
+        if patchs_dir is None:
+            patchs_dir = self.vectors_paths["patchs"]
+
+        self.workspace.logger.info("iterate patchs from %s", patchs_dir)
+        for result in self.iter_dir(patchs_dir, "get_patchs", {"fields": fields}):
+            for vec_patch in result:
+                if vec_patch is not None:
+                    yield vec_patch
+
     def load_timing_graph(self, graph_path: str = None):
         if graph_path is None:
             graph_path = self.vectors_paths["timing_wire_graph"]
         parser = VectorsParserJson(json_path=graph_path, logger=self.workspace.logger)
         return parser.get_wire_graph()
 
+    def load_timing_graph_arrays(self, graph_path: str = None) -> VectorGraphArrays:
+        """load timing wire graph as numpy node and edge arrays."""
+        if graph_path is None:
+            graph_path = self.vectors_paths["timing_wire_graph"]
+        parser = VectorsParserJson(json_path=graph_path, logger=self.workspace.logger)
+        return parser.get_wire_graph_arrays()
+
+    def load_wire_paths(
+        self, timing_paths_dir: str = None, file_path: str = None
+    ) -> List[VectorTimingWirePath]:
+        """load wire paths with nodes, C/slew/R/incr arrays and delay metrics, each
+        wire path file is parsed once for all the wire path loaders."""
+        return self._load_wire_paths(
+            timing_paths_dir, file_path, "get_wire_path", "wire paths"
+        )
+
     def load_timing_wire_paths(
         self, timing_paths_dir: str = None, file_path: str = None
     ):
-        wire_paths = []
+        """return list of (path_hash, wire_path_graph)"""
+        return [
+            (wire_path.path_hash, wire_path.path_graph())
+            for wire_path in self.load_wire_paths(timing_paths_dir, file_path)
+        ]
 
-        def read_from_dir():
-            # 收集所有JSON文件路径
-            json_files = []
-            for root, dirs, files in os.walk(timing_paths_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        json_files.append(os.path.join(root, file))
-            
-            # 如果文件数量较少，使用顺序处理
-            if len(json_files) < 10:
-                for filepath in tqdm.tqdm(json_files, desc="timing wire paths"):
-                    parser = VectorsParserJson(
-                        json_path=filepath, logger=self.workspace.logger
-                    )
-                    path_hash, wire_path_graph = parser.get_timing_wire_paths()
-                    wire_paths.append((path_hash, wire_path_graph))
-            else:
-                # 使用线程池并行处理
-                max_workers = min(multiprocessing.cpu_count(), 16)
-                
-                with tqdm.tqdm(total=len(json_files), desc="timing wire paths") as pbar:
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 提交所有任务
-                        future_to_file = {executor.submit(process_wire_path_file, filepath): filepath 
-                                        for filepath in json_files}
-                        
-                        # 收集结果
-                        for future in as_completed(future_to_file):
-                            try:
-                                result = future.result()
-                                if result:
-                                    wire_paths.append(result)
-                            except Exception as e:
-                                print(f"Error processing file {future_to_file[future]}: {e}")
-                            pbar.update(1)
-        
-        def process_wire_path_file(filepath):
-            """在线程中处理单个wire path文件"""
-            parser = VectorsParserJson(
-                json_path=filepath, logger=self.workspace.logger
-            )
-            path_hash, wire_path_graph = parser.get_timing_wire_paths()
-            return (path_hash, wire_path_graph)
+    def load_timing_paths_metrics(
+        self, timing_paths_dir: str = None, file_path: str = None
+    ):
+        return [
+            wire_path.metrics()
+            for wire_path in self.load_wire_paths(timing_paths_dir, file_path)
+        ]
 
-        if timing_paths_dir is not None and os.path.isdir(timing_paths_dir):
-            self.workspace.logger.info("read paths from %s", timing_paths_dir)
-            # get timing paths from timing_paths_dir
-            read_from_dir()
+    def load_wire_paths_data(
+        self, timing_paths_dir: str = None, file_path: str = None
+    ):
+        """Load detailed wire path data including capacitance, slew, resistance, incr and nodes."""
+        return [
+            wire_path.path_data()
+            for wire_path in self.load_wire_paths(timing_paths_dir, file_path)
+        ]
 
-        if file_path is not None and os.path.isfile(file_path):
-            self.workspace.logger.info("read paths from %s", file_path)
-            # get timing paths from file
-            parser = VectorsParserJson(
-                json_path=file_path, logger=self.workspace.logger
-            )
-            path_hash, wire_path_graph = parser.get_timing_wire_paths()
+    def convert_wire_paths_packed(
+        self, timing_paths_dir: str = None, packed_dir: str = None
+    ):
+        """pack all wire paths of the design to memory-mappable arrays, return the
+        packed directory."""
+        if timing_paths_dir is None:
+            timing_paths_dir = self.vectors_paths["wire_paths"]
+        if packed_dir is None:
+            packed_dir = self.vectors_paths["wire_paths_packed"]
 
-            wire_paths.append((path_hash, wire_path_graph))
+        self.workspace.logger.info(
+            "pack wire paths from %s to %s", timing_paths_dir, packed_dir
+        )
+        packed_paths = VectorsPackedPaths(packed_dir, logger=self.workspace.logger)
+        packed_paths.write(
+            packed_paths.build(self.iter_wire_paths(timing_paths_dir)),
+            self.list_json_files(timing_paths_dir),
+        )
 
-        if timing_paths_dir is None and file_path is None:
-            # read paths from output/vectors/wire_paths in workspace
+        return packed_dir
+
+    def load_wire_paths_packed(
+        self,
+        timing_paths_dir: str = None,
+        packed_dir: str = None,
+        convert: bool = True,
+        mmap: bool = True,
+    ) -> VectorWirePathsPacked:
+        """load all wire paths of the design as VectorWirePathsPacked.
+        convert : pack the wire paths if the packed arrays do not exist or are outdated
+        mmap : memory-map the packed arrays instead of reading them
+        """
+        if timing_paths_dir is None:
             timing_paths_dir = self.vectors_paths["wire_paths"]
+        if packed_dir is None:
+            packed_dir = self.vectors_paths["wire_paths_packed"]
 
-            self.workspace.logger.info(
-                "read timing paths from workspace %s", timing_paths_dir
-            )
-            read_from_dir()
+        packed_paths = VectorsPackedPaths(packed_dir, logger=self.workspace.logger)
+        json_files = self.list_json_files(timing_paths_dir)
+        if convert and not packed_paths.is_valid(json_files):
+            self.convert_wire_paths_packed(timing_paths_dir, packed_dir)
 
-        return wire_paths
+        self.workspace.logger.info("read packed wire paths from %s", packed_dir)
+        return packed_paths.read(mmap=mmap)
 
-    def load_timing_paths_metrics(
-        self, timing_paths_dir: str = None, file_path: str = None
+    def _load_wire_paths(
+        self, timing_paths_dir: str, file_path: str, method: str, desc: str
     ):
+        """read one result per wire path file by VectorsParserJson.<method>."""
         wire_paths = []
 
-        def read_from_dir():
-            # 收集所有JSON文件路径
-            json_files = []
-            for root, dirs, files in os.walk(timing_paths_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        json_files.append(os.path.join(root, file))
-            
-            # 如果文件数量较少，使用顺序处理
-            if len(json_files) < 10:
-                for filepath in tqdm.tqdm(json_files, desc="timing wire paths"):
-                    parser = VectorsParserJson(
-                        json_path=filepath, logger=self.workspace.logger
-                    )
-                    vec_paths = parser.get_timing_paths_metrics()
-                    wire_paths.append(vec_paths)
-            else:
-                # 使用线程池并行处理
-                max_workers = min(multiprocessing.cpu_count(), 16)
-                
-                with tqdm.tqdm(total=len(json_files), desc="timing wire paths") as pbar:
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 提交所有任务
-                        future_to_file = {executor.submit(process_timing_metrics_file, filepath): filepath 
-                                        for filepath in json_files}
-                        
-                        # 收集结果
-                        for future in as_completed(future_to_file):
-                            try:
-                                result = future.result()
-                                if result:
-                                    wire_paths.append(result)
-                            except Exception as e:
-                                print(f"Error processing file {future_to_file[future]}: {e}")
-                            pbar.update(1)
-        
-        def process_timing_metrics_file(filepath):
-            """在线程中处理单个timing metrics文件"""
-            parser = VectorsParserJson(
-                json_path=filepath, logger=self.workspace.logger
-            )
-            return parser.get_timing_paths_metrics()
-
         if timing_paths_dir is not None and os.path.isdir(timing_paths_dir):
-            self.workspace.logger.info("read paths from %s", timing_paths_dir)
+            self.workspace.logger.info("read %s from %s", desc, timing_paths_dir)
             # get timing paths from timing_paths_dir
-            read_from_dir()
+            wire_paths.extend(
+                self.read_dir(timing_paths_dir, method, desc=desc)
+            )
 
         if file_path is not None and os.path.isfile(file_path):
-            self.workspace.logger.info("read paths from %s", file_path)
+            self.workspace.logger.info("read %s from %s", desc, file_path)
             # get timing paths from file
-            parser = VectorsParserJson(
-                json_path=file_path, logger=self.workspace.logger
-            )
-            vec_paths = parser.get_timing_paths_metrics()
-
-            wire_paths.append(vec_paths)
+            wire_paths.append(self.read_file(file_path, method))
 
         if timing_paths_dir is None and file_path is None:
             # read paths from output/vectors/wire_paths in workspace
             timing_paths_dir = self.vectors_paths["wire_paths"]
 
             self.workspace.logger.info(
-                "read timing paths from workspace %s", timing_paths_dir
+                "read %s from workspace %s", desc, timing_paths_dir
+            )
+            wire_paths.extend(
+                self.read_dir(timing_paths_dir, method, desc=desc)
             )
-            read_from_dir()
 
+        wire_paths = [wire_path for wire_path in wire_paths if wire_path]
+        self.intern_wire_paths(wire_paths)
         return wire_paths
 
-    def load_wire_paths_data(
-        self, timing_paths_dir: str = None, file_path: str = None
-    ):
-        """Load detailed wire path data including capacitance, slew, resistance, incr and nodes."""
-        wire_paths_data = []
-
-        def read_from_dir():
-            # 收集所有JSON文件路径
-            json_files = []
-            for root, dirs, files in os.walk(timing_paths_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        json_files.append(os.path.join(root, file))
-            
-            # 如果文件数量较少，使用顺序处理
-            if len(json_files) < 10:
-                for filepath in tqdm.tqdm(json_files, desc="wire paths data"):
-                    parser = VectorsParserJson(
-                        json_path=filepath, logger=self.workspace.logger
-                    )
-                    wire_path_data = parser.get_wire_paths_data()
-                    wire_paths_data.append(wire_path_data)
-            else:
-                # 使用线程池并行处理
-                max_workers = min(multiprocessing.cpu_count(), 16)
-                
-                with tqdm.tqdm(total=len(json_files), desc="wire paths data") as pbar:
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # 提交所有任务
-                        future_to_file = {executor.submit(process_wire_paths_data_file, filepath): filepath 
-                                        for filepath in json_files}
-                        
-                        # 收集结果
-                        for future in as_completed(future_to_file):
-                            try:
-                                result = future.result()
-                                if result:
-                                    wire_paths_data.append(result)
-                            except Exception as e:
-                                print(f"Error processing file {future_to_file[future]}: {e}")
-                            pbar.update(1)
-        
-        def process_wire_paths_data_file(filepath):
-            """在线程中处理单个wire paths数据文件"""
-            parser = VectorsParserJson(
-                json_path=filepath, logger=self.workspace.logger
-            )
-            return parser.get_wire_paths_data()
+    def iter_wire_paths(self, timing_paths_dir: str = None, kind: str = "path"):
+        """yield one wire path per file from wire paths directory.
+        kind : "path" for VectorTimingWirePath, "graph" for (path_hash, wire_path_graph),
+        "data" for VectorTimingWirePathData, "metrics" for VectorPathMetrics.
+        """
+        convert = {
+            "path": lambda wire_path: wire_path,
+            "graph": lambda wire_path: (wire_path.path_hash, wire_path.path_graph()),
+            "data": lambda wire_path: wire_path.path_data(),
+            "metrics": lambda wire_path: wire_path.metrics(),
+        }[kind]
+
+        if timing_paths_dir is None:
+            timing_paths_dir = self.vectors_paths["wire_paths"]
 
-        if timing_paths_dir is not None and os.path.isdir(timing_paths_dir):
-            self.workspace.logger.info("read wire paths data from %s", timing_paths_dir)
-            # get timing paths from timing_paths_dir
-            read_from_dir()
+        self.workspace.logger.info("iterate wire paths from %s", timing_paths_dir)
+        for wire_path in self.iter_dir(timing_paths_dir, "get_wire_path"):
+            if wire_path:
+                self.intern_wire_paths([wire_path])
+                yield convert(wire_path)
+
+    def load_spatial_index(
+        self, index_path: str = None, drc_path: str = None, rebuild: bool = False
+    ) -> VectorsSpatialIndex:
+        """load the spatial index of nets, instances, patchs and drc shapes, the index
+        is built and saved to index_path if it does not exist or the sources changed.
+        drc_path : route drc feature json, default is the route drc of workspace
+        """
+        if index_path is None:
+            index_path = self.vectors_paths["spatial_index"]
+        if drc_path is None:
+            drc_path = self.workspace.paths_table.ieda_feature_json.get("route_drc", "")
+
+        nets_files = self.list_json_files(self.vectors_paths["nets"])
+        patchs_files = self.list_json_files(self.vectors_paths["patchs"])
+        signature = VectorsSpatialIndex.source_signature(
+            nets_files + patchs_files + [self.vectors_paths["instances"], drc_path]
+        )
 
-        if file_path is not None and os.path.isfile(file_path):
-            self.workspace.logger.info("read wire paths data from %s", file_path)
-            # get timing paths from file
-            parser = VectorsParserJson(
-                json_path=file_path, logger=self.workspace.logger
-            )
-            wire_path_data = parser.get_wire_paths_data()
+        spatial_index = VectorsSpatialIndex(index_path, logger=self.workspace.logger)
+        if rebuild or not spatial_index.read() or spatial_index.signature != signature:
+            self.workspace.logger.info("build spatial index %s", index_path)
+            spatial_index.build(self._spatial_shapes(drc_path), signature)
+            spatial_index.write()
+
+        self.spatial_index = spatial_index
+        return spatial_index
+
+    def query_region(self, llx, lly, urx, ury, kinds: list = None):
+        """return {kind : [ids]} of shapes intersecting the window (llx, lly, urx, ury).
+        kinds : subset of SPATIAL_KINDS, "net", "instance", "patch" and "drc".
+        ids of nets, instances and patchs are their vector ids, ids of drc shapes are
+        the order of shapes in DataFeature.load_drc, by drc type, layer and shape.
+        """
+        if self.spatial_index is None:
+            self.load_spatial_index()
+
+        return self.spatial_index.query(llx, lly, urx, ury, kinds)
+
+    def _spatial_shapes(self, drc_path: str):
+        shapes = {}
+
+        nets = [
+            net
+            for net in self.iter_nets(fields={"feature"})
+            if net.feature is not None and net.feature.llx is not None
+        ]
+        shapes["net"] = (
+            [net.id for net in nets],
+            [
+                [net.feature.llx, net.feature.lly, net.feature.urx, net.feature.ury]
+                for net in nets
+            ],
+        )
 
-            if wire_path_data:
-                wire_paths_data.append(wire_path_data)
+        if os.path.isfile(self.vectors_paths["instances"]):
+            instances = self.load_instances().instances
+            shapes["instance"] = (
+                [instance.id for instance in instances],
+                [
+                    [instance.llx, instance.lly, instance.urx, instance.ury]
+                    for instance in instances
+                ],
+            )
 
-        if timing_paths_dir is None and file_path is None:
-            # read paths from output/vectors/wire_paths in workspace
-            timing_paths_dir = self.vectors_paths["wire_paths"]
+        patchs = list(self.iter_patchs(fields=set()))
+        shapes["patch"] = (
+            [patch.id for patch in patchs],
+            [[patch.llx, patch.lly, patch.urx, patch.ury] for patch in patchs],
+        )
 
-            self.workspace.logger.info(
-                "read wire paths data from workspace %s", timing_paths_dir
+        if os.path.isfile(drc_path):
+            drc = DataFeature(self.workspace).load_drc(drc_path)
+            drc_shapes = [
+                shape
+                for distribution in (drc.drc_list if drc is not None else [])
+                for layer in distribution.layers
+                for shape in layer.shapes
+            ]
+            shapes["drc"] = (
+                list(range(len(drc_shapes))),
+                [[shape.llx, shape.lly, shape.urx, shape.ury] for shape in drc_shapes],
             )
-            read_from_dir()
 
-        return wire_paths_data
+        return shapes
 
     def load_instance_graph(self, graph_path: str = None):
         if graph_path is None:
@@ -423,3 +894,10 @@ class DataVectors:
 
         parser = VectorsParserJson(json_path=graph_path, logger=self.workspace.logger)
         return parser.get_instance_graph()
+
+    def load_instance_graph_arrays(self, graph_path: str = None) -> VectorGraphArrays:
+        """load instance graph as numpy node and edge arrays."""
+        if graph_path is None:
+            graph_path = self.vectors_paths["timing_instance_graph"]
+        parser = VectorsParserJson(json_path=graph_path, logger=self.workspace.logger)
+        return parser.get_instance_graph_arrays()
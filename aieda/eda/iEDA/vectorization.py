@@ -10,6 +10,7 @@ from .io import IEDAIO
 from ...workspace import Workspace
 from ...flows import DbFlow
 from ...data.database.enum import FeatureOption
+from ...data.io import VectorsManifest
 
 
 class IEDAVectorization(IEDAIO):
@@ -45,6 +46,14 @@ class IEDAVectorization(IEDAIO):
             p.start()
             p.join()
 
+        self.generate_manifest()
+
+    def generate_manifest(self):
+        """record files of the generated vectors in vectors_dir/manifest.json, loaders
+        use it instead of scanning the vectors directories."""
+        manifest = VectorsManifest(self.vectors_dir, logger=self.workspace.logger)
+        manifest.build().write()
+
     def vectors_nets_to_def(self):
         def _read_nets():
             self.read_def()
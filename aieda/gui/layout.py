@@ -42,9 +42,7 @@ class GuiLayout:
         """
         data_load = DataVectors(self.workspace)
 
-        timing_graph = data_load.load_instance_graph()
-        nodes = timing_graph.nodes
-        edges = timing_graph.edges
+        instance_graph = data_load.load_instance_graph_arrays()
 
         # Read cells data to map cell_id to cell name
         cell_id_to_name = {}
@@ -132,47 +130,17 @@ class GuiLayout:
         # Draw node connection relations (improved edge drawing)
         edges_drawn = 0
 
-        # Create node id to node data mapping
-        node_id_to_node = {node.id: node for node in nodes}
-
-        # Create node name to node data mapping for reverse lookup
-        node_name_to_data = {node.name: node for node in nodes}
-
         # Find edges that connect instances in our data
-        valid_edges = []
-        for edge in edges:
-            from_node_id = edge.from_node
-            to_node_id = edge.to_node
-
-            # Get node data - handle both string and integer node IDs
-            from_node = None
-            to_node = None
-
-            # Try to find by node ID (could be string or integer)
-            if from_node_id in node_id_to_node:
-                from_node = node_id_to_node[from_node_id]
-            elif str(from_node_id) in node_id_to_node:
-                from_node = node_id_to_node[str(from_node_id)]
-            elif f"node_{from_node_id}" in node_id_to_node:
-                from_node = node_id_to_node[f"node_{from_node_id}"]
-
-            if to_node_id in node_id_to_node:
-                to_node = node_id_to_node[to_node_id]
-            elif str(to_node_id) in node_id_to_node:
-                to_node = node_id_to_node[str(to_node_id)]
-            elif f"node_{to_node_id}" in node_id_to_node:
-                to_node = node_id_to_node[f"node_{to_node_id}"]
-
-            if from_node and to_node:
-                from_name = from_node.name
-                to_name = to_node.name
-
-                # Check if both instances exist in our data
-                if (
-                    from_name in instance_name_to_data
-                    and to_name in instance_name_to_data
-                ):
-                    valid_edges.append(edge)
+        name_is_instance = np.fromiter(
+            (name in instance_name_to_data for name in instance_graph.names.tolist()),
+            dtype=bool,
+            count=len(instance_graph.names),
+        )
+        node_is_instance = name_is_instance[instance_graph.node_name_ids]
+        valid_edges = np.flatnonzero(
+            node_is_instance[instance_graph.edge_src]
+            & node_is_instance[instance_graph.edge_dst]
+        ).tolist()
 
         self.workspace.logger.info(
             "found {} valid edges connecting instances".format(len(valid_edges))
@@ -190,54 +158,29 @@ class GuiLayout:
             selected_edges = valid_edges
 
         # Draw edges with better visibility
+        node_names = instance_graph.node_names
         for edge in selected_edges:
-            from_node_id = edge.from_node
-            to_node_id = edge.to_node
-
-            # Get node data - handle both string and integer node IDs
-            from_node = None
-            to_node = None
-
-            # Try to find by node ID (could be string or integer)
-            if from_node_id in node_id_to_node:
-                from_node = node_id_to_node[from_node_id]
-            elif str(from_node_id) in node_id_to_node:
-                from_node = node_id_to_node[str(from_node_id)]
-            elif f"node_{from_node_id}" in node_id_to_node:
-                from_node = node_id_to_node[f"node_{from_node_id}"]
-
-            if to_node_id in node_id_to_node:
-                to_node = node_id_to_node[to_node_id]
-            elif str(to_node_id) in node_id_to_node:
-                to_node = node_id_to_node[str(to_node_id)]
-            elif f"node_{to_node_id}" in node_id_to_node:
-                to_node = node_id_to_node[f"node_{to_node_id}"]
-
-            if from_node and to_node:
-                from_name = from_node.name
-                to_name = to_node.name
-
-                # Get instance data
-                from_instance = instance_name_to_data.get(from_name)
-                to_instance = instance_name_to_data.get(to_name)
-
-                if from_instance and to_instance:
-                    # Draw connection line with better visibility
-                    ax.plot(
-                        [
-                            from_instance.cx + from_instance.width / 2,
-                            to_instance.cx + to_instance.width / 2,
-                        ],
-                        [
-                            from_instance.cy + from_instance.height / 2,
-                            to_instance.cy + to_instance.height / 2,
-                        ],
-                        "-",
-                        linewidth=0.5,
-                        alpha=0.4,
-                        color="blue",
-                    )
-                    edges_drawn += 1
+            from_instance = instance_name_to_data[
+                node_names[instance_graph.edge_src[edge]]
+            ]
+            to_instance = instance_name_to_data[node_names[instance_graph.edge_dst[edge]]]
+
+            # Draw connection line with better visibility
+            ax.plot(
+                [
+                    from_instance.cx + from_instance.width / 2,
+                    to_instance.cx + to_instance.width / 2,
+                ],
+                [
+                    from_instance.cy + from_instance.height / 2,
+                    to_instance.cy + to_instance.height / 2,
+                ],
+                "-",
+                linewidth=0.5,
+                alpha=0.4,
+                color="blue",
+            )
+            edges_drawn += 1
 
         self.workspace.logger.info(f"draw {edges_drawn} connection lines")
 
@@ -288,8 +231,8 @@ class GuiLayout:
         info_text = (
             f"Instance Count: {len(vec_instances.instances)}\n"
             f"Cell Types: {len(used_cell_ids)}\n"
-            f"Total Nodes: {len(nodes)}\n"
-            f"Total Edges: {len(edges)}\n"
+            f"Total Nodes: {instance_graph.node_num}\n"
+            f"Total Edges: {instance_graph.edge_num}\n"
             f"Valid Edges: {len(valid_edges)}\n"
             f"Displayed Edges: {edges_drawn}\n"
             f"Layout Range: {max_x - min_x:.0f} x {max_y - min_y:.0f}"
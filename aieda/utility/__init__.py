@@ -1,10 +1,20 @@
 from .folder_permission import FolderPermissionManager
-from .json_parser import JsonParser
+from .json_parser import (
+    JsonParser,
+    set_json_backend,
+    get_json_backend,
+    open_json_file,
+    convert_json_file,
+)
 from .log import Logger, create_logger
 
 __all__ = [
     'FolderPermissionManager',
     'JsonParser',
+    'set_json_backend',
+    'get_json_backend',
+    'open_json_file',
+    'convert_json_file',
     'Logger',
     'create_logger',
 ]
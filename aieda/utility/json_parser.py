@@ -8,9 +8,235 @@
 
 import json
 import gzip
+import importlib
 import os
 from .log import Logger
 
+# text size read per step when streaming json arrays
+STREAM_CHUNK_SIZE = 1 << 20
+
+# compression codecs of json files, selected by the file suffix
+JSON_CODECS = {"gz": "gzip", "zst": "zstandard", "lz4": "lz4.frame"}
+
+# indent of JsonParser.write, plain json files are indented by 4 and compressed json
+# files are written compact by default
+_DEFAULT_INDENT = object()
+
+# zstd level and compression threads, -1 uses all cores
+ZSTD_LEVEL = 3
+ZSTD_THREADS = -1
+
+
+def json_codec(json_path: str):
+    """return codec of json file, "" for plain json."""
+    codec = json_path.rsplit(".", 1)[-1]
+    return codec if codec in JSON_CODECS else ""
+
+
+def is_json_file(json_path: str):
+    """plain or compressed json file, e.g. net_1.json, net_1.json.zst"""
+    codec = json_codec(json_path)
+    if codec:
+        json_path = json_path[: -len(codec) - 1]
+    return json_path.endswith(".json")
+
+
+def json_codec_path(json_path: str, codec: str):
+    """path of json file compressed by codec, "" for plain json."""
+    if json_codec(json_path):
+        json_path = json_path.rsplit(".", 1)[0]
+    return "{}.{}".format(json_path, codec) if codec else json_path
+
+
+def _import_codec(codec: str):
+    try:
+        return importlib.import_module(JSON_CODECS[codec])
+    except ImportError:
+        raise ImportError(
+            "{} is required for .{} json files, please install it".format(
+                JSON_CODECS[codec].split(".")[0], codec
+            )
+        )
+
+
+def open_json_file(json_path: str, mode: str = "rb"):
+    """open plain or compressed json file, mode is one of rb, wb, rt, wt.
+    the codec is selected by the file suffix, .zst files are compressed by threads."""
+    encoding = None if "b" in mode else "utf-8"
+    codec = json_codec(json_path)
+
+    if codec == "gz":
+        return gzip.open(json_path, mode, encoding=encoding)
+
+    if codec == "zst":
+        zstd = _import_codec(codec)
+        cctx = None
+        if "w" in mode:
+            cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=ZSTD_THREADS)
+        return zstd.open(json_path, mode, cctx=cctx, encoding=encoding)
+
+    if codec == "lz4":
+        return _import_codec(codec).open(json_path, mode, encoding=encoding)
+
+    return open(json_path, mode.replace("t", ""), encoding=encoding)
+
+
+def convert_json_file(json_path: str, codec: str, remove_source: bool = False):
+    """convert json file to codec, "" for plain json, return the new path.
+    data is copied by blocks without decoding json."""
+    target_path = json_codec_path(json_path, codec)
+    if target_path == json_path:
+        return json_path
+
+    # write to a temporary file with the codec suffix, the target is complete once
+    # it exists
+    tmp_path = json_codec_path("{}.{}.tmp".format(target_path, os.getpid()), codec)
+    with open_json_file(json_path, "rb") as reader:
+        with open_json_file(tmp_path, "wb") as writer:
+            for block in iter(lambda: reader.read(STREAM_CHUNK_SIZE), b""):
+                writer.write(block)
+    os.replace(tmp_path, target_path)
+
+    if remove_source:
+        os.remove(json_path)
+    return target_path
+
+
+def _import_backend(name: str):
+    """return loads function of json backend, None if it is not installed.
+    all the loads functions accept bytes."""
+    try:
+        if name == "orjson":
+            import orjson
+
+            return orjson.loads
+        if name == "simdjson":
+            import simdjson
+
+            return simdjson.loads
+        if name == "ujson":
+            import ujson
+
+            return ujson.loads
+    except ImportError:
+        return None
+
+    if name == "json":
+        return json.loads
+
+    return None
+
+
+# json backends in order of preference, the first installed one is used
+JSON_BACKENDS = ["orjson", "simdjson", "ujson", "json"]
+
+json_backend = {"name": "json", "loads": json.loads}
+
+
+def set_json_backend(backend=None):
+    """backend : backend name in JSON_BACKENDS, a loads(bytes) function,
+    or None to select the fastest installed backend.
+    return the name of selected backend."""
+    if callable(backend):
+        json_backend["name"] = "custom"
+        json_backend["loads"] = backend
+        return json_backend["name"]
+
+    names = JSON_BACKENDS if backend is None else [backend]
+    for name in names:
+        loads = _import_backend(name)
+        if loads is not None:
+            json_backend["name"] = name
+            json_backend["loads"] = loads
+            return name
+
+    raise ValueError("json backend {} is not installed".format(backend))
+
+
+def get_json_backend():
+    return json_backend["name"]
+
+
+def json_loads(data):
+    """decode json str or bytes by the selected backend, fall back to stdlib json for
+    documents the backend rejects, e.g. NaN for orjson.
+
+    orjson decodes integers of the signed and unsigned 64 bit range exactly, which
+    covers the integers written by iEDA, larger integers are decoded as float. select
+    the json or ujson backend for documents with integers beyond 64 bits."""
+    try:
+        return json_backend["loads"](data)
+    except ValueError:
+        if json_backend["loads"] is json.loads:
+            raise
+        return json.loads(data)
+
+
+set_json_backend(os.environ.get("AIEDA_JSON_BACKEND"))
+
+
+def iter_json_array(text_reader, chunk_size: int = STREAM_CHUNK_SIZE):
+    """yield the elements of a top-level json array from a text stream one by one,
+    only the current element and one chunk of text are kept in memory.
+    yield the document itself if it is not an array."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill(size):
+        nonlocal buffer, pos, eof
+        data = text_reader.read(size)
+        if not data:
+            eof = True
+        buffer = buffer[pos:] + data
+        pos = 0
+
+    def skip(chars):
+        # skip chars, return the next char, "" if stream ends
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return buffer[pos] if pos < len(buffer) else ""
+            fill(chunk_size)
+
+    whitespace = " \t\n\r"
+    if skip(whitespace + "\ufeff") != "[":
+        # not an array, decode the whole document
+        yield json.loads(buffer[pos:] + text_reader.read())
+        return
+    pos += 1
+
+    read_size = chunk_size
+    while True:
+        char = skip(whitespace + ",")
+        if char == "]":
+            return
+        if char == "":
+            raise json.JSONDecodeError("unterminated array", buffer, pos)
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # element is incomplete, read more text, grow the step for big elements
+            fill(read_size)
+            read_size *= 2
+            continue
+
+        # numbers may be cut by the chunk boundary, e.g. "1" of "1.5", accept the
+        # element only if it is followed by a delimiter
+        if not eof and (end == len(buffer) or buffer[end] not in whitespace + ",]"):
+            fill(read_size)
+            continue
+
+        yield item
+        pos = end
+        read_size = chunk_size
+
 
 class JsonParser:
     """basic json parser"""
@@ -47,24 +273,50 @@ class JsonParser:
             return False
 
         try:
-            # compressed
-            if self.json_path.endswith(".gz"):
-                with gzip.open(self.json_path, "r") as f:
-                    unzip_data = f.read().decode("utf-8")
-                    self.json_data = json.loads(unzip_data)
+            # read bytes and decode them by the json backend directly
+            with open_json_file(self.json_path, "rb") as f:
+                data = f.read()
+
+            if is_db:
+                self.json_data = json_loads(json_loads(data))
             else:
-                with open(self.json_path, "r", encoding="utf-8") as f_reader:
-                    if is_db:
-                        str_json = json.load(f_reader)
-                        self.json_data = json.loads(str_json)
-                    else:
-                        self.json_data = json.load(f_reader)
+                self.json_data = json_loads(data)
 
             return True
-        except json.JSONDecodeError:
+        except ValueError:
+            # items before the error are yielded, raise so the truncation is visible
             self.logger.error("json file format error. path = %s", self.json_path)
+            raise
             return False
 
+    def iter_items(self, stream: bool = None):
+        """yield the elements of top-level json array one by one, or the document itself
+        if it is not an array.
+        stream : decode the file incrementally in bounded memory, default for compressed
+        files, otherwise the file is decoded at once by the json backend, which is faster.
+        """
+        if stream is None:
+            stream = json_codec(self.json_path) != ""
+
+        if not stream:
+            if self.read() is True:
+                items = self.json_data if isinstance(self.json_data, list) else [self.json_data]
+                self.json_data = None
+                yield from items
+            return
+
+        if not os.path.exists(self.json_path):
+            self.logger.error("json file not exist. path = %s", self.json_path)
+            return
+
+        try:
+            with open_json_file(self.json_path, "rt") as text_reader:
+                yield from iter_json_array(text_reader)
+        except ValueError:
+            # items before the error are yielded, raise so the truncation is visible
+            self.logger.error("json file format error. path = %s", self.json_path)
+            raise
+
     def read_create(self):
         if not os.path.exists(self.json_path):
             # create file
@@ -80,9 +332,16 @@ class JsonParser:
 
         return self.read()
 
-    def write(self, dict_value=None, indent=4, is_db=False):
+    def write(self, dict_value=None, indent=_DEFAULT_INDENT, is_db=False):
+        """indent : default is 4 for plain json, compressed json files are machine
+        files written without indent, None writes compact json."""
         from dataclasses import asdict
 
+        codec = json_codec(self.json_path)
+        if indent is _DEFAULT_INDENT:
+            indent = None if codec else 4
+        separators = (",", ":") if indent is None else None
+
         if dict_value != None:
             # overwrite
             if is_db:
@@ -91,13 +350,17 @@ class JsonParser:
                 self.json_data = dict_value
 
         """ Json writer """
-        if self.json_path.endswith(".gz"):
-            with gzip.open(self.json_path, "wb") as f:
-                zip_data = json.dumps(self.json_data, indent=indent)
-                f.write(zip_data.encode("utf-8"))
+        if codec:
+            # encode by chunks, the whole json text is never built in memory
+            encoder = json.JSONEncoder(indent=indent, separators=separators)
+            with open_json_file(self.json_path, "wt") as f:
+                for chunk in encoder.iterencode(self.json_data):
+                    f.write(chunk)
         else:
             with open(self.json_path, "w", encoding="utf-8") as f_writer:
-                json.dump(self.json_data, f_writer, indent=indent)
+                json.dump(
+                    self.json_data, f_writer, indent=indent, separators=separators
+                )
 
         return True
 
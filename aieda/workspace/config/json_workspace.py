@@ -20,6 +20,9 @@ class ConfigWorkspace(object):
     project: str = ""
     design: str = ""
     task: str = ""
+    # codec of vectors json files converted by python and of the nets index, "" for
+    # plain json, "gz", "zst" or "lz4"
+    vectors_codec: str = ""
 
 
 class WorkspaceParser(JsonParser):
@@ -37,6 +40,7 @@ class WorkspaceParser(JsonParser):
             workspace_json["project"] = workspace_config.project
             workspace_json["design"] = workspace_config.design
             workspace_json["task"] = workspace_config.task
+            workspace_json["vectors_codec"] = workspace_config.vectors_codec
 
             self.json_data["workspace"] = workspace_json
         return self.write()
@@ -51,6 +55,7 @@ class WorkspaceParser(JsonParser):
             db_workspcae.version = node_workspace["version"]
             db_workspcae.project = node_workspace["project"]
             db_workspcae.design = node_workspace["design"]
+            db_workspcae.vectors_codec = node_workspace.get("vectors_codec", "")
 
         return db_workspcae
 
@@ -98,3 +103,12 @@ class WorkspaceParser(JsonParser):
             return self.write()
 
         return False
+
+    def set_vectors_codec(self, vectors_codec: str):
+        if self.read():
+            self.json_data["workspace"]["vectors_codec"] = vectors_codec
+
+            # save file
+            return self.write()
+
+        return False
@@ -468,6 +468,26 @@ class Workspace:
         parser = WorkspaceParser(self.paths_table.workspace, self.logger)
         parser.set_task(task)
 
+    def set_vectors_codec(self, vectors_codec: str):
+        """codec of the vectors nets, patchs and wire_paths json files converted by
+        DataVectors.convert_json_codec and of the nets index, "" for plain json, "gz",
+        "zst" or "lz4", zst and lz4 need zstandard and lz4 packages. other json files,
+        e.g. the manifest, corpus and packed metadata, are plain json."""
+        # update data
+        self.configs.workspace.vectors_codec = vectors_codec
+
+        # udpate vectors_codec in workspace.json
+        from .config import WorkspaceParser
+
+        parser = WorkspaceParser(self.paths_table.workspace, self.logger)
+        parser.set_vectors_codec(vectors_codec)
+
+    @property
+    def vectors_codec(self):
+        if self.configs is None:
+            return ""
+        return self.configs.workspace.vectors_codec
+
     def set_first_routing_layer(self, layer: str):
         from .config import ConfigIEDADbParser
 
@@ -869,6 +889,7 @@ class Workspace:
                 "rt_sta": "{}/output/iEDA/data/rt/sta".format(self.directory),
                 "rpt": "{}/output/iEDA/rpt".format(self.directory),
                 "feature": "{}/output/iEDA/feature".format(self.directory),
+                "feature_cache": "{}/output/iEDA/feature/cache".format(self.directory),
                 "vectors": "{}/output/iEDA/vectors".format(self.directory),
                 "pl_vectors": "{}/output/iEDA/vectors/place".format(self.directory),
                 "rt_vectors": "{}/output/iEDA/vectors/route".format(self.directory),
@@ -1012,6 +1033,18 @@ class Workspace:
                 "timing_wire_graph": "{}/wire_graph/timing_wire_graph.json".format(
                     self.ieda_output["vectors"]
                 ),
+                "nets_columnar": "{}/columnar/nets".format(self.ieda_output["vectors"]),
+                "wire_paths_packed": "{}/columnar/wire_paths".format(
+                    self.ieda_output["vectors"]
+                ),
+                "cache": "{}/cache".format(self.ieda_output["vectors"]),
+                "manifest": "{}/manifest.json".format(self.ieda_output["vectors"]),
+                "nets_index": "{}/index/nets_index.json".format(
+                    self.ieda_output["vectors"]
+                ),
+                "spatial_index": "{}/index/spatial_index.npz".format(
+                    self.ieda_output["vectors"]
+                ),
             }
 
             return vectors_paths
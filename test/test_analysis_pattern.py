@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : test_analysis_pattern.py
+@Author : yhqiu
+@Desc : test the deprecated pattern argument of analyzer load
+"""
+######################################################################################
+# # import aieda
+# from import_aieda import import_aieda
+# import_aieda()
+######################################################################################
+
+import warnings
+
+from aieda.analysis import MapAnalyzer, WireDistributionAnalyzer
+
+
+def _deprecation_warnings(load, **kwargs):
+    with warnings.catch_warnings(record=True) as records:
+        warnings.simplefilter("always")
+        try:
+            load(workspaces=[], dir_to_display_name={}, **kwargs)
+        except ValueError:
+            # no workspace to load
+            pass
+    return [
+        record for record in records if issubclass(record.category, DeprecationWarning)
+    ]
+
+
+def test_pattern_deprecated():
+    for analyzer in [WireDistributionAnalyzer(), MapAnalyzer()]:
+        records = _deprecation_warnings(
+            analyzer.load, pattern="/output/iEDA/vectors/nets"
+        )
+        assert len(records) == 1
+        assert "pattern is deprecated" in str(records[0].message)
+        # the warning points to the caller of load
+        assert records[0].filename == __file__
+
+        assert _deprecation_warnings(analyzer.load) == []
+
+
+if __name__ == "__main__":
+    test_pattern_deprecated()
+
+    print("pattern deprecation tests passed")
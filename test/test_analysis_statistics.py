@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : test_analysis_statistics.py
+@Author : yhqiu
+@Desc : test mergeable statistics of streaming analysis against numpy and pandas
+"""
+######################################################################################
+# # import aieda
+# from import_aieda import import_aieda
+# import_aieda()
+######################################################################################
+
+import numpy as np
+import pandas as pd
+
+from aieda.analysis.statistics import FixedHistogram, QuantileSketch, StreamingMoments
+
+QUANTILES = [0.0, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+
+def test_streaming_moments_merge():
+    rng = np.random.default_rng(0)
+    columns = ["a", "b", "c"]
+    rows = rng.normal(size=(3000, 3)) @ rng.normal(size=(3, 3)) + [1.0, -2.0, 5.0]
+    # rows with nan are skipped
+    rows[::97, 1] = np.nan
+
+    # two workers accumulate batches of different sizes, then merge
+    left = StreamingMoments(columns)
+    for batch in np.array_split(rows[:1234], 5):
+        left.update(batch)
+    right = StreamingMoments(columns).update(rows[1234:])
+    merged = StreamingMoments.merge_all([left, right])
+
+    df = pd.DataFrame(rows, columns=columns).dropna()
+    assert merged.count == len(df)
+    assert np.allclose(merged.mean, df.mean().values)
+    assert np.allclose(merged.var, df.var().values)
+    assert np.allclose(merged.cov().values, df.cov().values)
+    assert np.allclose(merged.corr().values, df.corr().values)
+    assert np.allclose(merged.min, df.min().values)
+    assert np.allclose(merged.max, df.max().values)
+
+
+def test_quantile_sketch():
+    rng = np.random.default_rng(1)
+
+    # exact before the first compaction
+    values = rng.normal(size=100)
+    sketch = QuantileSketch().update(values)
+    assert np.allclose(sketch.quantiles(QUANTILES), np.quantile(values, QUANTILES))
+
+    # merged sketches of a long stream, rank error is bounded
+    values = rng.lognormal(size=200000)
+    sketches = [
+        QuantileSketch(seed=seed).update(part)
+        for seed, part in enumerate(np.array_split(values, 4))
+    ]
+    merged = QuantileSketch.merge_all(sketches)
+    assert merged.count == len(values)
+    assert np.isclose(merged.mean, values.mean())
+    assert np.isclose(merged.std, values.std(ddof=1))
+    assert merged.min == values.min() and merged.max == values.max()
+
+    sorted_values = np.sort(values)
+    for q in QUANTILES[1:-1]:
+        rank = np.searchsorted(sorted_values, merged.quantile(q)) / len(values)
+        assert abs(rank - q) < 0.02, (q, rank)
+
+
+def test_fixed_histogram():
+    rng = np.random.default_rng(2)
+    for size in [1, 2, 7, 100, 1001]:
+        values = rng.integers(3, 40, size=size).astype(float)
+
+        parts = np.array_split(values, 3)
+        histogram = FixedHistogram.merge_all(
+            [FixedHistogram(width=1.0).update(part) for part in parts]
+        )
+        assert histogram.count == size
+        for q in QUANTILES:
+            assert np.isclose(histogram.quantile(q), np.quantile(values, q))
+
+        summary = histogram.summary()
+        assert summary["median"] == np.median(values)
+        assert np.isclose(summary["mean"], values.mean())
+        assert summary["min"] == values.min() and summary["max"] == values.max()
+
+
+if __name__ == "__main__":
+    test_streaming_moments_merge()
+    test_quantile_sketch()
+    test_fixed_histogram()
+
+    print("statistics tests passed")
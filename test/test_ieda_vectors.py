@@ -17,7 +17,7 @@ os.environ["iEDA"] = "ON"
 
 from aieda.workspace import workspace_create, Workspace
 from aieda.flows import DbFlow, DataGeneration
-from aieda.data import DataVectors
+from aieda.data import DataVectors, DataCorpus
 
 
 def test_vectors_generation(
@@ -58,20 +58,43 @@ def test_vectors_load(workspace):
 
     nets = data_load.load_nets()
 
+    nets_columnar = data_load.load_nets_columnar()
+    nets_view = list(nets_columnar.iter_nets())
+
     patchs = data_load.load_patchs()
 
+    patch_grid = data_load.load_patch_grid()
+
     instance_graph = data_load.load_instance_graph()
 
+    instance_graph_arrays = data_load.load_instance_graph_arrays()
+
     timing_graph = data_load.load_timing_graph()
 
     timing_wire_paths = data_load.load_timing_wire_paths()
     
     wire_paths_data = data_load.load_wire_paths_data()
+
+    wire_paths = data_load.load_wire_paths()
+
+    wire_paths_packed = data_load.load_wire_paths_packed()
+
+    manifest = data_load.load_manifest()
+
+    name_table = data_load.name_table
     
 
     print(1)
 
 
+def test_vectors_corpus(workspaces: list, corpus_dir: str):
+    corpus = DataCorpus(corpus_dir)
+    corpus.build(workspaces)
+
+    rows = corpus.select("nets", [workspaces[0].design])
+    wire_len = corpus.column("nets", "wire_len", rows)
+
+
 if __name__ == "__main__":
     current_dir = os.path.split(os.path.abspath(__file__))[0]
     root = current_dir.rsplit("/", 1)[0]
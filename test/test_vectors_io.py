@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+"""
+@File : test_vectors_io.py
+@Author : yell
+@Desc : test vectors json streaming, indexes and corpus on synthetic data
+"""
+######################################################################################
+# # import aieda
+# from import_aieda import import_aieda
+# import_aieda()
+######################################################################################
+
+import io
+import json
+import tempfile
+
+import numpy as np
+
+from aieda.utility.json_parser import iter_json_array
+from aieda.data.io import (
+    VectorsColumnar,
+    VectorsCorpus,
+    VectorsNetIndex,
+    VectorsSpatialIndex,
+)
+from aieda.data.database import VectorNetView
+
+
+def _synthetic_nets(start: int, num: int):
+    return [
+        {
+            "id": start + index,
+            # non-ascii names and json delimiters in strings
+            "name": "n{}{}".format("ét,[" if index % 3 == 0 else "_", start + index),
+            "pins": [{"id": pin, "i": "u{}".format(pin)} for pin in range(index % 4)],
+            "feature": {"wire_len": index * 10, "R": index / 3.0},
+        }
+        for index in range(num)
+    ]
+
+
+def test_iter_json_array():
+    nets = _synthetic_nets(0, 50)
+    text = json.dumps(nets, indent=2, ensure_ascii=False)
+
+    # small chunks split items, strings and escapes across reads
+    for chunk_size in [1, 7, 64, 1 << 16]:
+        items = list(iter_json_array(io.StringIO(text), chunk_size=chunk_size))
+        assert items == nets
+
+    assert list(iter_json_array(io.StringIO("[]"))) == []
+    assert list(iter_json_array(io.StringIO(' [ 1 , "a]" ,{"b": [2]} ] '))) == [
+        1,
+        "a]",
+        {"b": [2]},
+    ]
+    # a document which is not an array is yielded itself
+    assert list(iter_json_array(io.StringIO('{"a": [1, 2]}'))) == [{"a": [1, 2]}]
+
+
+def test_spatial_index_query():
+    rng = np.random.default_rng(0)
+    lower = rng.uniform(0, 1000, size=(2000, 2))
+    boxes = np.hstack([lower, lower + rng.uniform(0, 30, size=(2000, 2))])
+    # die-spanning boxes are kept in the overflow list
+    boxes[:20] = [0, 0, 1030, 1030]
+    # flipped boxes are normalized
+    boxes[20:40] = boxes[20:40][:, [2, 3, 0, 1]]
+    ids = np.arange(len(boxes)) * 2 + 1
+
+    index = VectorsSpatialIndex("").build(
+        {"net": (ids[:1500], boxes[:1500]), "patch": (ids[1500:], boxes[1500:])}
+    )
+    assert len(index.overflow_items) == 20
+
+    normalized = np.hstack(
+        [np.minimum(boxes[:, :2], boxes[:, 2:]), np.maximum(boxes[:, :2], boxes[:, 2:])]
+    )
+    for _ in range(100):
+        llx, lly = rng.uniform(-100, 1100, size=2)
+        urx, ury = np.array([llx, lly]) + rng.uniform(0, 300, size=2)
+        result = index.query(llx, lly, urx, ury)
+
+        hit = (
+            (normalized[:, 0] <= urx)
+            & (normalized[:, 2] >= llx)
+            & (normalized[:, 1] <= ury)
+            & (normalized[:, 3] >= lly)
+        )
+        assert result["net"] == ids[:1500][hit[:1500]].tolist()
+        assert result["patch"] == ids[1500:][hit[1500:]].tolist()
+        assert result["instance"] == [] and result["drc"] == []
+
+
+def test_net_index_offsets():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        json_files = []
+        nets = []
+        for file_index in range(3):
+            file_nets = _synthetic_nets(file_index * 100, 20)
+            filepath = "{}/net_{}.json".format(temp_dir, file_index)
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(file_nets, f, indent=1, ensure_ascii=False)
+            json_files.append(filepath)
+            nets.extend(file_nets)
+
+        index_path = "{}/index/nets_index.json".format(temp_dir)
+        VectorsNetIndex(index_path).build(json_files).write()
+
+        index = VectorsNetIndex(index_path)
+        assert index.read() and index.is_valid(json_files)
+
+        for net in nets:
+            for key in [net["id"], net["name"]]:
+                filepath, offset, length = index.find(key)
+                with open(filepath, "rb") as f:
+                    f.seek(offset)
+                    assert json.loads(f.read(length)) == net
+        assert index.find(-1) is None
+
+        # the index is invalid once a nets file changes
+        with open(json_files[1], "a") as f:
+            f.write("\n")
+        assert not index.is_valid(json_files)
+
+
+def test_columnar_round_trip():
+    nets = _synthetic_nets(0, 10)
+    for index, net in enumerate(nets):
+        net["feature"]["place_feature"] = {
+            "pin_num": index,
+            "aspect_ratio": 0.5 + index,
+            "width": 1.25 * index,
+            "height": 2.75,
+            "area": 0.125 * index,
+            "l_ness": 0.3,
+            "rsmt": 10.5 + index,
+            "hpwl": None if index == 3 else 9.5,
+        }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filepath = "{}/net_0.json".format(temp_dir)
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(nets, f, ensure_ascii=False)
+
+        columnar_dir = "{}/columnar".format(temp_dir)
+        columnar = VectorsColumnar(columnar_dir)
+        columnar.write(columnar.build_nets([filepath]), [filepath])
+        assert columnar.is_valid([filepath])
+
+        columnar = columnar.read()
+        for row, net in enumerate(nets):
+            view = VectorNetView(columnar, row)
+            assert view.id == net["id"] and view.name == net["name"]
+            assert view.feature.wire_len == net["feature"]["wire_len"]
+            assert np.isclose(view.feature.R, net["feature"]["R"])
+
+            place_feature = view.feature.place_feature
+            for name, value in net["feature"]["place_feature"].items():
+                assert getattr(place_feature, name) == value, (name, value)
+
+
+def test_corpus_rows():
+    rng = np.random.default_rng(1)
+    designs = {}
+    for name, row_num in [("a", 7), ("b", 0), ("c", 11)]:
+        lengths = rng.integers(0, 4, size=row_num)
+        designs[name] = {
+            "wire_len": rng.integers(0, 1000, size=row_num),
+            "R": rng.normal(size=row_num),
+            "layer_ratio": rng.normal(size=int(lengths.sum())),
+            "layer_ratio_offset": np.concatenate([[0], np.cumsum(lengths)]),
+        }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        corpus_dir = "{}/corpus".format(temp_dir)
+        corpus = VectorsCorpus(corpus_dir, shard_rows=3)
+        corpus.create()
+        for name, design in designs.items():
+            columns = {"wire_len": design["wire_len"], "R": design["R"]}
+            ragged = {"layer_ratio": (design["layer_ratio"], design["layer_ratio_offset"])}
+            corpus.add_design(name, temp_dir, {"nets": (columns, ragged)})
+        corpus.write()
+
+        corpus = VectorsCorpus(corpus_dir)
+        assert corpus.read()
+
+        wire_len = np.concatenate([design["wire_len"] for design in designs.values()])
+        ratios = [
+            design["layer_ratio"][offset[row] : offset[row + 1]]
+            for design in designs.values()
+            for offset in [design["layer_ratio_offset"]]
+            for row in range(len(offset) - 1)
+        ]
+        names = [name for name, design in designs.items() for _ in design["wire_len"]]
+
+        assert corpus.table_rows("nets") == len(wire_len)
+        assert np.array_equal(corpus.column("nets", "wire_len"), wire_len)
+
+        # random gathering keeps the order of rows
+        rows = rng.permutation(len(wire_len))[:12]
+        assert np.array_equal(corpus.column("nets", "wire_len", rows), wire_len[rows])
+        for row in rows:
+            assert np.array_equal(corpus.ragged("nets", "layer_ratio", row), ratios[row])
+        assert [
+            corpus.designs[index]["name"] for index in corpus.design_of("nets", rows)
+        ] == [names[row] for row in rows]
+
+        selected = corpus.select("nets", ["c", "a"])
+        assert np.array_equal(
+            corpus.column("nets", "R", selected),
+            np.concatenate([designs["c"]["R"], designs["a"]["R"]]),
+        )
+        assert len(corpus.select("nets", ["b"])) == 0
+
+
+if __name__ == "__main__":
+    test_iter_json_array()
+    test_spatial_index_query()
+    test_net_index_offsets()
+    test_columnar_round_trip()
+    test_corpus_rows()
+
+    print("vectors io tests passed")